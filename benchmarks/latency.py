@@ -0,0 +1,275 @@
+"""Latency benchmarks of playsound3 per backend and per code path.
+
+By default, players are replaced by fake stand-in binaries put on PATH, which accept the same arguments,
+read their stdin when playing from a pipe and exit after a short time. Results measure the overhead of
+playsound3 and of process management, not of real audio decoding. Use `--real` to benchmark installed players.
+
+Usage:
+    python benchmarks/latency.py [--repeat N] [--output results.json] [--baseline baseline.json] [--real]
+
+Results are printed (or saved) as JSON. With `--baseline`, the script exits with code 1 if any median
+is more than `--tolerance` times and `--min-difference` seconds slower than in the baseline results.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import http.server
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import wave
+from pathlib import Path
+from typing import Any, Callable
+
+# Benchmark the playsound3 of this checkout, also when it is not installed
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+FAKE_PLAYERS = ["gst-play-1.0", "aplay", "mpg123", "ffplay", "afplay"]
+FAKE_PLAY_SECONDS = 0.05
+
+FAKE_PLAYER_CODE = f"""#!{sys.executable}
+import sys, time
+args = sys.argv[1:]
+if any(arg in ("--version", "-version", "-h") for arg in args):
+    sys.exit(0)
+if any(arg in ("-", "fd://0", "pipe:0") for arg in args):
+    while sys.stdin.buffer.read(65536):
+        pass
+time.sleep({FAKE_PLAY_SECONDS})
+"""
+
+
+def install_fake_players(directory: Path) -> None:
+    for name in FAKE_PLAYERS:
+        path = directory / name
+        path.write_text(FAKE_PLAYER_CODE)
+        path.chmod(0o755)
+
+
+def write_silence(path: Path, seconds: float = FAKE_PLAY_SECONDS) -> None:
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(2)
+        f.setsampwidth(2)
+        f.setframerate(48000)
+        f.writeframes(b"\0" * 4 * int(48000 * seconds))
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    samples = sorted(samples)
+    return {
+        "median": statistics.median(samples),
+        "p90": samples[min(len(samples) - 1, int(len(samples) * 0.9))],
+        "min": samples[0],
+    }
+
+
+def measure(function: Callable[[], Any], repeat: int) -> dict[str, float]:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return summarize(times)
+
+
+def bench_import(repeat: int) -> dict[str, Any]:
+    """Import time and backend detection time, each in a fresh interpreter."""
+    code = (
+        "import time; t0 = time.perf_counter(); import playsound3; t1 = time.perf_counter(); "
+        "playsound3.AVAILABLE_BACKENDS; t2 = time.perf_counter(); print(t1 - t0, t2 - t1)"
+    )
+    imports, detections_cold, detections_warm = [], [], []
+    for _ in range(repeat):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            python_path = os.pathsep.join(filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")]))
+            env = dict(os.environ, PLAYSOUND3_CACHE_DIR=cache_dir, PYTHONPATH=python_path)
+            for detections in (detections_cold, detections_warm):
+                output = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True)
+                import_time, detection_time = map(float, output.stdout.split())
+                imports.append(import_time)
+                detections.append(detection_time)
+    return {
+        "import": summarize(imports),
+        "detect_backends_cold": summarize(detections_cold),
+        "detect_backends_warm": summarize(detections_warm),
+    }
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+def bench_prepare_path(sound: Path, repeat: int) -> dict[str, Any]:
+    """Resolving local paths and URLs that are already downloaded to the cache."""
+    from playsound3.playsound3 import _prepare_path
+
+    handler = functools.partial(QuietHandler, directory=str(sound.parent))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/{sound.name}"
+
+    try:
+        results = {"local": measure(lambda: _prepare_path(sound), repeat)}
+        results["url_first"] = measure(lambda: _prepare_path(url), 1)
+        results["url_cached"] = measure(lambda: _prepare_path(url), repeat)
+    finally:
+        server.shutdown()
+    return results
+
+
+def bench_backend(name: str, sound: Path, repeat: int) -> dict[str, Any]:
+    """Spawn latency, poll() and stop() costs and exit times of a single backend."""
+    from playsound3 import playsound
+    from playsound3 import playsound3 as core
+
+    backend = core._BACKEND_MAP[name]
+    if not backend.check():
+        return {"available": False}
+
+    def spawn_time() -> float:
+        start = time.perf_counter()
+        process = backend.play(str(sound))
+        spawned = time.perf_counter()
+        process.terminate()
+        process.wait()
+        return spawned - start
+
+    spawn, poll, stop, stop_to_exit, play_to_exit, playsound_call = [], [], [], [], [], []
+    spawns_popen = False
+    for _ in range(repeat):
+        start = time.perf_counter()
+        process = backend.play(str(sound))
+        spawned = time.perf_counter()
+        spawns_popen = isinstance(process, subprocess.Popen)
+        for _ in range(10):
+            process.poll()
+        polled = time.perf_counter()
+        process.terminate()
+        stopped = time.perf_counter()
+        process.wait()
+        exited = time.perf_counter()
+
+        spawn.append(spawned - start)
+        poll.append((polled - spawned) / 10)
+        stop.append(stopped - polled)
+        stop_to_exit.append(exited - stopped)
+
+        start = time.perf_counter()
+        backend.play(str(sound)).wait()
+        play_to_exit.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        playsound(sound, block=False, backend=name).wait()
+        playsound_call.append(time.perf_counter() - start)
+
+    results = {
+        "available": True,
+        "spawn": summarize(spawn),
+        "poll": summarize(poll),
+        "stop": summarize(stop),
+        "stop_to_exit": summarize(stop_to_exit),
+        "play_to_exit": summarize(play_to_exit),
+        "playsound_to_exit": summarize(playsound_call),
+    }
+
+    # Compare fast spawning with plain subprocess.Popen, alternating to expose both to the same conditions
+    if spawns_popen:
+        fast_spawn = core._FAST_SPAWN
+        spawn_fast, spawn_plain = [], []
+        try:
+            for _ in range(repeat):
+                core._FAST_SPAWN = True
+                spawn_fast.append(spawn_time())
+                core._FAST_SPAWN = False
+                spawn_plain.append(spawn_time())
+        finally:
+            core._FAST_SPAWN = fast_spawn
+        results["spawn_fast"] = summarize(spawn_fast)
+        results["spawn_plain"] = summarize(spawn_plain)
+    return results
+
+
+def find_regressions(
+    results: dict[str, Any], baseline: dict[str, Any], tolerance: float, min_difference: float, path: str = ""
+) -> list[str]:
+    """Medians slower than the baseline by more than `tolerance` times and by more than `min_difference` seconds."""
+    regressions = []
+    for key, value in results.items():
+        if not isinstance(value, dict) or not isinstance(baseline.get(key), dict):
+            continue
+        if "median" in value:
+            old, new = baseline[key]["median"], value["median"]
+            if new > old * tolerance and new - old > min_difference:
+                regressions.append(f"{path}{key}: {old:.6f}s -> {new:.6f}s")
+        else:
+            regressions.extend(find_regressions(value, baseline[key], tolerance, min_difference, f"{path}{key}."))
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="number of measurements per result")
+    parser.add_argument("--output", help="save results to this file instead of printing them")
+    parser.add_argument("--baseline", help="compare the results with results saved earlier")
+    parser.add_argument("--tolerance", type=float, default=2.0, help="allowed slowdown compared to the baseline")
+    parser.add_argument("--min-difference", type=float, default=0.001, help="ignore smaller slowdowns (seconds)")
+    parser.add_argument("--real", action="store_true", help="benchmark installed players instead of fake ones")
+    args = parser.parse_args()
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_path = Path(tmp)
+        os.environ["PLAYSOUND3_CACHE_DIR"] = str(tmp_path / "cache")
+        os.environ.setdefault("PLAYSOUND3_MIXER_SINK", "null")
+        os.environ.setdefault("PLAYSOUND3_ALSA_DEVICE", "null")
+        if not args.real:
+            if sys.platform == "win32":
+                parser.error("fake players are not supported on Windows, use --real")
+            (tmp_path / "bin").mkdir()
+            install_fake_players(tmp_path / "bin")
+            os.environ["PATH"] = str(tmp_path / "bin") + os.pathsep + os.environ["PATH"]
+
+        sound = tmp_path / "sounds" / "silence.wav"
+        sound.parent.mkdir()
+        write_silence(sound)
+
+        from playsound3.playsound3 import _BACKEND_MAP
+
+        results: dict[str, Any] = {
+            "python": platform.python_version(),
+            "platform": sys.platform,
+            "fake_players": not args.real,
+            "repeat": args.repeat,
+            "startup": bench_import(max(1, args.repeat // 4)),
+            "prepare_path": bench_prepare_path(sound, args.repeat),
+            "backends": {name: bench_backend(name, sound, args.repeat) for name in _BACKEND_MAP},
+        }
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output)
+    else:
+        print(output)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = find_regressions(results, baseline, args.tolerance, args.min_difference)
+        for regression in regressions:
+            print(f"regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
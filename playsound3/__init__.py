@@ -2,16 +2,66 @@ __license__ = "MIT"
 __version__ = "3.2.4"
 __author__ = "Szymon Mikler"
 
+from typing import Any
+
+from playsound3 import playsound3 as _playsound3
 from playsound3.playsound3 import (
-    AVAILABLE_BACKENDS,
-    DEFAULT_BACKEND,
+    calibrate,
+    live_sounds,
+    load,
+    play_many,
     playsound,
     prefer_backends,
+    prefetch,
+    stop_all,
+    wait_all,
+    wait_any,
 )
 
 __all__ = [
     "AVAILABLE_BACKENDS",
     "DEFAULT_BACKEND",
+    "PcmStream",
+    "Playlist",
+    "SoundPool",
+    "SpriteSheet",
+    "calibrate",
+    "live_sounds",
+    "load",
+    "play_many",
     "playsound",
+    "playsound_async",
     "prefer_backends",
+    "prefetch",
+    "stop_all",
+    "wait_all",
+    "wait_any",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # AVAILABLE_BACKENDS and DEFAULT_BACKEND are computed on the first access
+    if name in ("AVAILABLE_BACKENDS", "DEFAULT_BACKEND"):
+        return getattr(_playsound3, name)
+    # Playlist, pool, sprite, stream and asyncio modules are imported only when used
+    if name == "PcmStream":
+        from playsound3.stream import PcmStream
+
+        return PcmStream
+    if name == "Playlist":
+        from playsound3.playlist import Playlist
+
+        return Playlist
+    if name == "SoundPool":
+        from playsound3.pool import SoundPool
+
+        return SoundPool
+    if name == "SpriteSheet":
+        from playsound3.sprites import SpriteSheet
+
+        return SpriteSheet
+    if name == "playsound_async":
+        from playsound3.aio import playsound_async
+
+        return playsound_async
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,26 @@
+"""Command line interface, e.g. `python -m playsound3 serve` to run a playback server."""
+
+from __future__ import annotations
+
+import argparse
+import logging
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m playsound3")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="play sounds for other processes using the 'remote' backend")
+    serve_parser.add_argument("--socket", help="path of the Unix socket (default: PLAYSOUND3_SERVER or the cache dir)")
+    serve_parser.add_argument("--backend", help="backend playing the sounds (default: automatic selection)")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s:%(name)s: %(message)s")
+    if args.command == "serve":
+        from playsound3.server import serve
+
+        serve(args.socket, args.backend)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import asyncio
+import subprocess
+from pathlib import Path
+from typing import Any
+
+from playsound3 import watcher
+from playsound3.playsound3 import (
+    PopenLike,
+    SoundBackend,
+    _is_url,
+    _plays_format,
+    _prepare_path,
+    _resolve_backend,
+    _transcode_to_wav,
+)
+
+
+class AsyncSound:
+    """Sound object for asyncio programs.
+
+    Waiting for the sound does not block a thread. Subprocess players are watched by the event loop,
+    other players are reported to the event loop by the shared completion watcher.
+
+    Attributes:
+        backend: The name of the backend used to play the sound.
+        subprocess: The asyncio process or Popen-like object used to play the sound.
+    """
+
+    def __init__(self, backend: SoundBackend, process: asyncio.subprocess.Process | PopenLike) -> None:
+        self.backend: str = str(type(backend)).lower()
+        self.subprocess = process
+        self._finished: asyncio.Future[None] | None = None
+
+    def is_alive(self) -> bool:
+        """Check if the sound is still playing.
+
+        Returns:
+            True if the sound is still playing, else False.
+        """
+        if isinstance(self.subprocess, asyncio.subprocess.Process):
+            return self.subprocess.returncode is None
+        return self.subprocess.poll() is None
+
+    async def wait(self) -> None:
+        """Wait until the sound finishes playing."""
+        if isinstance(self.subprocess, asyncio.subprocess.Process):
+            await self.subprocess.wait()
+            return
+
+        if self._finished is None:
+            loop = asyncio.get_running_loop()
+            self._finished = loop.create_future()
+            watcher.watch(self.subprocess, lambda: loop.call_soon_threadsafe(_set_done, self._finished))
+        await asyncio.shield(self._finished)
+
+    def stop(self) -> None:
+        """Stop the sound."""
+        if isinstance(self.subprocess, asyncio.subprocess.Process):
+            if self.subprocess.returncode is None:
+                try:
+                    self.subprocess.terminate()
+                except ProcessLookupError:
+                    pass
+        else:
+            self.subprocess.terminate()
+
+
+def _set_done(future: asyncio.Future[None] | None) -> None:
+    if future is not None and not future.done():
+        future.set_result(None)
+
+
+async def playsound_async(
+    sound: str | Path,
+    block: bool = True,
+    backend: str | SoundBackend | None = None,
+) -> AsyncSound:
+    """Play a sound file from asyncio code using an available audio backend.
+
+    Args:
+        sound: Path or URL of the sound file (string or pathlib.Path).
+        block:
+            - `True` (default): Return after the sound finishes playing.
+            - `False`: Return immediately and play the sound in the background.
+        backend: Specific audio backend to use. Leave None for automatic selection.
+
+    Returns:
+        AsyncSound object for controlling playback.
+    """
+    loop = asyncio.get_running_loop()
+    if _is_url(sound):
+        # Downloading would block the event loop
+        path = await loop.run_in_executor(None, _prepare_path, sound)
+    else:
+        path = _prepare_path(sound)
+    backend_obj = _resolve_backend(backend)
+    if not _plays_format(backend_obj, Path(path).suffix):
+        # Transcoding would block the event loop
+        path = await loop.run_in_executor(None, _transcode_to_wav, path)
+
+    process: Any = None
+    try:
+        command = backend_obj.command(path)
+        process = await asyncio.create_subprocess_exec(*command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL)
+    except NotImplementedError:
+        # Backend plays sounds in-process, or the event loop does not support subprocesses (e.g. on Windows)
+        process = backend_obj.play(path)
+
+    async_sound = AsyncSound(backend_obj, process)
+    if block:
+        await async_sound.wait()
+    return async_sound
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import ctypes
+import itertools
+import json
+import mmap
+import struct
+import subprocess
 import time
-import uuid
-from threading import Thread
-from typing import Any
+from threading import Condition, Event, Lock, Thread, Timer
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, NamedTuple
+
+if TYPE_CHECKING:
+    import socket
 
 WAIT_TIME: float = 0.02
 
@@ -12,12 +20,45 @@ class PlaysoundException(Exception):
     pass
 
 
-class WmplayerPopen:
+class CallbackPopen:
+    """Base class for in-process Popen-like objects that notify callbacks when they finish."""
+
+    def __init__(self) -> None:
+        self._done_callbacks: list[Callable[[], Any]] = []
+        self._done_lock = Lock()
+        self._done = Event()
+
+    def add_done_callback(self, callback: Callable[[], Any]) -> None:
+        """Call `callback` when playback finishes, or immediately if it already has."""
+        with self._done_lock:
+            if not self._done.is_set():
+                self._done_callbacks.append(callback)
+                return
+        callback()
+
+    def _notify_done(self) -> None:
+        with self._done_lock:
+            if self._done.is_set():
+                return
+            self._done.set()
+            callbacks, self._done_callbacks = self._done_callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def _run_then_notify(self, target: Callable[..., Any], *args: Any) -> None:
+        try:
+            target(*args)
+        finally:
+            self._notify_done()
+
+
+class WmplayerPopen(CallbackPopen):
     """Popen-like object for Wmplayer backend."""
 
     def __init__(self, sound: str):
+        super().__init__()
         self._playing: bool = True
-        self.thread = Thread(target=self._play, args=(sound,), daemon=True)
+        self.thread = Thread(target=self._run_then_notify, args=(self._play, sound), daemon=True)
         self.thread.start()
 
     def _play(self, sound: str) -> None:
@@ -57,13 +98,14 @@ class WmplayerPopen:
         return 0
 
 
-class WinmmPopen:
+class WinmmPopen(CallbackPopen):
     """Popen-like object for Winmm backend."""
 
     def __init__(self, sound: str):
+        super().__init__()
         self._playing: bool = True
         self.alias: str | None = None
-        self.thread = Thread(target=self._play, args=(sound,), daemon=True)
+        self.thread = Thread(target=self._run_then_notify, args=(self._play, sound), daemon=True)
         self.thread.start()
 
     def _send_winmm_mci_command(self, command: str) -> str:
@@ -83,6 +125,8 @@ class WinmmPopen:
 
     def _play(self, sound: str) -> None:
         """Play a sound utilizing windll.winmm."""
+        import uuid
+
         # Select a unique alias for the sound
         self.alias = str(uuid.uuid4())
         self._send_winmm_mci_command(f'open "{sound}" type mpegvideo alias {self.alias}')
@@ -110,10 +154,11 @@ class WinmmPopen:
         return 0
 
 
-class AppkitPopen:
+class AppkitPopen(CallbackPopen):
     """Popen-like object for AppKit NSSound backend."""
 
     def __init__(self, sound: str):
+        super().__init__()
         try:
             from AppKit import NSSound  # type: ignore
             from Foundation import NSURL  # type: ignore
@@ -128,9 +173,16 @@ class AppkitPopen:
         self._nssound.play()
         self._duration = self._nssound.duration()
 
+        # NSSound is not polled, callbacks are notified when its duration passes
+        self._timer = Timer(self._duration, self._notify_done)
+        self._timer.daemon = True
+        self._timer.start()
+
     def terminate(self) -> None:
         self._nssound.stop()
         self._duration = time.time() - self._start_time
+        self._timer.cancel()
+        self._notify_done()
 
     def poll(self) -> int | None:
         """None if sound is playing, integer if not."""
@@ -139,6 +191,584 @@ class AppkitPopen:
         return None
 
     def wait(self) -> int:
-        while time.time() - self._start_time < self._duration:
-            time.sleep(WAIT_TIME)
+        self._done.wait()
+        return 0
+
+
+class PipedPopen:
+    """Popen-like object for a player process that reads the sound from its stdin."""
+
+    def __init__(self, process: subprocess.Popen[bytes], chunks: Iterable[bytes | memoryview]):
+        self.process = process
+        self._feeding: bool = True
+        self.thread = Thread(target=self._feed, args=(chunks,), daemon=True)
+        self.thread.start()
+
+    def _feed(self, chunks: Iterable[bytes | memoryview]) -> None:
+        assert self.process.stdin is not None
+        stdin = self.process.stdin
+        try:
+            for chunk in chunks:
+                if not self._feeding:
+                    break
+                if stdin is None:
+                    # Player exited early, keep consuming chunks so they can be saved
+                    continue
+                try:
+                    stdin.write(chunk)
+                    stdin.flush()  # Small chunks of a live stream should not wait in the pipe's buffer
+                except (BrokenPipeError, OSError):
+                    stdin = None
+        finally:
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+            try:
+                self.process.stdin.close()
+            except (BrokenPipeError, OSError):
+                pass
+
+    def terminate(self) -> None:
+        self._feeding = False
+        self.process.terminate()
+
+    def poll(self) -> int | None:
+        """None if sound is playing, integer if not."""
+        return self.process.poll()
+
+    def wait(self) -> int:
+        return self.process.wait()
+
+
+class RingBuffer:
+    """Bounded byte queue between a thread producing PCM data and the player consuming it.
+
+    Writers wait while the buffer is full, so a producer never gets more than `capacity` bytes ahead of the player.
+    The producer calls `end()` after the last chunk; the player calls `close()` when it stops, which discards
+    further writes.
+
+    Attributes:
+        stats: Numbers of bytes written, of writes that waited for space ("stalls"), and of reads that found
+            less data than requested before the end of the stream, i.e. the player ran dry ("underruns").
+    """
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise PlaysoundException("the capacity of a ring buffer has to be at least 1 byte")
+        self.capacity = capacity
+        self.stats = {"bytes": 0, "stalls": 0, "underruns": 0}
+        self._buffer = bytearray(capacity)
+        self._start = 0
+        self._size = 0
+        self._ended = False
+        self._closed = False
+        self._flowing = False  # Nothing counts as an underrun before the first write
+        self._cond = Condition()
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def finished(self) -> bool:
+        """True once all data was read after the end of the stream, or the buffer was closed."""
+        return self._closed or (self._ended and self._size == 0)
+
+    def write(self, data: Any, block: bool = True) -> int:
+        """Append a bytes-like object, waiting for space while the buffer is full.
+
+        Returns:
+            Number of bytes written; less than the size of the data if the buffer was closed,
+            or if it is full and `block` is False.
+        """
+        view = memoryview(data).cast("B")
+        written = 0
+        with self._cond:
+            while written < len(view) and not self._closed:
+                free = self.capacity - self._size
+                if free == 0:
+                    if not block:
+                        break
+                    self.stats["stalls"] += 1
+                    self._cond.wait_for(lambda: self._size < self.capacity or self._closed)
+                    continue
+
+                count = min(free, len(view) - written)
+                end = (self._start + self._size) % self.capacity
+                first = min(count, self.capacity - end)
+                self._buffer[end : end + first] = view[written : written + first]
+                self._buffer[: count - first] = view[written + first : written + count]
+                self._size += count
+                written += count
+                self._flowing = True
+                self._cond.notify_all()
+            self.stats["bytes"] += written
+        return written
+
+    def read(self, size: int, block: bool = True) -> bytes:
+        """Take up to `size` bytes from the buffer.
+
+        Blocking reads wait until there is any data; non-blocking reads return what there is.
+        Returns an empty bytes object at the end of the stream, or once the buffer is closed.
+        """
+        with self._cond:
+            short = self._size == 0 if block else self._size < size
+            if short and self._flowing and not self._ended and not self._closed:
+                self.stats["underruns"] += 1
+            if block:
+                self._cond.wait_for(lambda: self._size > 0 or self._ended or self._closed)
+            if self._closed:
+                return b""
+
+            count = min(size, self._size)
+            first = min(count, self.capacity - self._start)
+            data = bytes(self._buffer[self._start : self._start + first]) + bytes(self._buffer[: count - first])
+            self._start = (self._start + count) % self.capacity
+            self._size -= count
+            self._cond.notify_all()
+            return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Read the stream in chunks until it ends."""
+        while True:
+            data = self.read(64 * 1024)
+            if not data:
+                return
+            yield data
+
+    def end(self) -> None:
+        """Mark the end of the stream; the data in the buffer can still be read."""
+        with self._cond:
+            self._ended = True
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Stop the stream, waking up the waiting writers and readers."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class DaemonPopen(CallbackPopen):
+    """Popen-like object for a sound played by a resident player process or a playback server."""
+
+    def __init__(self, client: DaemonClient | ServerClient, sound_id: int):
+        super().__init__()
+        self._client = client
+        self._id = sound_id
+        self._finished = Event()
+        self.returncode: int | None = None
+
+    def _finish(self, returncode: int) -> None:
+        if self.returncode is None:
+            self.returncode = returncode
+        self._finished.set()
+        self._notify_done()
+
+    def terminate(self) -> None:
+        if self.returncode is None:
+            self._client.send({"cmd": "stop", "id": self._id})
+            self._finish(-15)
+
+    def poll(self) -> int | None:
+        """None if sound is playing, integer if not."""
+        return self.returncode
+
+    def wait(self) -> int:
+        self._finished.wait()
+        assert self.returncode is not None
+        return self.returncode
+
+
+class DaemonClient:
+    """Connection to a resident player process that is started on first use.
+
+    Commands and events are exchanged as JSON lines, see `playsound3.daemon`.
+    If the player process dies, its sounds are finished with an error and a new process is started.
+    """
+
+    def __init__(self, command: list[str]):
+        self.command = command
+        self._process: subprocess.Popen[bytes] | None = None
+        self._sounds: dict[int, DaemonPopen] = {}
+        self._ids = itertools.count(1)
+        self._lock = Lock()
+
+    def _start(self) -> subprocess.Popen[bytes]:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(self.command, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+            self._sounds = {}
+            reader = Thread(target=self._read_events, args=(self._process, self._sounds), daemon=True)
+            reader.start()
+        return self._process
+
+    def _read_events(self, process: subprocess.Popen[bytes], sounds: dict[int, DaemonPopen]) -> None:
+        assert process.stdout is not None
+        for line in process.stdout:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            with self._lock:
+                popen = sounds.pop(event["id"], None)
+            if popen is not None:
+                popen._finish(event["code"])
+
+        # The player process exited, so the remaining sounds will never finish on their own
+        process.wait()
+        with self._lock:
+            if self._process is process:
+                self._process = None
+            remaining = list(sounds.values())
+            sounds.clear()
+        for popen in remaining:
+            popen._finish(1)
+
+    def _write(self, process: subprocess.Popen[bytes], command: dict[str, Any]) -> None:
+        assert process.stdin is not None
+        process.stdin.write(json.dumps(command).encode() + b"\n")
+        process.stdin.flush()
+
+    def send(self, command: dict[str, Any]) -> None:
+        with self._lock:
+            process = self._start()
+            try:
+                self._write(process, command)
+            except (BrokenPipeError, OSError):
+                pass
+
+    def play(self, uri: str) -> DaemonPopen:
+        with self._lock:
+            popen = DaemonPopen(self, next(self._ids))
+            try:
+                process = self._start()
+                self._sounds[popen._id] = popen
+                self._write(process, {"cmd": "play", "id": popen._id, "uri": uri})
+            except OSError as e:
+                self._sounds.pop(popen._id, None)
+                raise PlaysoundException("could not send the sound to the resident player process") from e
+        return popen
+
+
+class ServerClient:
+    """Connection to a playback server started with `python -m playsound3 serve`, over a Unix socket.
+
+    Commands and events are exchanged as JSON lines, see `playsound3.server`.
+    Commands are sent in batches: while one thread is writing to the socket, commands from
+    other threads are queued and then written together. If the server disconnects, its sounds
+    are finished with an error and the next sound opens a new connection.
+    """
+
+    def __init__(self, address: str):
+        self.address = address
+        self._socket: socket.socket | None = None
+        self._sounds: dict[int, DaemonPopen] = {}
+        self._ids = itertools.count(1)
+        self._lock = Lock()
+        self._pending: list[bytes] = []
+        self._send_lock = Lock()
+
+    def _connect(self) -> socket.socket:
+        import socket
+
+        if self._socket is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                sock.connect(self.address)
+            except OSError:
+                sock.close()
+                raise
+            self._socket = sock
+            self._sounds = {}
+            reader = Thread(target=self._read_events, args=(sock, self._sounds), daemon=True)
+            reader.start()
+        return self._socket
+
+    def _read_events(self, sock: socket.socket, sounds: dict[int, DaemonPopen]) -> None:
+        try:
+            with sock.makefile("rb") as lines:
+                for line in lines:
+                    try:
+                        event = json.loads(line)
+                    except ValueError:
+                        continue
+                    with self._lock:
+                        popen = sounds.pop(event["id"], None)
+                    if popen is not None:
+                        popen._finish(event["code"])
+        except OSError:
+            pass
+
+        # The server disconnected, so the remaining sounds will never finish on their own
+        with self._lock:
+            if self._socket is sock:
+                self._socket = None
+            remaining = list(sounds.values())
+            sounds.clear()
+        sock.close()
+        for popen in remaining:
+            popen._finish(1)
+
+    def _flush(self) -> None:
+        while True:
+            if not self._send_lock.acquire(blocking=False):
+                return  # The thread that is sending will also send the queued commands
+            try:
+                with self._lock:
+                    batch, self._pending = self._pending, []
+                    sock = self._socket
+                if batch and sock is not None:
+                    try:
+                        sock.sendall(b"".join(batch))
+                    except OSError:
+                        # Wakes up the reader, which finishes the sounds of this connection
+                        import socket
+
+                        sock.shutdown(socket.SHUT_RDWR)
+            finally:
+                self._send_lock.release()
+            with self._lock:
+                if not self._pending:
+                    return
+
+    def send(self, command: dict[str, Any]) -> None:
+        with self._lock:
+            if self._socket is None:
+                return  # Commands of a closed connection are meaningless to the next one
+            self._pending.append(json.dumps(command).encode() + b"\n")
+        self._flush()
+
+    def play(self, command: dict[str, Any]) -> DaemonPopen:
+        with self._lock:
+            try:
+                self._connect()
+            except OSError as e:
+                raise PlaysoundException(f"could not connect to the playback server at {self.address}") from e
+            popen = DaemonPopen(self, next(self._ids))
+            self._sounds[popen._id] = popen
+            self._pending.append(json.dumps({"cmd": "play", "id": popen._id, **command}).encode() + b"\n")
+        self._flush()
+        return popen
+
+
+class WavFormat(NamedTuple):
+    """Format and location of the audio data in a WAV file."""
+
+    audio_format: int  # 1 for integer PCM, 3 for float, 6 for A-law, 7 for mu-law
+    channels: int
+    sample_rate: int
+    bits_per_sample: int
+    data_offset: int
+    data_size: int
+
+    @property
+    def frame_size(self) -> int:
+        return self.channels * self.bits_per_sample // 8
+
+
+def read_wav_format(buffer: Any) -> WavFormat:
+    """Parse the RIFF chunks of a WAV file held in a bytes-like object, e.g. mmap."""
+    if buffer[:4] != b"RIFF" or buffer[8:12] != b"WAVE":
+        raise PlaysoundException("not a WAV file")
+
+    fmt: tuple[int, int, int, int] | None = None
+    offset = 12
+    while offset + 8 <= len(buffer):
+        chunk_id = buffer[offset : offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", buffer, offset + 4)
+        if chunk_id == b"fmt ":
+            audio_format, channels, sample_rate = struct.unpack_from("<HHI", buffer, offset + 8)
+            (bits_per_sample,) = struct.unpack_from("<H", buffer, offset + 22)
+            if audio_format == 0xFFFE and chunk_size >= 40:
+                # WAVE_FORMAT_EXTENSIBLE stores the actual format in its subformat GUID
+                (audio_format,) = struct.unpack_from("<H", buffer, offset + 32)
+            fmt = (audio_format, channels, sample_rate, bits_per_sample)
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise PlaysoundException("WAV file has no format chunk before its data")
+            # Streamed WAV files can have a placeholder data size
+            data_size = min(chunk_size, len(buffer) - offset - 8)
+            return WavFormat(*fmt, data_offset=offset + 8, data_size=data_size)
+        offset += 8 + chunk_size + (chunk_size & 1)
+    raise PlaysoundException("WAV file has no data chunk")
+
+
+def slice_wav(wav: WavFormat, start: float | None = None, end: float | None = None) -> WavFormat:
+    """Narrow the location of the audio data to the frames between `start` and `end` seconds, without copying."""
+    frames = wav.data_size // wav.frame_size
+    first = 0 if start is None else min(frames, max(0, round(start * wav.sample_rate)))
+    last = frames if end is None else min(frames, max(first, round(end * wav.sample_rate)))
+    return wav._replace(data_offset=wav.data_offset + first * wav.frame_size, data_size=(last - first) * wav.frame_size)
+
+
+def wav_header(wav: WavFormat, data_size: int | None = None) -> bytes:
+    """Create a WAV header for PCM data. Unknown size is marked as the maximum, which is used for streaming."""
+    if data_size is None:
+        data_size = 0xFFFFFFFF - 36
+    byte_rate = wav.sample_rate * wav.frame_size
+    header = struct.pack("<4sI4s", b"RIFF", 36 + data_size, b"WAVE")
+    header += struct.pack(
+        "<4sIHHIIHH",
+        b"fmt ",
+        16,
+        wav.audio_format,
+        wav.channels,
+        wav.sample_rate,
+        byte_rate,
+        wav.frame_size,
+        wav.bits_per_sample,
+    )
+    return header + struct.pack("<4sI", b"data", data_size)
+
+
+def iterate_chunks(
+    buffer: Any, start: int = 0, end: int | None = None, chunk_size: int = 64 * 1024
+) -> Iterator[memoryview]:
+    """Split a part of a bytes-like object into chunks without copying it."""
+    view = memoryview(buffer)[start:end]
+    for offset in range(0, len(view), chunk_size):
+        yield view[offset : offset + chunk_size]
+
+
+# snd_pcm_format_t values for (WAV audio format, bits per sample)
+_ALSA_FORMATS = {
+    (1, 8): 1,  # SND_PCM_FORMAT_U8
+    (1, 16): 2,  # SND_PCM_FORMAT_S16_LE
+    (1, 24): 32,  # SND_PCM_FORMAT_S24_3LE
+    (1, 32): 10,  # SND_PCM_FORMAT_S32_LE
+    (3, 32): 14,  # SND_PCM_FORMAT_FLOAT_LE
+    (3, 64): 16,  # SND_PCM_FORMAT_FLOAT64_LE
+    (6, 8): 21,  # SND_PCM_FORMAT_A_LAW
+    (7, 8): 20,  # SND_PCM_FORMAT_MU_LAW
+}
+_SND_PCM_STREAM_PLAYBACK = 0
+_SND_PCM_ACCESS_RW_INTERLEAVED = 3
+_ALSA_LATENCY_US = 100_000
+
+_libasound: Any = None
+
+
+def load_libasound() -> Any:
+    """Load and cache libasound, returns None if it is not installed."""
+    global _libasound
+
+    if _libasound is None:
+        for name in ("libasound.so.2", "libasound.so"):
+            try:
+                lib = ctypes.CDLL(name)
+                break
+            except OSError:
+                continue
+        else:
+            return None
+
+        lib.snd_pcm_open.argtypes = [ctypes.POINTER(ctypes.c_void_p), ctypes.c_char_p, ctypes.c_int, ctypes.c_int]
+        lib.snd_pcm_set_params.argtypes = [ctypes.c_void_p] + [ctypes.c_int] * 2 + [ctypes.c_uint] * 4
+        lib.snd_pcm_writei.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_ulong]
+        lib.snd_pcm_writei.restype = ctypes.c_long
+        lib.snd_pcm_recover.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
+        for function in (lib.snd_pcm_drain, lib.snd_pcm_drop, lib.snd_pcm_close):
+            function.argtypes = [ctypes.c_void_p]
+        lib.snd_strerror.argtypes = [ctypes.c_int]
+        lib.snd_strerror.restype = ctypes.c_char_p
+        _libasound = lib
+    return _libasound
+
+
+def map_file(path: str) -> mmap.mmap:
+    """Memory-map a whole file as copy-on-write, which ctypes can take the address of."""
+    with open(path, "rb") as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        except ValueError as e:
+            raise PlaysoundException(f"empty file: {path}") from e
+
+
+def _buffer_address(buffer: Any) -> tuple[int, Any]:
+    """Return the address of a bytes-like object and the object that must be kept alive while it is used."""
+    if isinstance(buffer, bytes):
+        pointer = ctypes.c_char_p(buffer)
+        return ctypes.cast(pointer, ctypes.c_void_p).value or 0, buffer
+    try:
+        return ctypes.addressof(ctypes.c_char.from_buffer(buffer)), buffer
+    except TypeError:
+        # Read-only buffers can only be accessed through a copy
+        copy = bytearray(buffer)
+        return ctypes.addressof(ctypes.c_char.from_buffer(copy)), copy
+
+
+class AlsaPcmPopen(CallbackPopen):
+    """Popen-like object for AlsaPcm backend.
+
+    Frames are written from the buffer (e.g. memory-mapped WAV file) straight to an ALSA PCM device.
+    """
+
+    def __init__(self, buffer: Any, wav: WavFormat, device: str):
+        super().__init__()
+        lib = load_libasound()
+        if lib is None:
+            raise PlaysoundException("Install 'libasound2' to use the 'alsapcm' backend.")
+        if (wav.audio_format, wav.bits_per_sample) not in _ALSA_FORMATS:
+            raise PlaysoundException(f"unsupported WAV format: {wav.audio_format}, {wav.bits_per_sample} bit")
+        self._lib = lib
+        self._address, self._buffer = _buffer_address(buffer)
+
+        self._pcm = ctypes.c_void_p()
+        self._check(lib.snd_pcm_open(ctypes.byref(self._pcm), device.encode(), _SND_PCM_STREAM_PLAYBACK, 0))
+        self._check(
+            lib.snd_pcm_set_params(
+                self._pcm,
+                _ALSA_FORMATS[wav.audio_format, wav.bits_per_sample],
+                _SND_PCM_ACCESS_RW_INTERLEAVED,
+                wav.channels,
+                wav.sample_rate,
+                1,
+                _ALSA_LATENCY_US,
+            )
+        )
+
+        self._playing: bool = True
+        self.thread = Thread(target=self._run_then_notify, args=(self._play, wav), daemon=True)
+        self.thread.start()
+
+    def _check(self, error_code: int) -> None:
+        if error_code < 0:
+            if self._pcm:
+                self._lib.snd_pcm_close(self._pcm)
+                self._pcm = ctypes.c_void_p()
+            raise PlaysoundException(f"ALSA error: {self._lib.snd_strerror(error_code).decode()}")
+
+    def _play(self, wav: WavFormat) -> None:
+        lib = self._lib
+        position = self._address + wav.data_offset
+        frames_left = wav.data_size // wav.frame_size
+        period = max(wav.sample_rate // 50, 1)  # 20 ms of frames
+
+        try:
+            while self._playing and frames_left > 0:
+                written = lib.snd_pcm_writei(self._pcm, position, min(period, frames_left))
+                if written < 0:
+                    # Recover from underruns and suspends, give up on other errors
+                    if lib.snd_pcm_recover(self._pcm, written, 1) < 0:
+                        break
+                    continue
+                position += written * wav.frame_size
+                frames_left -= written
+
+            if self._playing:
+                lib.snd_pcm_drain(self._pcm)
+            else:
+                lib.snd_pcm_drop(self._pcm)
+        finally:
+            lib.snd_pcm_close(self._pcm)
+            self._playing = False
+
+    def terminate(self) -> None:
+        self._playing = False
+
+    def poll(self) -> int | None:
+        """None if sound is playing, integer if not."""
+        return None if self._playing else 0
+
+    def wait(self) -> int:
+        self.thread.join()
         return 0
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterator
+
+
+def cache_dir() -> Path:
+    """Return the directory used for playsound3's persistent caches.
+
+    The location can be overridden with the `PLAYSOUND3_CACHE_DIR` environment variable.
+    """
+    if "PLAYSOUND3_CACHE_DIR" in os.environ:
+        return Path(os.environ["PLAYSOUND3_CACHE_DIR"])
+
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "playsound3"
+
+
+def atomic_write(path: Path, data: bytes) -> None:
+    """Write data to a file so that readers never see a partially written file."""
+    import tempfile
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def load_json(path: Path) -> Any:
+    """Load a JSON file, returning None if it is missing or corrupted."""
+    try:
+        with path.open("rb") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_json(path: Path, data: Any) -> None:
+    """Save a JSON file atomically. Failures are ignored, as caches are optional."""
+    try:
+        atomic_write(path, json.dumps(data).encode())
+    except OSError:
+        pass
+
+
+class DiskCache:
+    """Directory of cached files limited in size with least-recently-used eviction.
+
+    Every entry is identified by a key (e.g. URL) and stored under a hash of it.
+    Entries can have JSON metadata saved next to them. Access times are tracked
+    with file modification times, so the cache can be shared between processes.
+    The directory can be given as a function, e.g. to follow changes of `cache_dir()`.
+    """
+
+    def __init__(self, directory: Path | Callable[[], Path], max_bytes: int) -> None:
+        self._directory = directory
+        self.max_bytes = max_bytes
+
+    @property
+    def directory(self) -> Path:
+        return self._directory() if callable(self._directory) else self._directory
+
+    def _stem(self, key: str) -> str:
+        import hashlib
+
+        return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+    def path(self, key: str, suffix: str = "") -> Path:
+        """Location of the entry, regardless of whether it exists."""
+        return self.directory / (self._stem(key) + suffix)
+
+    def get(self, key: str, suffix: str = "") -> Path | None:
+        """Return the path of the entry if it exists and mark it as recently used."""
+        path = self.path(key, suffix)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def get_metadata(self, key: str) -> dict[str, Any]:
+        metadata = load_json(self.directory / (self._stem(key) + ".meta.json"))
+        return metadata if isinstance(metadata, dict) else {}
+
+    def set_metadata(self, key: str, metadata: dict[str, Any]) -> None:
+        save_json(self.directory / (self._stem(key) + ".meta.json"), metadata)
+
+    @contextmanager
+    def open_write(self, key: str, suffix: str = "") -> Iterator[BinaryIO]:
+        """Open a new entry for writing. It appears in the cache only if writing succeeds."""
+        import tempfile
+
+        directory = self.directory
+        path = directory / (self._stem(key) + suffix)
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                yield f
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        self.evict(keep=path)
+
+    def evict(self, keep: Path | None = None) -> None:
+        """Remove least recently used entries until the cache fits in `max_bytes`."""
+        entries: dict[str, list[tuple[os.stat_result, Path]]] = {}
+        total_size = 0
+        try:
+            files = list(os.scandir(self.directory))
+        except OSError:
+            return
+
+        for file in files:
+            if file.name.startswith(".tmp-"):
+                continue
+            try:
+                stat = file.stat()
+            except OSError:
+                continue
+            total_size += stat.st_size
+            entries.setdefault(file.name.split(".")[0], []).append((stat, Path(file.path)))
+
+        # Entry's last use is the last time its data file was touched
+        def last_used(stem: str) -> float:
+            return max(stat.st_mtime for stat, _ in entries[stem])
+
+        for stem in sorted(entries, key=last_used):
+            if total_size <= self.max_bytes:
+                break
+            if keep is not None and keep.name.split(".")[0] == stem:
+                continue
+            for stat, path in entries[stem]:
+                try:
+                    path.unlink()
+                    total_size -= stat.st_size
+                except OSError:
+                    # Files in use cannot be removed on Windows
+                    pass
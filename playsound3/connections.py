@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import http.client
+import ssl
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from typing import Any
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 10
+
+
+class PooledResponse:
+    """File-like HTTP response that returns its connection to the pool once fully read."""
+
+    def __init__(self, pool: ConnectionPool, key: tuple[str, str, int], connection: Any, response: Any):
+        self._pool = pool
+        self._key = key
+        self._connection = connection
+        self._response = response
+        self.url: str = ""
+        self.status: int = response.status
+        self.reason: str = response.reason
+        self.headers = response.headers
+
+    def read(self, size: int = -1) -> bytes:
+        return self._response.read(None if size < 0 else size)
+
+    def close(self) -> None:
+        if self._connection is None:
+            return
+        if self._response.isclosed() and not self._response.will_close:
+            self._pool.release(self._key, self._connection)
+        else:
+            self._response.close()
+            self._connection.close()
+        self._connection = None
+
+    def __enter__(self) -> PooledResponse:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class ConnectionPool:
+    """Pool of keep-alive HTTP(S) connections shared by all downloads.
+
+    Errors are raised as `urllib.error.URLError` and `urllib.error.HTTPError`, like `urllib.request.urlopen`.
+    If a proxy is configured in the environment, `urllib.request.urlopen` is used instead.
+    """
+
+    def __init__(self, timeout: float, max_idle_per_host: int = 4) -> None:
+        self.timeout = timeout
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: dict[tuple[str, str, int], list[Any]] = {}
+        self._lock = threading.Lock()
+        self._ssl_context: ssl.SSLContext | None = None
+
+    def _connect(self, key: tuple[str, str, int]) -> Any:
+        scheme, host, port = key
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl_context)
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def acquire(self, key: tuple[str, str, int]) -> tuple[Any, bool]:
+        """Return a connection and whether it was reused."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._connect(key), False
+
+    def release(self, key: tuple[str, str, int], connection: Any) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def _request(self, link: str, headers: dict[str, str]) -> PooledResponse:
+        parts = urllib.parse.urlsplit(link)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise urllib.error.URLError(f"unsupported URL: {link}")
+
+        default_port = 443 if parts.scheme == "https" else 80
+        key = (parts.scheme, parts.hostname, parts.port or default_port)
+        target = urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+
+        while True:
+            connection, reused = self.acquire(key)
+            try:
+                connection.request("GET", target, headers=headers)
+                response = connection.getresponse()
+                return PooledResponse(self, key, connection, response)
+            except (http.client.HTTPException, OSError) as e:
+                connection.close()
+                # Idle connections might have been closed by the server in the meantime
+                if reused and isinstance(e, (http.client.RemoteDisconnected, ConnectionError)):
+                    continue
+                raise urllib.error.URLError(e) from e
+
+    def open(self, link: str, headers: dict[str, str]) -> Any:
+        """Send a GET request, following redirects. The response must be closed after use."""
+        if urllib.request.getproxies():
+            request = urllib.request.Request(link, headers=headers)
+            return urllib.request.urlopen(request, timeout=self.timeout)
+
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._request(link, headers)
+            response.url = link
+            if response.status in REDIRECT_CODES and response.headers.get("Location"):
+                response.read()
+                response.close()
+                link = urllib.parse.urljoin(link, response.headers["Location"])
+                continue
+            if response.status >= 300:
+                response.close()
+                raise urllib.error.HTTPError(link, response.status, response.reason, response.headers, None)
+            return response
+        raise urllib.error.URLError(f"too many redirects: {link}")
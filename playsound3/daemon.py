@@ -0,0 +1,84 @@
+"""Resident GStreamer player used by the `gstdaemon` backend.
+
+The process reads commands from stdin and reports finished sounds on stdout, one JSON object per line:
+
+    {"cmd": "play", "id": 1, "uri": "file:///path/to/sound.mp3"}
+    {"cmd": "stop", "id": 1}
+    {"event": "done", "id": 1, "code": 0}
+
+Each sound gets its own `playbin` pipeline, so starting a sound does not spawn a new process.
+The process exits when its stdin is closed.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from typing import Any
+
+
+def main() -> None:
+    import gi  # type: ignore
+
+    gi.require_version("Gst", "1.0")
+    from gi.repository import GLib, Gst  # type: ignore
+
+    Gst.init(None)
+    loop = GLib.MainLoop()
+    pipelines: dict[int, Any] = {}
+    output_lock = threading.Lock()
+
+    def report(sound_id: int, code: int) -> None:
+        with output_lock:
+            sys.stdout.write(json.dumps({"event": "done", "id": sound_id, "code": code}) + "\n")
+            sys.stdout.flush()
+
+    def finish(sound_id: int, code: int) -> None:
+        pipeline = pipelines.pop(sound_id, None)
+        if pipeline is not None:
+            pipeline.set_state(Gst.State.NULL)
+            pipeline.get_bus().remove_signal_watch()
+            report(sound_id, code)
+
+    def on_message(_bus: Any, message: Any, sound_id: int) -> None:
+        if message.type == Gst.MessageType.EOS:
+            finish(sound_id, 0)
+        elif message.type == Gst.MessageType.ERROR:
+            finish(sound_id, 1)
+
+    def play(sound_id: int, uri: str) -> None:
+        pipeline = Gst.ElementFactory.make("playbin", None)
+        pipeline.set_property("uri", uri)
+        pipeline.set_property("video-sink", Gst.ElementFactory.make("fakesink", None))
+        bus = pipeline.get_bus()
+        bus.add_signal_watch()
+        bus.connect("message", on_message, sound_id)
+        pipelines[sound_id] = pipeline
+        if pipeline.set_state(Gst.State.PLAYING) == Gst.StateChangeReturn.FAILURE:
+            finish(sound_id, 1)
+
+    def handle(command: dict[str, Any]) -> bool:
+        if command["cmd"] == "play":
+            play(command["id"], command["uri"])
+        elif command["cmd"] == "stop":
+            finish(command["id"], -15)
+        return False  # Remove the idle callback after running once
+
+    def read_commands() -> None:
+        for line in sys.stdin:
+            try:
+                command = json.loads(line)
+            except ValueError:
+                continue
+            GLib.idle_add(handle, command)
+        GLib.idle_add(loop.quit)
+
+    threading.Thread(target=read_commands, daemon=True).start()
+    loop.run()
+    for sound_id in list(pipelines):
+        finish(sound_id, -15)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import bisect
+import contextlib
+import threading
+from collections import Counter
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+
+if TYPE_CHECKING:
+    import logging
+
+
+def _logger() -> logging.Logger:
+    import logging
+
+    return logging.getLogger(__name__)
+
+
+# Checked before measuring anything, so there is no overhead until metrics are enabled
+ENABLED: bool = False
+
+_OBSERVERS: list[Callable[[str, dict[str, Any]], Any]] = []
+_LOCAL = threading.local()
+
+
+def enable() -> None:
+    """Start recording `Sound.timings` and notifying observers."""
+    global ENABLED
+    ENABLED = True
+
+
+def disable() -> None:
+    """Stop recording metrics. Observers stay registered."""
+    global ENABLED
+    ENABLED = False
+
+
+def add_observer(observer: Callable[[str, dict[str, Any]], Any]) -> None:
+    """Call `observer(event, data)` for every event, from the thread where it happened. Enables metrics.
+
+    Events:
+        - "prepare_path": sound, duration; includes the download of URLs.
+        - "cache": url, result; "hit" (not requested), "revalidated" (not modified),
+          "updated" or "miss" (downloaded), "stale" (server unreachable, cached copy used).
+        - "download": url, bytes, duration.
+        - "spawn": backend, duration.
+        - "exit": backend, duration; time from the end of spawning until the sound finished.
+    """
+    _OBSERVERS.append(observer)
+    enable()
+
+
+def remove_observer(observer: Callable[[str, dict[str, Any]], Any]) -> None:
+    _OBSERVERS.remove(observer)
+
+
+@contextlib.contextmanager
+def recording() -> Iterator[dict[str, Any]]:
+    """Collect the timings of the sound started in this thread."""
+    timings: dict[str, Any] = {}
+    previous, _LOCAL.timings = getattr(_LOCAL, "timings", None), timings
+    try:
+        yield timings
+    finally:
+        _LOCAL.timings = previous
+
+
+def current_timings() -> dict[str, Any]:
+    """Timings collected in this thread by `recording`, or a new dictionary."""
+    timings = getattr(_LOCAL, "timings", None)
+    return timings if timings is not None else {}
+
+
+def emit(event: str, timings: dict[str, Any] | None = None, **data: Any) -> None:
+    """Save the event to the sound's timings (by default, the ones collected in this thread) and notify observers."""
+    if timings is None:
+        timings = getattr(_LOCAL, "timings", None)
+    if timings is not None:
+        if "duration" in data:
+            timings[event] = data["duration"]
+        for key in ("result", "bytes"):
+            if key in data:
+                timings[f"{event}_{key}"] = data[key]
+
+    for observer in list(_OBSERVERS):
+        try:
+            observer(event, data)
+        except Exception:
+            _logger().exception(f"exception in metrics observer {observer!r}")
+
+
+class Histogram:
+    """Distribution of durations in seconds, counted in fixed buckets."""
+
+    BOUNDS = (0.0001, 0.0003, 0.001, 0.003, 0.01, 0.03, 0.1, 0.3, 1.0, 3.0, 10.0)
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        self.buckets[bisect.bisect_left(self.BOUNDS, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        labels = [f"<={bound}" for bound in self.BOUNDS] + [f">{self.BOUNDS[-1]}"]
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+class Stats:
+    """Observer aggregating events into counters and histograms of durations.
+
+    Usage:
+        stats = Stats()
+        add_observer(stats)
+        ...
+        print(stats.snapshot())
+    """
+
+    def __init__(self) -> None:
+        self.counters: Counter[str] = Counter()
+        self.histograms: dict[str, Histogram] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: str, data: dict[str, Any]) -> None:
+        with self._lock:
+            self.counters[event] += 1
+            if "result" in data:
+                self.counters[f"{event}.{data['result']}"] += 1
+            if "bytes" in data:
+                self.counters[f"{event}.bytes"] += data["bytes"]
+            if "duration" in data:
+                self.histograms.setdefault(event, Histogram()).add(data["duration"])
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "histograms": {event: histogram.to_dict() for event, histogram in self.histograms.items()},
+            }
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import threading
+import time
+import wave
+from pathlib import Path
+from typing import IO, Any
+
+import numpy as np  # type: ignore
+
+from playsound3.backends import CallbackPopen, PlaysoundException, RingBuffer
+
+# Format of the mixed output stream
+SAMPLE_RATE = 48000
+CHANNELS = 2
+BLOCK_FRAMES = 1024
+
+# Mixer stops its output stream after this many seconds without sounds
+IDLE_TIMEOUT = 2.0
+
+
+def _convert_wav_frames(data: bytes, sample_width: int) -> np.ndarray:
+    """Convert integer PCM samples of any width to float32 samples in int16 range."""
+    if sample_width == 1:
+        return (np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128) * 256
+    if sample_width == 2:
+        return np.frombuffer(data, dtype="<i2").astype(np.float32)
+    if sample_width == 3:
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        samples = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        samples = np.where(samples >= 1 << 23, samples - (1 << 24), samples)
+        return samples.astype(np.float32) / 256
+    if sample_width == 4:
+        return np.frombuffer(data, dtype="<i4").astype(np.float32) / 65536
+    raise PlaysoundException(f"unsupported WAV sample width: {sample_width}")
+
+
+def _resample(samples: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Linear resampling of (frames, channels) array to the mixer's sample rate."""
+    if sample_rate == SAMPLE_RATE or len(samples) == 0:
+        return samples
+    n_frames = int(len(samples) * SAMPLE_RATE / sample_rate)
+    positions = np.arange(n_frames) * (sample_rate / SAMPLE_RATE)
+    frames = np.arange(len(samples))
+    return np.stack([np.interp(positions, frames, channel) for channel in samples.T], axis=1).astype(np.float32)
+
+
+def convert(data: Any, channels: int, sample_rate: int, sample_width: int) -> np.ndarray:
+    """Convert integer PCM data to int16 samples with the mixer's format, shaped (frames, channels)."""
+    samples = _convert_wav_frames(data, sample_width).reshape(-1, channels)
+    if channels == 1:
+        samples = np.repeat(samples, CHANNELS, axis=1)
+    samples = _resample(samples[:, :CHANNELS], sample_rate)
+    return samples.astype(np.int16)
+
+
+def decode(sound: str) -> np.ndarray:
+    """Decode a sound file to int16 samples with the mixer's format, shaped (frames, channels).
+
+    WAV files are decoded with the `wave` module, other formats require ffmpeg.
+    """
+    if Path(sound).suffix.lower() == ".wav":
+        try:
+            with wave.open(sound, "rb") as wav:
+                data = wav.readframes(wav.getnframes())
+                return convert(data, wav.getnchannels(), wav.getframerate(), wav.getsampwidth())
+        except wave.Error:
+            pass  # For example, float WAV files; let ffmpeg handle them
+
+    if shutil.which("ffmpeg") is None:
+        raise PlaysoundException(f"Install 'ffmpeg' to play {Path(sound).suffix} files with the 'mixer' backend.")
+    command = ["ffmpeg", "-v", "error", "-i", sound, "-f", "s16le", "-ac", str(CHANNELS), "-ar", str(SAMPLE_RATE), "-"]
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise PlaysoundException(f"ffmpeg could not decode {sound}: {result.stderr.decode(errors='replace')}")
+    return np.frombuffer(result.stdout, dtype="<i2").reshape(-1, CHANNELS)
+
+
+class Voice(CallbackPopen):
+    """Popen-like object for a sound played by the mixer."""
+
+    def __init__(self, samples: np.ndarray, gain: float = 1.0):
+        super().__init__()
+        self.samples = samples
+        self.gain = gain
+        self.position = 0
+        self._finished = threading.Event()
+
+    def mix_into(self, block: np.ndarray) -> None:
+        """Add the next part of the sound to the output block."""
+        chunk = self.samples[self.position : self.position + len(block)]
+        block[: len(chunk)] += chunk * np.float32(self.gain)
+        self.position += len(chunk)
+        if self.position >= len(self.samples):
+            self.terminate()
+
+    def terminate(self) -> None:
+        self._finished.set()
+        self._notify_done()
+
+    def poll(self) -> int | None:
+        """None if sound is playing, integer if not."""
+        return 0 if self._finished.is_set() else None
+
+    def wait(self) -> int:
+        self._finished.wait()
+        return 0
+
+
+class StreamVoice(Voice):
+    """Voice playing integer PCM data as it arrives in a ring buffer.
+
+    Each output block takes the data that is there without waiting; if the producer falls behind,
+    the rest of the block is silent and the buffer counts an underrun.
+    """
+
+    def __init__(self, stream: RingBuffer, channels: int, sample_rate: int, sample_width: int, gain: float = 1.0):
+        super().__init__(np.zeros((0, CHANNELS), dtype=np.int16), gain)
+        self.stream = stream
+        self.channels = channels
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self._partial = b""  # Bytes of an incomplete frame
+
+    def mix_into(self, block: np.ndarray) -> None:
+        missing = len(block) - (len(self.samples) - self.position)
+        if missing > 0:
+            frame_size = self.channels * self.sample_width
+            frames = -(-missing * self.sample_rate // SAMPLE_RATE)  # Rounded up
+            data = self._partial + self.stream.read(frames * frame_size - len(self._partial), block=False)
+            complete = len(data) - len(data) % frame_size
+            self._partial = data[complete:]
+            if complete:
+                converted = convert(data[:complete], self.channels, self.sample_rate, self.sample_width)
+                self.samples = np.concatenate([self.samples[self.position :], converted])
+                self.position = 0
+
+        chunk = self.samples[self.position : self.position + len(block)]
+        block[: len(chunk)] += chunk * np.float32(self.gain)
+        self.position += len(chunk)
+        if self.position >= len(self.samples) and self.stream.finished:
+            self.terminate()
+
+    def terminate(self) -> None:
+        self.stream.close()
+        super().terminate()
+
+
+class Mixer:
+    """Mixes all voices into a single output stream written by a background thread.
+
+    Sinks:
+        - "aplay": raw PCM is piped to a single `aplay` process.
+        - "null": output is discarded, useful for testing.
+        - any other value: output is written to a file with that path.
+    """
+
+    def __init__(self, sink: str):
+        self.sink = sink
+        self._voices: list[Voice] = []
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def play(self, samples: np.ndarray, gain: float = 1.0) -> Voice:
+        return self.add(Voice(samples, gain))
+
+    def add(self, voice: Voice) -> Voice:
+        """Start mixing a voice into the output stream."""
+        with self._lock:
+            self._voices.append(voice)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+        return voice
+
+    def _open_sink(self) -> tuple[IO[bytes] | None, Any]:
+        """Return the output file (None for the null sink) and the process writing it to the device."""
+        if self.sink == "null":
+            return None, None
+        if self.sink == "aplay":
+            command = ["aplay", "--quiet", "-t", "raw", "-f", "S16_LE"]
+            command += ["-r", str(SAMPLE_RATE), "-c", str(CHANNELS), "--buffer-time=100000", "-"]
+            process = subprocess.Popen(command, stdin=subprocess.PIPE)
+            assert process.stdin is not None
+            return process.stdin, process
+        return open(self.sink, "ab"), None
+
+    def _run(self) -> None:
+        output, process = None, None
+        block_duration = BLOCK_FRAMES / SAMPLE_RATE
+        next_block_time = time.monotonic()
+        idle_since = time.monotonic()
+
+        try:
+            output, process = self._open_sink()
+            while True:
+                with self._lock:
+                    self._voices = [voice for voice in self._voices if voice.poll() is None]
+                    voices = list(self._voices)
+                    if voices:
+                        idle_since = time.monotonic()
+                    elif time.monotonic() - idle_since > IDLE_TIMEOUT:
+                        self._thread = None
+                        break
+
+                block = np.zeros((BLOCK_FRAMES, CHANNELS), dtype=np.float32)
+                for voice in voices:
+                    voice.mix_into(block)
+                if output is not None:
+                    output.write(np.clip(block, -32768, 32767).astype("<i2").tobytes())
+
+                # Stay at most one block ahead of real time to keep the latency low
+                next_block_time = max(next_block_time + block_duration, time.monotonic())
+                time.sleep(max(0.0, next_block_time - block_duration - time.monotonic()))
+        except OSError:
+            # Output stream failed, so the sounds cannot be played
+            with self._lock:
+                self._thread = None
+                voices, self._voices = self._voices, []
+            for voice in voices:
+                voice.terminate()
+        finally:
+            if output is not None:
+                try:
+                    output.close()
+                except OSError:
+                    pass
+            if process is not None:
+                process.wait()
+
+
+_MIXERS: dict[str, Mixer] = {}
+_MIXERS_LOCK = threading.Lock()
+
+
+def get_mixer(sink: str | None = None) -> Mixer:
+    """Return the shared mixer for a sink, by default the one set in `PLAYSOUND3_MIXER_SINK`."""
+    sink = sink or os.environ.get("PLAYSOUND3_MIXER_SINK", "aplay")
+    with _MIXERS_LOCK:
+        if sink not in _MIXERS:
+            _MIXERS[sink] = Mixer(sink)
+        return _MIXERS[sink]
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import logging
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from playsound3 import backends
+from playsound3.backends import PlaysoundException
+from playsound3.playsound3 import (
+    Sample,
+    Sound,
+    SoundBackend,
+    _playable_path,
+    _prepare_path,
+    _resolve_backend,
+    load,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _read_file(path: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        chunk = f.read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = f.read(chunk_size)
+
+
+class _PreparedSound:
+    """Sound that is ready to start with little delay.
+
+    Players that read from a pipe are started ahead and wait for data on their stdin.
+    For other backends the sound is decoded ahead, if possible.
+    """
+
+    def __init__(self, sound: str | Path, backend: SoundBackend) -> None:
+        self.path = _playable_path(_prepare_path(sound), backend)
+        self.backend = backend
+        self.process: subprocess.Popen[bytes] | None = None
+        self.sample: Sample | None = None
+
+        try:
+            self.process = backend.play_pipe(Path(self.path).suffix)
+        except NotImplementedError:
+            try:
+                self.sample = load(self.path)
+            except PlaysoundException:
+                pass  # For example, ffmpeg is not installed; the file is played as usual
+
+    def start(self) -> Sound:
+        if self.process is not None:
+            process = backends.PipedPopen(self.process, _read_file(self.path))
+            return Sound(self.path, False, self.backend, process=process)
+        if self.sample is not None:
+            return self.sample.play(block=False, backend=self.backend)
+        return Sound(self.path, False, self.backend)
+
+    def discard(self) -> None:
+        if self.process is not None:
+            self.process.kill()
+            self.process.wait()
+
+
+class Playlist:
+    """Plays sounds one after another, preparing the next sound while the current one is playing.
+
+    The next sound is downloaded if needed, and its player is started ahead to wait for data
+    (backends reading from pipes) or the sound is decoded ahead (in-process backends).
+    When the current sound ends, the next one starts within milliseconds.
+
+    Attributes:
+        current: The sound that is currently playing, if any.
+    """
+
+    def __init__(self, sounds: Iterable[str | Path] = (), backend: str | SoundBackend | None = None) -> None:
+        self.backend = backend
+        self.current: Sound | None = None
+        self._pending: deque[str | Path] = deque(sounds)
+        self._next: Future[_PreparedSound] | None = None
+        self._backend_obj: SoundBackend | None = None
+        self._stopped = False
+        self._finished = threading.Event()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def add(self, sound: str | Path) -> None:
+        """Add a sound to the end of the playlist. Sounds added after the playlist finished are not played."""
+        with self._lock:
+            self._pending.append(sound)
+        self._prepare_next()
+
+    def play(self, block: bool = True) -> Playlist:
+        """Start playing the playlist.
+
+        Args:
+            block: Wait until all sounds finish playing.
+
+        Returns:
+            The playlist itself.
+        """
+        self._backend_obj = _resolve_backend(self.backend)
+        self._prepare_next()
+        self._advance()
+        if block:
+            self.wait()
+        return self
+
+    def is_alive(self) -> bool:
+        """Check if the playlist is still playing."""
+        return self._backend_obj is not None and not self._finished.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until the playlist finishes playing.
+
+        Returns:
+            True if the playlist finished, False if the timeout passed first.
+        """
+        return self._finished.wait(timeout)
+
+    def stop(self) -> None:
+        """Stop the current sound and skip the rest of the playlist."""
+        with self._lock:
+            self._stopped = True
+            self._pending.clear()
+            upcoming, self._next = self._next, None
+            current = self.current
+        if upcoming is not None:
+            upcoming.add_done_callback(_discard)
+        if current is not None:
+            current.stop()
+        self._finish()
+
+    def _prepare_next(self) -> None:
+        with self._lock:
+            if self._backend_obj is None or self._finished.is_set() or self._next is not None or not self._pending:
+                return
+            self._next = self._executor.submit(_PreparedSound, self._pending.popleft(), self._backend_obj)
+
+    def _advance(self) -> None:
+        """Start the next sound as soon as it is prepared, or finish the playlist."""
+        with self._lock:
+            upcoming, self._next = self._next, None
+            if upcoming is None or self._stopped:
+                self.current = None
+        if upcoming is None:
+            self._finish()
+            return
+        # Runs now if the sound is prepared, otherwise in the preparing thread
+        upcoming.add_done_callback(self._start)
+
+    def _start(self, upcoming: Future[_PreparedSound]) -> None:
+        try:
+            prepared = upcoming.result()
+            with self._lock:
+                if self._stopped:
+                    prepared.discard()
+                    return
+                sound = self.current = prepared.start()
+        except Exception:
+            # Called from a background thread, so there is nobody to raise to
+            logger.exception("could not play a sound from the playlist, skipping it")
+            self._prepare_next()
+            self._advance()
+            return
+
+        self._prepare_next()
+        sound.on_finish(lambda _: self._advance())
+
+    def _finish(self) -> None:
+        with self._lock:
+            self._finished.set()
+        self._executor.shutdown(wait=False)
+
+
+def _discard(upcoming: Future[_PreparedSound]) -> None:
+    if upcoming.exception() is None:
+        upcoming.result().discard()
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import atexit
-import logging
+import itertools
 import os
 import shutil
 import subprocess
-import tempfile
-import urllib.error
-import urllib.request
+import sys
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from importlib.util import find_spec
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Iterable, Iterator, cast
 
 try:
     from typing import Protocol
@@ -18,53 +20,285 @@ except ImportError:
     # Python 3.7 compatibility
     from typing_extensions import Protocol
 
-from playsound3 import backends
+from playsound3 import backends, cache, metrics, routing, watcher
+from playsound3.backends import PlaysoundException
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    import logging
 
+    from playsound3 import connections
 
-class PlaysoundException(Exception):
-    pass
+
+def _logger() -> logging.Logger:
+    # Logging is imported on first use: the package only logs errors and debugging details
+    import logging
+
+    return logging.getLogger(__name__)
 
 
 ####################
 ## DOWNLOAD TOOLS ##
 ####################
 
-_DOWNLOAD_CACHE: dict[str, str] = {}
+# Downloaded files are kept between runs, the size limit can be changed with an environment variable
+_DOWNLOAD_CACHE = cache.DiskCache(
+    lambda: cache.cache_dir() / "downloads",
+    max_bytes=int(os.environ.get("PLAYSOUND3_CACHE_MAX_BYTES", 256 * 1024 * 1024)),
+)
 
+# URLs whose cached copies were already revalidated by this process
+_REVALIDATED_URLS: set[str] = set()
 
-def _download_sound_from_web(link: str, destination: Path) -> None:
-    # Identifies itself as a browser to avoid HTTP 403 errors
-    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 6.1; Win64; x64)"}
-    request = urllib.request.Request(link, headers=headers)
+# Keep-alive connections reused by all downloads, created with the first download.
+# The HTTP and SSL modules are imported only then, as most programs only play local files.
+_CONNECTION_POOL: connections.ConnectionPool | None = None
+_CONNECTION_POOL_LOCK = threading.Lock()
 
-    with urllib.request.urlopen(request) as response, destination.open("wb") as out_file:
-        out_file.write(response.read())
+# Only one thread at a time downloads a given URL, others wait for the result
+_DOWNLOAD_LOCKS: dict[str, threading.Lock] = {}
+_DOWNLOAD_LOCKS_LOCK = threading.Lock()
 
+# Identifies itself as a browser to avoid HTTP 403 errors
+_REQUEST_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 6.1; Win64; x64)"}
+
+
+def _connection_pool() -> connections.ConnectionPool:
+    global _CONNECTION_POOL
+    with _CONNECTION_POOL_LOCK:
+        if _CONNECTION_POOL is None:
+            from playsound3 import connections
+
+            _CONNECTION_POOL = connections.ConnectionPool(
+                timeout=float(os.environ.get("PLAYSOUND3_DOWNLOAD_TIMEOUT", 30))
+            )
+        return _CONNECTION_POOL
+
+
+def _download_lock(link: str) -> threading.Lock:
+    with _DOWNLOAD_LOCKS_LOCK:
+        return _DOWNLOAD_LOCKS.setdefault(link, threading.Lock())
+
+
+def _url_suffix(link: str) -> str:
+    import urllib.parse
+
+    return Path(urllib.parse.urlsplit(link).path).suffix
+
+
+def _download_sound_from_web(link: str) -> Path:
+    """Download a file to the download cache, or revalidate the copy that is already cached."""
+    import urllib.error
+
+    suffix = _url_suffix(link)
+    cached_path = _DOWNLOAD_CACHE.get(link, suffix)
+    metadata = _DOWNLOAD_CACHE.get_metadata(link) if cached_path else {}
+
+    headers = dict(_REQUEST_HEADERS)
+    if metadata.get("etag"):
+        headers["If-None-Match"] = metadata["etag"]
+    if metadata.get("last_modified"):
+        headers["If-Modified-Since"] = metadata["last_modified"]
+
+    start = time.perf_counter() if metrics.ENABLED else 0.0
+    try:
+        with _connection_pool().open(link, headers) as response:
+            with _DOWNLOAD_CACHE.open_write(link, suffix) as out_file:
+                shutil.copyfileobj(response, out_file)
+                size = out_file.tell()
+            metadata = {
+                "url": link,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+            _DOWNLOAD_CACHE.set_metadata(link, metadata)
+        if metrics.ENABLED:
+            metrics.emit("cache", url=link, result="miss" if cached_path is None else "updated")
+            metrics.emit("download", url=link, bytes=size, duration=time.perf_counter() - start)
+    except urllib.error.HTTPError as e:
+        if e.code != 304 or cached_path is None:
+            raise
+        _logger().debug(f"cached file is up to date: {link}")
+        if metrics.ENABLED:
+            metrics.emit("cache", url=link, result="revalidated")
+    except urllib.error.URLError as e:
+        if cached_path is None:
+            raise
+        _logger().warning(f"could not revalidate cached file, using it anyway: {link} ({e.reason})")
+        if metrics.ENABLED:
+            metrics.emit("cache", url=link, result="stale")
+    return _DOWNLOAD_CACHE.path(link, suffix)
+
+
+def _open_sound_stream(link: str, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Download a file in chunks, saving it to the download cache at the same time.
+
+    The connection is opened immediately, so errors are raised before the first chunk is requested.
+    If the iterator is not exhausted, the partial download is discarded.
+    """
+    suffix = _url_suffix(link)
+    start = time.perf_counter() if metrics.ENABLED else 0.0
+    response = _connection_pool().open(link, _REQUEST_HEADERS)
+    if metrics.ENABLED:
+        metrics.emit("cache", url=link, result="miss")
+
+    def iterate_chunks() -> Iterator[bytes]:
+        with response, _DOWNLOAD_CACHE.open_write(link, suffix) as out_file:
+            chunk = response.read(chunk_size)
+            while chunk:
+                out_file.write(chunk)
+                yield chunk
+                chunk = response.read(chunk_size)
+            size = out_file.tell()
+
+        metadata = {
+            "url": link,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        _DOWNLOAD_CACHE.set_metadata(link, metadata)
+        _REVALIDATED_URLS.add(link)
+        if metrics.ENABLED:
+            metrics.emit("download", url=link, bytes=size, duration=time.perf_counter() - start)
+
+    return iterate_chunks()
+
+
+def _is_url(sound: str | Path) -> bool:
+    return isinstance(sound, str) and sound.startswith(("http://", "https://"))
 
-def _prepare_path(sound: str | Path) -> str:
-    if isinstance(sound, str) and sound.startswith(("http://", "https://")):
-        # To play file from URL, we download the file first to a temporary location and cache it
-        if sound not in _DOWNLOAD_CACHE:
-            sound_suffix = Path(sound).suffix
-            with tempfile.NamedTemporaryFile(delete=False, prefix="playsound3-", suffix=sound_suffix) as f:
-                _download_sound_from_web(sound, Path(f.name))
-                _DOWNLOAD_CACHE[sound] = f.name
-        sound = _DOWNLOAD_CACHE[sound]
 
+def _prepare_path(sound: str | Path) -> str:
+    start = time.perf_counter() if metrics.ENABLED else 0.0
     path = Path(sound)
+    if _is_url(sound):
+        assert isinstance(sound, str)
+        # To play file from URL, we download the file first to the persistent cache.
+        # Files cached by other processes are revalidated once per process.
+        with _download_lock(sound):
+            cached_path = _DOWNLOAD_CACHE.get(sound, _url_suffix(sound))
+            if cached_path is None or sound not in _REVALIDATED_URLS:
+                cached_path = _download_sound_from_web(sound)
+                _REVALIDATED_URLS.add(sound)
+            elif metrics.ENABLED:
+                metrics.emit("cache", url=sound, result="hit")
+        path = cached_path
 
     if not path.exists():
-        raise PlaysoundException(f"file not found: {sound}")
+        raise PlaysoundException(f"file not found: {path}")
+    if metrics.ENABLED:
+        metrics.emit("prepare_path", sound=str(sound), duration=time.perf_counter() - start)
     return path.absolute().as_posix()
 
 
+def prefetch(urls: Iterable[str], max_workers: int = 4) -> list[str]:
+    """Download sound files to the cache ahead of time.
+
+    Files are downloaded in parallel, each URL at most once.
+    Files that are already cached are revalidated instead.
+
+    Args:
+        urls: URLs of the sound files.
+        max_workers: Maximum number of simultaneous downloads.
+
+    Returns:
+        Paths of the cached files, in the same order as `urls`.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_prepare_path, urls))
+
+
 ########################
 ## BACKEND INTERFACES ##
 ########################
 
 
+# Player processes are started with resolved executables and posix_spawn/vfork, unless disabled
+_FAST_SPAWN = os.name == "posix" and os.environ.get("PLAYSOUND3_FAST_SPAWN", "1") != "0"
+
+# Since Python 3.10, subprocess uses vfork on Linux, which is faster than posix_spawn.
+# Elsewhere it falls back to fork+exec, unless file descriptors are left open, which enables posix_spawn.
+_USE_POSIX_SPAWN = not getattr(subprocess, "_USE_VFORK", False)
+
+# Executables resolved for each value of PATH, so that PATH is searched once per binary
+_EXECUTABLES: dict[tuple[str, str], str] = {}
+
+_DEVNULL_FD: int | None = None
+_DEVNULL_LOCK = threading.Lock()
+
+
+def _devnull_fd() -> int:
+    """Null device opened once and reused by all player processes."""
+    global _DEVNULL_FD
+    with _DEVNULL_LOCK:
+        if _DEVNULL_FD is None:
+            _DEVNULL_FD = os.open(os.devnull, os.O_RDWR)
+        return _DEVNULL_FD
+
+
+class _GroupPopen(subprocess.Popen):  # type: ignore[type-arg]
+    """Player process started in its own process group; `terminate()` and `kill()` signal the whole group.
+
+    This way, helper processes started by the player (e.g. decoders) are stopped with it.
+    """
+
+    def __init__(self, command: list[str], **kwargs: Any) -> None:
+        super().__init__(command, start_new_session=True, **kwargs)
+
+    def send_signal(self, sig: int) -> None:
+        # Once the player is reaped, its process ID might be reused, so the group is signalled only before that
+        if self.poll() is None:
+            try:
+                os.killpg(self.pid, sig)
+            except ProcessLookupError:
+                pass
+
+
+# Players get their own process groups on POSIX systems, unless disabled.
+# Process groups rule out posix_spawn, so macOS falls back to fork+exec with them.
+_PROCESS_GROUPS = os.name == "posix" and os.environ.get("PLAYSOUND3_PROCESS_GROUPS", "1") != "0"
+
+
+def _spawn(command: list[str], stdin: Any = None, stdout: Any = None) -> subprocess.Popen[bytes]:
+    """Start a player process, like `subprocess.Popen(command, stdin=stdin, stdout=stdout)`.
+
+    On POSIX systems, the player is started in a new session and process group, see `_GroupPopen`.
+    With fast spawning, the executable is given as a resolved path, so the child does not try every PATH entry,
+    and DEVNULL is a pre-opened descriptor. Where subprocess cannot use vfork, file descriptors are not closed
+    in the child (Python's own are not inheritable anyway), which lets it use posix_spawn instead of fork
+    when players do not get process groups.
+    """
+    popen = _GroupPopen if _PROCESS_GROUPS else subprocess.Popen
+    if not _FAST_SPAWN:
+        return popen(command, stdin=stdin, stdout=stdout)
+
+    key = (command[0], os.environ.get("PATH", ""))
+    executable = _EXECUTABLES.get(key)
+    if executable is None:
+        executable = shutil.which(command[0])
+        if executable is None:
+            return popen(command, stdin=stdin, stdout=stdout)  # Raises the usual error
+        executable = _EXECUTABLES[key] = os.path.abspath(executable)
+
+    if stdin == subprocess.DEVNULL:
+        stdin = _devnull_fd()
+    if stdout == subprocess.DEVNULL:
+        stdout = _devnull_fd()
+    try:
+        return popen(
+            command,
+            executable=executable,
+            stdin=stdin,
+            stdout=stdout,
+            close_fds=not (_USE_POSIX_SPAWN and not _PROCESS_GROUPS),
+        )
+    except FileNotFoundError:
+        # The executable was removed or moved since it was resolved
+        _EXECUTABLES.pop(key, None)
+        return popen(command, stdin=stdin, stdout=stdout)
+
+
 # Imitating subprocess.Popen
 class PopenLike(Protocol):
     def poll(self) -> int | None: ...
@@ -75,6 +309,21 @@ class PopenLike(Protocol):
 class SoundBackend(ABC):
     """Abstract class for sound backends."""
 
+    # Executables and Python modules the backend depends on.
+    # Changes to them invalidate the cached result of `check()`.
+    executables: tuple[str, ...] = ()
+    modules: tuple[str, ...] = ()
+
+    # Backends with quick checks that depend on something else can opt out of caching
+    cache_check: bool = True
+
+    # Lowercase suffixes of the formats the backend can play, None if it plays any format.
+    # Other formats are transcoded to WAV first.
+    formats: tuple[str, ...] | None = None
+
+    # Backends that download, transcode and cut sounds themselves get URLs unchanged
+    accepts_urls: bool = False
+
     @abstractmethod
     def check(self) -> bool:
         raise NotImplementedError("check() must be implemented.")
@@ -83,11 +332,57 @@ class SoundBackend(ABC):
     def play(self, sound: str) -> PopenLike:
         raise NotImplementedError("play() must be implemented.")
 
+    def command(self, sound: str) -> list[str]:
+        """Command line of the player process, for backends that play sounds with a subprocess.
+
+        Optional; used to start players without blocking, e.g. by the asyncio API.
+        """
+        raise NotImplementedError(f"{type(self).__name__} backend does not play sounds with a subprocess.")
+
+    def play_pipe(self, suffix: str) -> subprocess.Popen[bytes]:
+        """Start a player that reads the sound from its stdin.
+
+        Optional; used for streaming. The suffix describes the format of the data.
+        """
+        raise NotImplementedError(f"{type(self).__name__} backend cannot play from a pipe.")
+
+    def play_segment(self, sound: str, start: float | None, end: float | None) -> PopenLike:
+        """Play the part of a sound file between `start` and `end` seconds, None meaning its beginning or end.
+
+        Optional; used for parts of compressed files, which otherwise are decoded to WAV and sliced.
+        """
+        raise NotImplementedError(f"{type(self).__name__} backend cannot seek.")
+
+    def play_raw(self, buffer: Any, wav: backends.WavFormat) -> PopenLike:
+        """Play PCM data stored in a bytes-like buffer, at the location described by `wav`.
+
+        By default, the data is piped to the player with a WAV header.
+        Backends playing in-process can override it to avoid copying the data.
+        """
+        process = self.play_pipe(".wav")
+        header = backends.wav_header(wav, wav.data_size)
+        chunks = backends.iterate_chunks(buffer, wav.data_offset, wav.data_offset + wav.data_size)
+        return backends.PipedPopen(process, itertools.chain([header], chunks))
+
+    def play_stream(self, stream: backends.RingBuffer, wav: backends.WavFormat) -> PopenLike:
+        """Play PCM data in the format described by `wav` as it arrives in the ring buffer, until the stream ends.
+
+        By default, the data is piped to the player behind a WAV header of unknown size.
+        Backends playing in-process can override it to take the data from the buffer in real time.
+        """
+        process = self.play_pipe(".wav")
+        return backends.PipedPopen(process, itertools.chain([backends.wav_header(wav)], stream))
+
 
 class Gstreamer(SoundBackend):
     """Gstreamer backend for Linux."""
 
+    executables = ("gst-play-1.0",)
+
     def check(self) -> bool:
+        if shutil.which("gst-play-1.0") is None:
+            return False
+
         try:
             subprocess.run(
                 ["gst-play-1.0", "--version"],
@@ -99,16 +394,27 @@ class Gstreamer(SoundBackend):
         except FileNotFoundError:
             return False
 
+    def command(self, sound: str) -> list[str]:
+        return ["gst-play-1.0", "--no-interactive", "--quiet", sound]
+
     def play(self, sound: str) -> subprocess.Popen[bytes]:
-        return subprocess.Popen(["gst-play-1.0", "--no-interactive", "--quiet", sound])
+        return _spawn(self.command(sound))
+
+    def play_pipe(self, suffix: str) -> subprocess.Popen[bytes]:
+        return _spawn(["gst-play-1.0", "--no-interactive", "--quiet", "fd://0"], stdin=subprocess.PIPE)
 
 
 class Alsa(SoundBackend):
     """ALSA backend for Linux."""
 
+    executables = ("aplay", "mpg123")
+    formats = (".wav", ".mp3")
     pty_master = None
 
     def check(self) -> bool:
+        if shutil.which("aplay") is None or shutil.which("mpg123") is None:
+            return False
+
         try:
             subprocess.run(["aplay", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
             subprocess.run(["mpg123", "--version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
@@ -116,16 +422,31 @@ class Alsa(SoundBackend):
         except FileNotFoundError:
             return False
 
-    def play(self, sound: str) -> subprocess.Popen[bytes]:
+    def command(self, sound: str) -> list[str]:
         suffix = Path(sound).suffix
 
+        if suffix == ".wav":
+            return ["aplay", "--quiet", sound]
+        elif suffix == ".mp3":
+            return ["mpg123", "-q", sound]
+        else:
+            raise PlaysoundException(f"ALSA does not support for {suffix} files.")
+
+    def play(self, sound: str) -> subprocess.Popen[bytes]:
+        command = self.command(sound)
+
         if self.pty_master is None:
             self.pty_master, _ = os.openpty()
 
+        if command[0] == "mpg123":
+            return _spawn(command, stdin=self.pty_master)
+        return _spawn(command)
+
+    def play_pipe(self, suffix: str) -> subprocess.Popen[bytes]:
         if suffix == ".wav":
-            return subprocess.Popen(["aplay", "--quiet", sound])
+            return _spawn(["aplay", "--quiet", "-"], stdin=subprocess.PIPE)
         elif suffix == ".mp3":
-            return subprocess.Popen(["mpg123", "-q", sound], stdin=self.pty_master)
+            return _spawn(["mpg123", "-q", "-"], stdin=subprocess.PIPE)
         else:
             raise PlaysoundException(f"ALSA does not support for {suffix} files.")
 
@@ -133,16 +454,36 @@ class Alsa(SoundBackend):
 class Ffplay(SoundBackend):
     """FFplay backend for systems with ffmpeg installed."""
 
+    executables = ("ffplay",)
+
     def check(self) -> bool:
+        if shutil.which("ffplay") is None:
+            return False
+
         try:
             subprocess.run(["ffplay", "-version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
             return True
         except FileNotFoundError:
             return False
 
+    def command(self, sound: str) -> list[str]:
+        return ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", sound]
+
     def play(self, sound: str) -> subprocess.Popen[bytes]:
-        return subprocess.Popen(
-            ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", sound],
+        return _spawn(self.command(sound), stdout=subprocess.DEVNULL)
+
+    def play_segment(self, sound: str, start: float | None, end: float | None) -> subprocess.Popen[bytes]:
+        command = self.command(sound)
+        if end is not None:
+            command[-1:-1] = ["-t", str(max(0.0, end - (start or 0.0)))]
+        if start is not None:
+            command[-1:-1] = ["-ss", str(start)]
+        return _spawn(command, stdout=subprocess.DEVNULL)
+
+    def play_pipe(self, suffix: str) -> subprocess.Popen[bytes]:
+        return _spawn(
+            ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", "-i", "pipe:0"],
+            stdin=subprocess.PIPE,
             stdout=subprocess.DEVNULL,
         )
 
@@ -150,19 +491,29 @@ class Ffplay(SoundBackend):
 class Wmplayer(SoundBackend):
     """Windows Media Player backend for Windows."""
 
+    modules = ("pythoncom",)
+
     def check(self) -> bool:
         # The recommended way to check for missing library
         if find_spec("pythoncom") is None:
             return False
 
         try:
+            import pythoncom  # type: ignore
             import win32com.client  # type: ignore
+        except ImportError:
+            return False
 
+        # Backends are checked on executor threads, where COM is not initialized yet
+        pythoncom.CoInitialize()
+        try:
             _ = win32com.client.Dispatch("WMPlayer.OCX")
             return True
-        except (ImportError, Exception):
+        except Exception:
             # pywintypes.com_error can be raised, which inherits directly from Exception
             return False
+        finally:
+            pythoncom.CoUninitialize()
 
     def play(self, sound: str) -> backends.WmplayerPopen:
         return backends.WmplayerPopen(sound)
@@ -171,6 +522,8 @@ class Wmplayer(SoundBackend):
 class Winmm(SoundBackend):
     """WinMM backend for Windows."""
 
+    formats = (".wav", ".mp3")
+
     def check(self) -> bool:
         try:
             import ctypes
@@ -187,18 +540,25 @@ class Winmm(SoundBackend):
 class Afplay(SoundBackend):
     """Afplay backend for macOS."""
 
+    executables = ("afplay",)
+
     def check(self) -> bool:
         # For some reason successful 'afplay -h' returns non-zero code
         # So we must use shutil to test if afplay exists
         return shutil.which("afplay") is not None
 
+    def command(self, sound: str) -> list[str]:
+        return ["afplay", sound]
+
     def play(self, sound: str) -> subprocess.Popen[bytes]:
-        return subprocess.Popen(["afplay", sound])
+        return _spawn(self.command(sound))
 
 
 class Appkit(SoundBackend):
     """Appkit backend for macOS."""
 
+    modules = ("AppKit", "Foundation")
+
     def check(self) -> bool:
         try:
             from AppKit import NSSound  # type: ignore # noqa: F401
@@ -212,6 +572,196 @@ class Appkit(SoundBackend):
         return backends.AppkitPopen(sound)
 
 
+class AlsaPcm(SoundBackend):
+    """In-process ALSA backend for Linux; only plays .wav files, other formats are transcoded.
+
+    Uses libasound directly, so no process is spawned to play a sound.
+    The PCM device can be changed with the `PLAYSOUND3_ALSA_DEVICE` environment variable.
+    """
+
+    # Loading a shared library is cheap, and it cannot be located without running ldconfig
+    cache_check = False
+    formats = (".wav",)
+
+    def check(self) -> bool:
+        return backends.load_libasound() is not None
+
+    def play(self, sound: str) -> backends.AlsaPcmPopen:
+        suffix = Path(sound).suffix
+        if suffix.lower() != ".wav":
+            raise PlaysoundException(f"ALSA PCM does not support {suffix} files.")
+        buffer = backends.map_file(sound)
+        return self.play_raw(buffer, backends.read_wav_format(buffer))
+
+    def play_raw(self, buffer: Any, wav: backends.WavFormat) -> backends.AlsaPcmPopen:
+        return backends.AlsaPcmPopen(buffer, wav, os.environ.get("PLAYSOUND3_ALSA_DEVICE", "default"))
+
+
+class Mixer(SoundBackend):
+    """Software mixer playing all sounds through one output stream; requires NumPy.
+
+    Sounds are decoded to PCM (.wav with the `wave` module, other formats with ffmpeg) and mixed in-process.
+    The output goes to a single `aplay` process; set `PLAYSOUND3_MIXER_SINK` to "null" or a file path to change it.
+    """
+
+    modules = ("numpy",)
+    # The check depends on an environment variable and is cheap anyway
+    cache_check = False
+
+    def check(self) -> bool:
+        if find_spec("numpy") is None:
+            return False
+        return os.environ.get("PLAYSOUND3_MIXER_SINK", "aplay") != "aplay" or shutil.which("aplay") is not None
+
+    def play(self, sound: str) -> PopenLike:
+        from playsound3 import mixer
+
+        return mixer.get_mixer().play(mixer.decode(sound))
+
+    def play_raw(self, buffer: Any, wav: backends.WavFormat) -> PopenLike:
+        from playsound3 import mixer
+
+        if wav.audio_format != 1:
+            raise PlaysoundException(f"mixer does not support WAV format {wav.audio_format}")
+        data = memoryview(buffer)[wav.data_offset : wav.data_offset + wav.data_size]
+        samples = mixer.convert(data, wav.channels, wav.sample_rate, wav.bits_per_sample // 8)
+        return mixer.get_mixer().play(samples)
+
+    def play_stream(self, stream: backends.RingBuffer, wav: backends.WavFormat) -> PopenLike:
+        from playsound3 import mixer
+
+        if wav.audio_format != 1:
+            raise PlaysoundException(f"mixer does not support WAV format {wav.audio_format}")
+        return mixer.get_mixer().add(mixer.StreamVoice(stream, wav.channels, wav.sample_rate, wav.bits_per_sample // 8))
+
+
+class GstDaemon(SoundBackend):
+    """Resident GStreamer player for Linux; requires PyGObject.
+
+    All sounds are played by a single long-lived process, so starting a sound
+    only sends a command through a pipe instead of spawning a new process.
+    """
+
+    modules = ("gi",)
+    client: backends.DaemonClient | None = None
+
+    def check(self) -> bool:
+        try:
+            import gi  # type: ignore
+
+            gi.require_version("Gst", "1.0")
+            from gi.repository import Gst  # type: ignore # noqa: F401
+
+            return True
+        except (ImportError, ValueError):
+            return False
+
+    def play(self, sound: str) -> backends.DaemonPopen:
+        if self.client is None:
+            self.client = backends.DaemonClient([sys.executable, str(Path(backends.__file__).with_name("daemon.py"))])
+        return self.client.play(Path(sound).absolute().as_uri())
+
+
+def _server_address() -> str:
+    return os.environ.get("PLAYSOUND3_SERVER") or str(cache.cache_dir() / "server.sock")
+
+
+class Remote(SoundBackend):
+    """Client of a playback server started with `python -m playsound3 serve`.
+
+    Sounds are sent to the server, which plays them for all client processes with one backend and one set
+    of caches; URLs are downloaded by the server. The server socket is set by `PLAYSOUND3_SERVER`.
+    """
+
+    # Connecting to a Unix socket is cheap, and the server can be started or stopped at any time
+    cache_check = False
+    accepts_urls = True
+    clients: dict[str, backends.ServerClient] = {}
+
+    def check(self) -> bool:
+        import socket
+
+        if not hasattr(socket, "AF_UNIX"):
+            return False
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            try:
+                sock.connect(_server_address())
+                return True
+            except OSError:
+                return False
+
+    def _client(self) -> backends.ServerClient:
+        address = _server_address()
+        if address not in self.clients:
+            self.clients[address] = backends.ServerClient(address)
+        return self.clients[address]
+
+    def play(self, sound: str) -> backends.DaemonPopen:
+        return self._client().play({"sound": sound})
+
+    def play_segment(self, sound: str, start: float | None, end: float | None) -> backends.DaemonPopen:
+        return self._client().play({"sound": sound, "start": start, "end": end})
+
+
+#################
+## TRANSCODING ##
+#################
+
+# Files transcoded to WAV are kept on disk by content hash, so each asset is transcoded once, even by other processes
+_PCM_CACHE = cache.DiskCache(
+    lambda: cache.cache_dir() / "pcm",
+    max_bytes=int(os.environ.get("PLAYSOUND3_CACHE_MAX_BYTES", 256 * 1024 * 1024)),
+)
+
+# Content hashes by path, modification time and size, so unchanged files are hashed once per process
+_CONTENT_HASHES: dict[tuple[str, int, int], str] = {}
+_MAX_CONTENT_HASHES = 4096
+
+
+def _content_hash(path: str) -> str:
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    digest = _CONTENT_HASHES.get(key)
+    if digest is None:
+        import hashlib
+
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha256.update(chunk)
+        if len(_CONTENT_HASHES) >= _MAX_CONTENT_HASHES:
+            _CONTENT_HASHES.clear()
+        digest = _CONTENT_HASHES[key] = sha256.hexdigest()
+    return digest
+
+
+def _transcode_to_wav(path: str) -> str:
+    """Return the path of a 16-bit PCM WAV copy of the file, transcoding it with ffmpeg if it is not cached."""
+    key = _content_hash(path)
+    cached_path = _PCM_CACHE.get(key, ".wav")
+    if cached_path is None:
+        if shutil.which("ffmpeg") is None:
+            raise PlaysoundException(f"Install 'ffmpeg' to decode {Path(path).suffix} files.")
+        command = ["ffmpeg", "-v", "error", "-i", path, "-f", "wav", "-acodec", "pcm_s16le", "-"]
+        with _PCM_CACHE.open_write(key, ".wav") as out_file:
+            result = subprocess.run(command, stdout=out_file, stderr=subprocess.PIPE)
+            if result.returncode != 0:
+                raise PlaysoundException(f"ffmpeg could not decode {path}: {result.stderr.decode(errors='replace')}")
+        cached_path = _PCM_CACHE.path(key, ".wav")
+    return str(cached_path)
+
+
+def _plays_format(backend: SoundBackend, suffix: str) -> bool:
+    return backend.formats is None or suffix.lower() in backend.formats
+
+
+def _playable_path(path: str, backend: SoundBackend) -> str:
+    """Path of the file, or of its transcoded copy if the backend cannot play its format."""
+    if _plays_format(backend, Path(path).suffix):
+        return path
+    return _transcode_to_wav(path)
+
+
 ################
 ## PLAYSOUND  ##
 ################
@@ -225,20 +775,61 @@ def _auto_select_backend() -> str | None:
         # Allow users to override the automatic backend choice
         return os.environ["PLAYSOUND3_BACKEND"]
 
+    available_backends = _lazy_global("AVAILABLE_BACKENDS")
     for backend in _BACKEND_PREFERENCE:
-        if backend in AVAILABLE_BACKENDS:
+        if backend in available_backends:
             return backend
 
+    import logging
+
     logging.warning(_NO_BACKEND_MESSAGE)
     return None
 
 
+# Measured startup latencies of backends by format, see `calibrate`
+_ROUTER = routing.Router(lambda: cache.cache_dir() / "routing.json")
+_ROUTING = os.environ.get("PLAYSOUND3_ROUTING", "1") != "0"
+
+
+def _route(path: str, backend: str | SoundBackend | None) -> str | SoundBackend | None:
+    """Pick the backend with the lowest measured latency for the format of the file, unless the user chose one."""
+    if backend is not None or not _ROUTING or "PLAYSOUND3_BACKEND" in os.environ:
+        return backend
+    suffix = Path(path).suffix.lower()
+    backend_map = _lazy_global("_BACKEND_MAP")
+    candidates = [name for name in _lazy_global("AVAILABLE_BACKENDS") if _plays_format(backend_map[name], suffix)]
+    return _ROUTER.choose(suffix, candidates, _lazy_global("DEFAULT_BACKEND"))
+
+
+def _observe_latency(sound: Sound, suffix: str, backend: str) -> None:
+    """Update the latency of the backend when the sound finishes, unless it is stopped.
+
+    Nothing is measured for formats that were not calibrated, since the default backend is used for them anyway.
+    """
+    if not _ROUTER.measured(suffix):
+        return
+    duration = sound.duration
+    if duration is None:
+        return
+
+    def on_finish(sound: Sound) -> None:
+        # Players that fail exit early, so they would look like the fastest
+        # The player has exited; unlike poll(), wait() does not return None while another thread waits for it
+        if not sound._stopped and sound.subprocess.wait() == 0:
+            _ROUTER.observe(suffix, backend, max(0.0, time.monotonic() - sound._started - duration))
+
+    sound.on_finish(on_finish)
+
+
 class Sound:
     """Subprocess-based sound object.
 
     Attributes:
         backend: The name of the backend used to play the sound.
+        name: The sound file or URL that is playing.
         subprocess: The subprocess object used to play the sound.
+        timings: Durations in seconds of the steps of playing the sound, e.g. "prepare_path", "download",
+            "spawn" and "exit", and the result of the cache lookup. Recorded only when metrics are enabled.
     """
 
     def __init__(
@@ -246,13 +837,49 @@ class Sound:
         name: str,
         block: bool,
         backend: SoundBackend,
+        process: PopenLike | None = None,
+        duration: float | None = None,
     ) -> None:
-        """Initialize the player and begin playing."""
+        """Initialize the player and begin playing.
+
+        If `process` is given, it is an already started player and `backend.play` is not called.
+        If `duration` is given, it is used instead of the duration read from the file, e.g. for parts of files.
+        """
+        self.name = name
         self.backend: str = str(type(backend)).lower()
-        self.subprocess: PopenLike = backend.play(name)
+        self.timings: dict[str, Any] = {}
+        self._started = time.monotonic()
+        self._stopped = False
+        self._duration = duration
+        self._probed = duration is not None
+        self._finished: threading.Event | None = None
+        self._finish_callbacks: list[Callable[[Sound], Any]] = []
+        self._finish_lock = threading.Lock()
+
+        if not metrics.ENABLED:
+            self.subprocess: PopenLike = process if process is not None else backend.play(name)
+        else:
+            self.timings = metrics.current_timings()
+            start = time.perf_counter()
+            self.subprocess = process if process is not None else backend.play(name)
+            spawned = time.perf_counter()
+            if process is None:
+                metrics.emit("spawn", self.timings, backend=self.backend, duration=spawned - start)
+            self.on_finish(
+                lambda sound: metrics.emit(
+                    "exit", sound.timings, backend=sound.backend, duration=time.perf_counter() - spawned
+                )
+            )
 
         if block:
-            self.wait()
+            try:
+                self.wait()
+            except BaseException:
+                # The player has its own process group, so e.g. Ctrl+C in the terminal does not reach it
+                self.stop()
+                raise
+        else:
+            _track(self)
 
     def is_alive(self) -> bool:
         """Check if the sound is still playing.
@@ -262,43 +889,201 @@ class Sound:
         """
         return self.subprocess.poll() is None
 
-    def wait(self) -> None:
+    def wait(self, timeout: float | None = None) -> bool:
         """Block until the sound finishes playing.
 
         This only makes sense for non-blocking sounds.
+
+        Args:
+            timeout: Maximum number of seconds to wait. Leave None to wait until the sound finishes.
+
+        Returns:
+            True if the sound finished, False if the timeout passed first.
+        """
+        if timeout is None:
+            self.subprocess.wait()
+            return True
+        return self._watch().wait(timeout)
+
+    def on_finish(self, callback: Callable[[Sound], Any]) -> None:
+        """Call `callback(sound)` when the sound finishes, or immediately if it already has.
+
+        Callbacks are called from a background thread shared by all sounds and should return quickly.
         """
-        self.subprocess.wait()
+        finished = self._watch()
+        with self._finish_lock:
+            if not finished.is_set():
+                self._finish_callbacks.append(callback)
+                return
+        callback(self)
+
+    def _watch(self) -> threading.Event:
+        """Start watching the player on the first call. Returns the event set when the sound finishes."""
+        with self._finish_lock:
+            first_call = self._finished is None
+            if self._finished is None:
+                self._finished = threading.Event()
+            finished = self._finished
+        if first_call:
+            watcher.watch(self.subprocess, self._on_exit)
+        return finished
+
+    def _on_exit(self) -> None:
+        with self._finish_lock:
+            assert self._finished is not None
+            self._finished.set()
+            callbacks, self._finish_callbacks = self._finish_callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception:
+                _logger().exception("exception in on_finish callback")
 
     def stop(self) -> None:
         """Stop the sound."""
+        self._stopped = True
         self.subprocess.terminate()
 
+    @property
+    def duration(self) -> float | None:
+        """Length of the sound in seconds, read from the file headers, or None if it cannot be determined."""
+        if not self._probed:
+            try:
+                from playsound3 import probe
+
+                self._duration = probe.probe(self.name).duration
+            except (OSError, PlaysoundException) as e:
+                _logger().debug(f"cannot read the duration of {self.name}: {e}")
+            self._probed = True
+        return self._duration
+
+    @property
+    def progress(self) -> float | None:
+        """Estimated fraction of the sound played so far, from 0.0 to 1.0, or None if the duration is unknown."""
+        duration = self.duration
+        if duration is None:
+            return None
+        if not duration or not self.is_alive():
+            return 1.0
+        return min(1.0, (time.monotonic() - self._started) / duration)
+
+    @property
+    def remaining(self) -> float | None:
+        """Estimated number of seconds until the sound finishes, or None if the duration is unknown."""
+        duration = self.duration
+        if duration is None:
+            return None
+        if not self.is_alive():
+            return 0.0
+        return max(0.0, duration - (time.monotonic() - self._started))
+
+
+# Sounds playing in the background, until the watcher sees them finish and reaps their players
+_LIVE_SOUNDS: set[Sound] = set()
+_LIVE_SOUNDS_LOCK = threading.Lock()
+_STOP_AT_EXIT_REGISTERED = False
+
+
+def _track(sound: Sound) -> None:
+    global _STOP_AT_EXIT_REGISTERED
+    with _LIVE_SOUNDS_LOCK:
+        _LIVE_SOUNDS.add(sound)
+        if not _STOP_AT_EXIT_REGISTERED:
+            # Registered with the first background sound, so importing the package has no exit-time work
+            atexit.register(_stop_all_at_exit)
+            _STOP_AT_EXIT_REGISTERED = True
+    sound.on_finish(_untrack)
+
+
+def _untrack(sound: Sound) -> None:
+    with _LIVE_SOUNDS_LOCK:
+        _LIVE_SOUNDS.discard(sound)
+
+
+def live_sounds() -> list[Sound]:
+    """Return the sounds that are playing in the background."""
+    with _LIVE_SOUNDS_LOCK:
+        return list(_LIVE_SOUNDS)
+
+
+def stop_all() -> None:
+    """Stop all sounds playing in the background.
+
+    Each player gets one signal and is not waited for; finished players are reaped in the background.
+    This is also done when the interpreter exits, unless `PLAYSOUND3_STOP_AT_EXIT` is set to 0.
+    """
+    for sound in live_sounds():
+        try:
+            sound.stop()
+        except Exception:
+            _logger().exception("could not stop a sound")
+
+
+def _stop_all_at_exit() -> None:
+    if os.environ.get("PLAYSOUND3_STOP_AT_EXIT", "1") != "0":
+        stop_all()
 
-def playsound(
-    sound: str | Path,
-    block: bool = True,
-    backend: str | None = None,
-) -> Sound:
-    """Play a sound file using an available audio backend.
+
+def wait_any(sounds: Iterable[Sound], timeout: float | None = None) -> Sound | None:
+    """Block until any of the sounds finishes playing.
 
     Args:
-        sound: Path or URL of the sound file (string or pathlib.Path).
-        block:
-            - `True` (default): Wait until sound finishes playing.
-            - `False`: Play sound in the background.
-        backend: Specific audio backend to use. Leave None for automatic selection.
+        sounds: Sounds to wait for.
+        timeout: Maximum number of seconds to wait. Leave None to wait without a limit.
 
     Returns:
-        Sound object for controlling playback.
+        The first sound that finished, or None if the timeout passed first.
     """
-    path = _prepare_path(sound)
-    backend = backend or DEFAULT_BACKEND
+    finished: list[Sound] = []
+    event = threading.Event()
+
+    def on_finish(sound: Sound) -> None:
+        finished.append(sound)
+        event.set()
+
+    for sound in sounds:
+        sound.on_finish(on_finish)
+    event.wait(timeout)
+    return finished[0] if finished else None
+
+
+def wait_all(sounds: Iterable[Sound], timeout: float | None = None) -> bool:
+    """Block until all the sounds finish playing.
+
+    Args:
+        sounds: Sounds to wait for.
+        timeout: Maximum number of seconds to wait. Leave None to wait without a limit.
+
+    Returns:
+        True if all the sounds finished, False if the timeout passed first.
+    """
+    sounds = list(sounds)
+    remaining = [len(sounds)]
+    lock = threading.Lock()
+    event = threading.Event()
+
+    def on_finish(sound: Sound) -> None:
+        with lock:
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                event.set()
+
+    if not sounds:
+        return True
+    for sound in sounds:
+        sound.on_finish(on_finish)
+    return event.wait(timeout)
+
+
+def _resolve_backend(backend: str | SoundBackend | type[SoundBackend] | None) -> SoundBackend:
+    backend = backend or _lazy_global("DEFAULT_BACKEND")
     if backend is None:
         raise PlaysoundException(_NO_BACKEND_MESSAGE)
 
     if isinstance(backend, str):
-        if backend in _BACKEND_MAP:
-            backend_obj = _BACKEND_MAP[backend]
+        backend_map = _lazy_global("_BACKEND_MAP")
+        if backend in backend_map:
+            backend_obj = backend_map[backend]
         else:
             raise PlaysoundException(f"unknown backend '{backend}'")
 
@@ -309,21 +1094,456 @@ def playsound(
         backend_obj = backend()
     else:
         raise PlaysoundException(f"invalid backend type '{type(backend)}'")
-    return Sound(path, block, backend_obj)
+    return backend_obj
+
+
+def _play_stream(link: str, block: bool, backend: SoundBackend) -> Sound | None:
+    """Play a URL while it is being downloaded. Returns None if the backend cannot play from a pipe."""
+    if not _plays_format(backend, _url_suffix(link)):
+        return None  # The file has to be downloaded and transcoded first
+
+    try:
+        # The player starts while the connection is being opened
+        process = backend.play_pipe(_url_suffix(link))
+    except NotImplementedError:
+        return None
+
+    try:
+        chunks = _open_sound_stream(link)
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    return Sound(link, block, backend, process=backends.PipedPopen(process, chunks))
+
 
+def playsound(
+    sound: str | Path | bytes | bytearray | memoryview | BinaryIO,
+    block: bool = True,
+    backend: str | SoundBackend | None = None,
+    stream: bool = False,
+    start: float | None = None,
+    end: float | None = None,
+) -> Sound:
+    """Play a sound file using an available audio backend.
 
-def _remove_cached_downloads(cache: dict[str, str]) -> None:
-    """Remove all files saved in the cache when the program ends."""
-    for path in cache.values():
-        Path(path).unlink()
+    Args:
+        sound: Path or URL of the sound file (string or pathlib.Path), or the contents of a WAV, FLAC, MP3 or Ogg
+            file as a bytes-like object or a binary file object. Data in memory is piped to the player or handed
+            to in-process backends without copying; it must not be modified while the sound plays. File objects
+            are read in the background and must stay open until the sound finishes.
+        block:
+            - `True` (default): Wait until sound finishes playing.
+            - `False`: Play sound in the background.
+        backend: Specific audio backend to use. Leave None for automatic selection.
+        stream: Start playing a URL before it is fully downloaded, if the backend can read from a pipe.
+            The file is saved to the download cache at the same time. Ignored for local files and data.
+        start: Second of the file to start playing at. Leave None to play from the beginning.
+        end: Second of the file to stop playing at. Leave None to play until the end.
+            Parts of WAV files are played straight from the memory-mapped file; streaming is not used for parts.
+
+    Returns:
+        Sound object for controlling playback.
+    """
+    if metrics.ENABLED:
+        with metrics.recording():
+            return _playsound(sound, block, backend, stream, start, end)
+    return _playsound(sound, block, backend, stream, start, end)
+
+
+def _playsound(
+    sound: str | Path | bytes | bytearray | memoryview | BinaryIO,
+    block: bool,
+    backend: str | SoundBackend | None,
+    stream: bool,
+    start: float | None,
+    end: float | None,
+) -> Sound:
+    if not isinstance(sound, (str, Path)):
+        return _play_data(sound, block, backend, start, end)
+
+    segment = start is not None or end is not None
+    if _is_url(sound) and _forwards_urls(backend):
+        path = str(sound)
+    # A URL being downloaded by another thread is played after that download finishes
+    elif (
+        stream
+        and not segment
+        and _is_url(sound)
+        and _DOWNLOAD_CACHE.get(str(sound), _url_suffix(str(sound))) is None
+        and not _download_lock(str(sound)).locked()
+    ):
+        streamed_sound = _play_stream(str(sound), block, _resolve_backend(backend))
+        if streamed_sound is not None:
+            return streamed_sound
+        path = _prepare_path(sound)
+    else:
+        path = _prepare_path(sound)
+
+    routed_backend = _route(path, backend) if not segment else backend
+    backend_obj = _resolve_backend(routed_backend)
+    if not segment:
+        played = Sound(_playable_path(path, backend_obj), block, backend_obj)
+        if backend is None and isinstance(routed_backend, str):
+            _observe_latency(played, Path(path).suffix.lower(), routed_backend)
+        return played
+    if backend_obj.accepts_urls:
+        # The backend transcodes and cuts the sound itself
+        process = backend_obj.play_segment(path, start, end)
+        return Sound(path, block, backend_obj, process=process, duration=_segment_duration(path, start, end))
+    return _play_segment(path, start, end, block, backend_obj)
+
+
+# Bytes read from file objects to recognize the format before the player is started
+_SNIFF_SIZE = 64 * 1024
+
+
+def _play_data(
+    data: bytes | bytearray | memoryview | BinaryIO,
+    block: bool,
+    backend: str | SoundBackend | None,
+    start: float | None,
+    end: float | None,
+) -> Sound:
+    """Play a sound held in memory or read from a file object.
+
+    WAV data is handed to `play_raw`, so in-process backends play it without a copy.
+    Other formats are piped to the player. Backends that can do neither play a copy written to the PCM cache.
+    """
+    from playsound3 import probe
+
+    backend_obj = _resolve_backend(backend)
+    segment = start is not None or end is not None
+    try:
+        view = memoryview(data).cast("B")  # type: ignore[arg-type]
+    except TypeError:
+        if not hasattr(data, "read"):
+            raise PlaysoundException(f"cannot play {type(data).__name__} objects") from None
+        file = cast(BinaryIO, data)
+        name = getattr(file, "name", None)
+        name = name if isinstance(name, str) else "<stream>"
+        head = file.read(_SNIFF_SIZE)
+        suffix = probe.sniff_suffix(head)
+        if not segment and _plays_format(backend_obj, suffix):
+            try:
+                process = backend_obj.play_pipe(suffix)
+            except NotImplementedError:
+                pass
+            else:
+                chunks = itertools.chain([head], iter(lambda: file.read(_SNIFF_SIZE), b""))
+                return Sound(name, block, backend_obj, process=backends.PipedPopen(process, chunks))
+        # For parts and in-process backends, the file is read whole and played like data in memory
+        data = head + file.read()
+        view = memoryview(data)
+    else:
+        name = "<bytes>"
+
+    # Bytes are passed as they are: ctypes can take their address without a copy, unlike a read-only view's
+    buffer = data if isinstance(data, (bytes, bytearray)) else view
+    suffix = probe.sniff_suffix(view[:_SNIFF_SIZE])
+    if suffix == ".wav":
+        wav = backends.slice_wav(backends.read_wav_format(view), start, end)
+        try:
+            process = backend_obj.play_raw(buffer, wav)
+        except NotImplementedError:
+            pass
+        else:
+            duration = wav.data_size / (wav.frame_size * wav.sample_rate)
+            return Sound(name, block, backend_obj, process=process, duration=duration)
+    elif not segment and _plays_format(backend_obj, suffix):
+        try:
+            process = backend_obj.play_pipe(suffix)
+        except NotImplementedError:
+            pass
+        else:
+            try:
+                duration = probe.probe_buffer(buffer).duration if buffer is not view else None
+            except PlaysoundException:
+                duration = None
+            chunks = backends.iterate_chunks(view)
+            return Sound(name, block, backend_obj, process=backends.PipedPopen(process, chunks), duration=duration)
+
+    return _playsound(_write_data(view, suffix), block, backend, False, start, end)
+
+
+def _write_data(view: memoryview, suffix: str) -> str:
+    """Write sound data to the PCM cache by content hash, for backends that can only play files."""
+    import hashlib
+
+    key = "data-" + hashlib.sha256(view).hexdigest()
+    cached_path = _PCM_CACHE.get(key, suffix)
+    if cached_path is None:
+        with _PCM_CACHE.open_write(key, suffix) as out_file:
+            out_file.write(view)
+        cached_path = _PCM_CACHE.path(key, suffix)
+    return str(cached_path)
+
+
+def _forwards_urls(backend: str | SoundBackend | None) -> bool:
+    """Check if URLs are given to the backend as they are, without downloading them first."""
+    try:
+        return _resolve_backend(backend).accepts_urls
+    except PlaysoundException:
+        return False  # The error is raised after the sound is prepared, as for files
+
+
+def _play_segment(path: str, start: float | None, end: float | None, block: bool, backend: SoundBackend) -> Sound:
+    """Play a part of a file: by seeking in compressed files, if the backend can, otherwise by slicing a WAV file."""
+    if start is not None and end is not None and end < start:
+        raise PlaysoundException(f"end ({end}) is before start ({start})")
+
+    suffix = Path(path).suffix
+    if suffix.lower() != ".wav" and _plays_format(backend, suffix):
+        try:
+            process = backend.play_segment(path, start, end)
+        except NotImplementedError:
+            pass
+        else:
+            return Sound(path, block, backend, process=process, duration=_segment_duration(path, start, end))
+
+    wav_path = path if suffix.lower() == ".wav" else _transcode_to_wav(path)
+    buffer = backends.map_file(wav_path)
+    wav = backends.slice_wav(backends.read_wav_format(buffer), start, end)
+    return _play_wav_slice(wav_path, buffer, wav, block, backend)
+
+
+def _segment_duration(path: str, start: float | None, end: float | None) -> float | None:
+    from playsound3 import probe
+
+    try:
+        total = probe.probe(path).duration
+    except (OSError, PlaysoundException):
+        total = None
+    stop = end if total is None else total if end is None else min(end, total)
+    return None if stop is None else max(0.0, stop - (start or 0.0))
+
+
+def _play_wav_slice(path: str, buffer: Any, wav: backends.WavFormat, block: bool, backend: SoundBackend) -> Sound:
+    """Play the PCM data located by `wav` in the mapped WAV file at `path`.
+
+    Backends that cannot play PCM data play a copy of the part, written to the PCM cache.
+    """
+    duration = wav.data_size / (wav.frame_size * wav.sample_rate)
+    try:
+        process = backend.play_raw(buffer, wav)
+    except NotImplementedError:
+        return Sound(_write_wav_slice(path, buffer, wav), block, backend, duration=duration)
+    return Sound(path, block, backend, process=process, duration=duration)
+
+
+def _write_wav_slice(path: str, buffer: Any, wav: backends.WavFormat) -> str:
+    key = f"{_content_hash(path)}-{wav.data_offset}-{wav.data_size}"
+    cached_path = _PCM_CACHE.get(key, ".wav")
+    if cached_path is None:
+        with _PCM_CACHE.open_write(key, ".wav") as out_file:
+            out_file.write(backends.wav_header(wav, wav.data_size))
+            out_file.write(memoryview(buffer)[wav.data_offset : wav.data_offset + wav.data_size])
+        cached_path = _PCM_CACHE.path(key, ".wav")
+    return str(cached_path)
+
+
+class SoundGroup:
+    """Sounds started together by `play_many`.
+
+    Attributes:
+        sounds: The sounds in the order they were given.
+    """
+
+    def __init__(self, sounds: list[Sound]) -> None:
+        self.sounds = sounds
+
+    def __iter__(self) -> Iterator[Sound]:
+        return iter(self.sounds)
+
+    def __len__(self) -> int:
+        return len(self.sounds)
+
+    def is_alive(self) -> bool:
+        """Check if any of the sounds is still playing."""
+        return any(sound.is_alive() for sound in self.sounds)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until all the sounds finish playing.
+
+        Returns:
+            True if all the sounds finished, False if the timeout passed first.
+        """
+        if timeout is None:
+            for sound in self.sounds:
+                sound.wait()
+            return True
+        return wait_all(self.sounds, timeout)
+
+    def stop(self) -> None:
+        """Stop all the sounds."""
+        for sound in self.sounds:
+            sound.stop()
+
+
+def play_many(
+    sounds: Iterable[str | Path],
+    block: bool = True,
+    backend: str | SoundBackend | None = None,
+    stagger: float = 0.0,
+    max_workers: int = 4,
+) -> SoundGroup:
+    """Play many sound files at the same time.
+
+    All local paths are checked before anything is downloaded, and URLs are downloaded in parallel.
+    Nothing is played unless all the sounds are ready, then they are started one right after another.
+
+    Args:
+        sounds: Paths or URLs of the sound files (strings or pathlib.Path).
+        block: Wait until all the sounds finish playing.
+        backend: Specific audio backend to use. Leave None for automatic selection.
+        stagger: Seconds between the starts of consecutive sounds.
+        max_workers: Maximum number of simultaneous downloads.
+
+    Returns:
+        SoundGroup object for controlling playback of all the sounds.
+    """
+    sounds = list(sounds)
+    local_paths = {sound: _prepare_path(sound) for sound in sounds if not _is_url(sound)}
+    urls = list(dict.fromkeys(str(sound) for sound in sounds if _is_url(sound)))
+    if _forwards_urls(backend):
+        local_paths.update((url, url) for url in urls)
+    elif urls:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            local_paths.update(zip(urls, executor.map(_prepare_path, urls)))
+    backend_obj = _resolve_backend(backend)
+    paths = [_playable_path(local_paths[sound], backend_obj) for sound in sounds]
+
+    started: list[Sound] = []
+    start_time = time.perf_counter()
+    try:
+        for i, path in enumerate(paths):
+            if stagger > 0 and i > 0:
+                time.sleep(max(0.0, start_time + i * stagger - time.perf_counter()))
+            started.append(Sound(path, False, backend_obj))
+    except BaseException:
+        for sound in started:
+            sound.stop()
+        raise
+
+    group = SoundGroup(started)
+    if block:
+        group.wait()
+    return group
+
+
+#############
+## SAMPLES ##
+#############
+
+# Loaded samples, from least to most recently used
+_SAMPLE_CACHE: OrderedDict[tuple[str, int, int], Sample] = OrderedDict()
+_SAMPLE_CACHE_MAX_BYTES = int(os.environ.get("PLAYSOUND3_SAMPLE_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+_SAMPLE_CACHE_LOCK = threading.Lock()
+
+
+class Sample:
+    """Sound decoded to PCM once, which can be played many times with little latency.
+
+    Attributes:
+        name: The path of the decoded sound file.
+        buffer: Bytes-like object holding the PCM data.
+        format: The format and location of the PCM data in the buffer.
+    """
+
+    def __init__(self, name: str, buffer: Any, format: backends.WavFormat) -> None:
+        self.name = name
+        self.buffer = buffer
+        self.format = format
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the PCM data in bytes."""
+        return self.format.data_size
+
+    @property
+    def duration(self) -> float:
+        """Duration of the sound in seconds."""
+        return self.format.data_size / (self.format.frame_size * self.format.sample_rate)
+
+    def play(self, block: bool = True, backend: str | SoundBackend | None = None) -> Sound:
+        """Play the decoded sound.
+
+        The PCM data is handed to the backend directly. Backends that cannot play
+        PCM data (e.g. without support for pipes) play the original file instead.
+
+        Args:
+            block: Wait until sound finishes playing.
+            backend: Specific audio backend to use. Leave None for automatic selection.
+
+        Returns:
+            Sound object for controlling playback.
+        """
+        backend_obj = _resolve_backend(backend)
+        try:
+            process = backend_obj.play_raw(self.buffer, self.format)
+        except NotImplementedError:
+            return Sound(_playable_path(self.name, backend_obj), block, backend_obj)
+        return Sound(self.name, block, backend_obj, process=process)
+
+
+def _decode_sample(path: str) -> tuple[Any, backends.WavFormat]:
+    """Decode integer PCM WAV files with the `wave` module, other formats with ffmpeg."""
+    if Path(path).suffix.lower() == ".wav":
+        import wave
+
+        try:
+            with wave.open(path, "rb") as wav_file:
+                data = bytearray(wav_file.readframes(wav_file.getnframes()))
+                channels, sample_rate, sample_width = (
+                    wav_file.getnchannels(),
+                    wav_file.getframerate(),
+                    wav_file.getsampwidth(),
+                )
+            return data, backends.WavFormat(1, channels, sample_rate, sample_width * 8, 0, len(data))
+        except wave.Error:
+            pass  # For example, float WAV files; let ffmpeg handle them
+
+    buffer = backends.map_file(_transcode_to_wav(path))
+    return buffer, backends.read_wav_format(buffer)
+
+
+def load(sound: str | Path) -> Sample:
+    """Decode a sound file to PCM, so it can be played many times with little latency.
+
+    Loaded samples are cached in memory, up to 64 MiB by default (`PLAYSOUND3_SAMPLE_CACHE_MAX_BYTES`).
+    Loading the same unmodified file again returns the cached sample.
+
+    Args:
+        sound: Path or URL of the sound file (string or pathlib.Path).
+
+    Returns:
+        Sample object that can be played with `sample.play()`.
+    """
+    path = _prepare_path(sound)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+
+    with _SAMPLE_CACHE_LOCK:
+        if key in _SAMPLE_CACHE:
+            _SAMPLE_CACHE.move_to_end(key)
+            return _SAMPLE_CACHE[key]
+
+    sample = Sample(path, *_decode_sample(path))
+    with _SAMPLE_CACHE_LOCK:
+        _SAMPLE_CACHE[key] = sample
+        total_bytes = sum(cached.nbytes for cached in _SAMPLE_CACHE.values())
+        while total_bytes > _SAMPLE_CACHE_MAX_BYTES and len(_SAMPLE_CACHE) > 1:
+            _, evicted = _SAMPLE_CACHE.popitem(last=False)
+            total_bytes -= evicted.nbytes
+    return sample
 
 
 ####################
 ## INITIALIZATION ##
 ####################
 
-atexit.register(_remove_cached_downloads, _DOWNLOAD_CACHE)
-
 _BACKEND_PREFERENCE = [
     "gstreamer",  # Linux; should be installed on every distro
     "wmplayer",  # Windows; requires pywin32 -- should be working well on Windows
@@ -332,21 +1552,149 @@ _BACKEND_PREFERENCE = [
     "afplay",  # macOS; should be installed on every macOS
     "winmm",  # Windows; should be installed on every Windows, but is quirky with variable bitrate MP3s
     "alsa",  # Linux; only supports .mp3 and .wav and might not be installed
+    "alsapcm",  # Linux; only supports .wav -- plays in-process with libasound, so starting sounds is fast
+    "mixer",  # Linux; requires NumPy and aplay (or a custom sink) -- all sounds share one output stream
+    "gstdaemon",  # Linux; requires PyGObject -- one resident process plays all sounds, so starting them is fast
+    "remote",  # Linux and macOS; requires a running `python -m playsound3 serve` -- shares one player between processes
 ]
 
-_BACKEND_MAP: dict[str, SoundBackend] = {
-    name.lower(): obj()
+_BACKEND_CLASSES: dict[str, type[SoundBackend]] = {
+    name.lower(): obj
     for name, obj in globals().items()
     if isinstance(obj, type) and issubclass(obj, SoundBackend) and obj is not SoundBackend
 }
 
-assert sorted(_BACKEND_PREFERENCE) == sorted(_BACKEND_MAP.keys()), "forgot to update _BACKEND_PREFERENCE?"
-AVAILABLE_BACKENDS: list[str] = [name for name in _BACKEND_PREFERENCE if _BACKEND_MAP[name].check()]
-DEFAULT_BACKEND: str | None = _auto_select_backend()
+assert sorted(_BACKEND_PREFERENCE) == sorted(_BACKEND_CLASSES), "forgot to update _BACKEND_PREFERENCE?"
+
+
+def _backend_fingerprint(backend: SoundBackend) -> list[Any]:
+    """Describe the parts of the system that decide whether a backend is available."""
+    fingerprint: list[Any] = [sys.platform, sys.executable, os.environ.get("PATH", "")]
+    locations = [shutil.which(name) for name in backend.executables]
+    for name in backend.modules:
+        spec = find_spec(name)
+        locations.append(spec.origin if spec else None)
+
+    for location in locations:
+        try:
+            mtime = os.stat(location).st_mtime_ns if location else None
+        except OSError:
+            mtime = None
+        fingerprint.append([location, mtime])
+    return fingerprint
+
+
+def _detect_backends() -> list[str]:
+    """Check which backends are available, reusing results cached on disk when possible.
+
+    Backends without a valid cached result are checked in parallel.
+    """
+    cache_path = cache.cache_dir() / "backends.json"
+    cached = cache.load_json(cache_path)
+    if not isinstance(cached, dict):
+        cached = {}
+
+    backend_map: dict[str, SoundBackend] = _lazy_global("_BACKEND_MAP")
+    fingerprints = {name: _backend_fingerprint(obj) for name, obj in backend_map.items()}
+    results: dict[str, bool] = {}
+    for name, fingerprint in fingerprints.items():
+        entry = cached.get(name)
+        if backend_map[name].cache_check and isinstance(entry, dict) and entry.get("fingerprint") == fingerprint:
+            results[name] = bool(entry.get("available"))
+
+    to_check = [name for name in backend_map if name not in results]
+    if to_check:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=len(to_check)) as executor:
+            results.update(zip(to_check, executor.map(lambda name: backend_map[name].check(), to_check)))
+
+        cached = {name: {"fingerprint": fingerprints[name], "available": results[name]} for name in backend_map}
+        cache.save_json(cache_path, cached)
+    return [name for name in dict.fromkeys(_BACKEND_PREFERENCE) if results.get(name)]
+
+
+if TYPE_CHECKING:
+    AVAILABLE_BACKENDS: list[str]
+    DEFAULT_BACKEND: str | None
+    _BACKEND_MAP: dict[str, SoundBackend]
+
+
+def __getattr__(name: str) -> Any:
+    # Backend detection and instantiation are deferred until the first access (PEP 562)
+    # After that, the result is stored as a regular module attribute.
+    if name == "_BACKEND_MAP":
+        globals()[name] = {key: cls() for key, cls in _BACKEND_CLASSES.items()}
+    elif name == "AVAILABLE_BACKENDS":
+        globals()[name] = _detect_backends()
+    elif name == "DEFAULT_BACKEND":
+        globals()[name] = _auto_select_backend()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return globals()[name]
+
+
+def _lazy_global(name: str) -> Any:
+    """Access a lazily computed module attribute from within this module."""
+    return globals()[name] if name in globals() else __getattr__(name)
+
+
+def _calibration_sound() -> str:
+    """Path of a short silent WAV file."""
+    path = cache.cache_dir() / "calibration.wav"
+    if not path.exists():
+        wav = backends.WavFormat(1, 2, 44100, 16, 44, 441 * 4)
+        cache.atomic_write(path, backends.wav_header(wav, wav.data_size) + bytes(wav.data_size))
+    return path.as_posix()
+
+
+def calibrate(sounds: Iterable[str | Path] = (), repeat: int = 3) -> dict[str, dict[str, float]]:
+    """Measure the startup latency of every available backend, to play each format with the fastest one.
+
+    Each backend plays each sound `repeat` times; by default, a short silent WAV file is used.
+    The latency is the time from starting a sound until its player exits, minus the duration of the sound.
+    Results are saved in the cache directory for other processes, and updated from real playbacks.
+    Set `PLAYSOUND3_ROUTING=0` to always use the default backend instead.
+
+    Args:
+        sounds: Paths or URLs of sound files in the formats to calibrate.
+        repeat: Number of measurements of each backend, of which the median is used.
+
+    Returns:
+        Latency in seconds by format suffix and backend name.
+    """
+    from playsound3 import probe
+
+    paths = [_prepare_path(sound) for sound in sounds] or [_calibration_sound()]
+    for path in paths:
+        suffix = Path(path).suffix.lower()
+        try:
+            duration = probe.probe(path).duration or 0.0
+        except PlaysoundException:
+            duration = 0.0
+
+        for name in _lazy_global("AVAILABLE_BACKENDS"):
+            backend_obj = _lazy_global("_BACKEND_MAP")[name]
+            if not _plays_format(backend_obj, suffix):
+                continue
+            latencies = []
+            try:
+                for _ in range(repeat):
+                    start = time.monotonic()
+                    returncode = backend_obj.play(path).wait()
+                    if returncode != 0:
+                        raise PlaysoundException(f"the player exited with code {returncode}")
+                    latencies.append(time.monotonic() - start - duration)
+            except (OSError, PlaysoundException) as e:
+                _logger().warning(f"could not calibrate the {name} backend: {e}")
+                _ROUTER.discard(suffix, name)
+                continue
+            _ROUTER.set(suffix, name, max(0.0, sorted(latencies)[len(latencies) // 2]))
+
+    _ROUTER.save()
+    return _ROUTER.latencies()
 
 
-# This function is defined here at the bottom because of:
-# SyntaxError: annotated name 'DEFAULT_BACKEND' can't be global
 def prefer_backends(*backends: str) -> str | None:
     """Add backends to the top of the preference list.
 
@@ -355,6 +1703,7 @@ def prefer_backends(*backends: str) -> str | None:
     This means this function can be used to update the preference for a
     specific platform without breaking the cross-platform functionality.
     After updating the preferences, the new default backend is returned.
+    The default backend is then used for all formats, even if another one was measured faster by `calibrate`.
 
     Args:
         backends: Names of the backends to prefer.
@@ -362,8 +1711,9 @@ def prefer_backends(*backends: str) -> str | None:
     Returns:
         Name of the newly selected default backend.
     """
-    global DEFAULT_BACKEND, _BACKEND_PREFERENCE
+    global DEFAULT_BACKEND, _BACKEND_PREFERENCE, _ROUTING
 
+    _ROUTING = False
     _BACKEND_PREFERENCE = list(backends) + _BACKEND_PREFERENCE
     DEFAULT_BACKEND = _auto_select_backend()
     return DEFAULT_BACKEND
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+from pathlib import Path
+from typing import NamedTuple
+
+from playsound3.backends import PlaysoundException
+from playsound3.playsound3 import Sound, SoundBackend, _prepare_path, playsound
+
+logger = logging.getLogger(__name__)
+
+POLICIES = ("steal-oldest", "drop-lowest", "reject")
+
+
+class _Request(NamedTuple):
+    priority: int
+    order: int
+    path: str
+    backend: str | SoundBackend | None
+
+
+class _Voice:
+    def __init__(self, request: _Request) -> None:
+        self.request = request
+        self.sound: Sound | None = None  # None while the player is starting
+
+
+class SoundPool:
+    """Plays sounds with a limit on the number of voices playing at the same time.
+
+    When all voices are busy, a new sound takes the voice of a playing sound according to the policy:
+        - "steal-oldest" (default): stop the oldest sound with the same or lower priority.
+        - "drop-lowest": stop the sound with the lowest priority, if it is lower than the new sound's.
+        - "reject": never stop playing sounds.
+
+    If no voice can be taken, the sound waits in a queue of at most `max_queue` sounds, ordered by priority.
+    When the queue is full, the sound with the lowest priority is dropped.
+
+    Attributes:
+        stats: Numbers of sounds played, stolen (stopped to free a voice), queued and dropped.
+    """
+
+    def __init__(
+        self,
+        max_voices: int = 8,
+        policy: str = "steal-oldest",
+        max_queue: int = 0,
+        backend: str | SoundBackend | None = None,
+    ) -> None:
+        if max_voices < 1:
+            raise PlaysoundException("max_voices has to be at least 1")
+        if policy not in POLICIES:
+            raise PlaysoundException(f"unknown policy '{policy}', use one of: {', '.join(POLICIES)}")
+
+        self.max_voices = max_voices
+        self.policy = policy
+        self.max_queue = max_queue
+        self.backend = backend
+        self.stats = {"played": 0, "stolen": 0, "queued": 0, "dropped": 0}
+
+        self._voices: list[_Voice] = []
+        self._queue: list[_Request] = []
+        self._order = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def active(self) -> list[Sound]:
+        """Sounds currently playing in the pool."""
+        with self._lock:
+            return [voice.sound for voice in self._voices if voice.sound is not None]
+
+    def play(
+        self,
+        sound: str | Path,
+        priority: int = 0,
+        backend: str | SoundBackend | None = None,
+    ) -> Sound | None:
+        """Play a sound in the background if a voice is available.
+
+        Args:
+            sound: Path or URL of the sound file (string or pathlib.Path).
+            priority: Sounds with higher priority take voices from sounds with lower priority.
+            backend: Specific audio backend to use. Leave None to use the pool's backend.
+
+        Returns:
+            Sound object, or None if the sound was queued or dropped.
+        """
+        # URLs are downloaded here, so that queued sounds start without delay
+        path = str(_prepare_path(sound))
+        request = _Request(priority, next(self._order), path, backend or self.backend)
+
+        with self._lock:
+            voice, stolen = self._admit(request)
+
+        if stolen is not None and stolen.sound is not None:
+            stolen.sound.stop()
+        if voice is None:
+            return None
+        return self._start(voice)
+
+    def stop_all(self) -> None:
+        """Stop all sounds in the pool and clear the queue."""
+        with self._lock:
+            self._queue.clear()
+            voices, self._voices = self._voices, []
+        for voice in voices:
+            if voice.sound is not None:
+                voice.sound.stop()
+
+    def _admit(self, request: _Request) -> tuple[_Voice | None, _Voice | None]:
+        """Return the voice reserved for the request and the voice stolen for it. Called with the lock held."""
+        if len(self._voices) < self.max_voices:
+            return self._reserve(request), None
+
+        stolen = self._choose_victim(request)
+        if stolen is not None:
+            self._voices.remove(stolen)
+            self.stats["stolen"] += 1
+            return self._reserve(request), stolen
+
+        if self.max_queue > 0:
+            heapq.heappush(self._queue, _queue_key(request))
+            self.stats["queued"] += 1
+            if len(self._queue) > self.max_queue:
+                lowest = max(self._queue)
+                self._queue.remove(lowest)
+                heapq.heapify(self._queue)
+                self.stats["dropped"] += 1
+            return None, None
+
+        self.stats["dropped"] += 1
+        return None, None
+
+    def _choose_victim(self, request: _Request) -> _Voice | None:
+        playing = [voice for voice in self._voices if voice.sound is not None]
+        if self.policy == "steal-oldest":
+            candidates = [voice for voice in playing if voice.request.priority <= request.priority]
+            return min(candidates, key=lambda voice: voice.request.order, default=None)
+        if self.policy == "drop-lowest":
+            lowest = min(playing, key=lambda voice: (voice.request.priority, voice.request.order), default=None)
+            if lowest is not None and lowest.request.priority < request.priority:
+                return lowest
+        return None
+
+    def _reserve(self, request: _Request) -> _Voice:
+        voice = _Voice(request)
+        self._voices.append(voice)
+        return voice
+
+    def _start(self, voice: _Voice) -> Sound:
+        request = voice.request
+        try:
+            sound = playsound(request.path, block=False, backend=request.backend)
+        except BaseException:
+            self._release(voice)
+            raise
+
+        with self._lock:
+            voice.sound = sound
+            self.stats["played"] += 1
+        sound.on_finish(lambda _: self._release(voice))
+        return sound
+
+    def _release(self, voice: _Voice) -> None:
+        """Free the voice and start the next queued sound."""
+        with self._lock:
+            if voice in self._voices:
+                self._voices.remove(voice)
+            if not self._queue or len(self._voices) >= self.max_voices:
+                return
+            next_voice = self._reserve(_queue_key(heapq.heappop(self._queue)))
+
+        try:
+            self._start(next_voice)
+        except Exception:
+            # Called from the watcher thread, so there is nobody to raise to
+            logger.exception(f"could not play queued sound {next_voice.request.path}")
+
+
+def _queue_key(request: _Request) -> _Request:
+    """Queue order is highest priority first, then first in first out. The key is its own inverse."""
+    return request._replace(priority=-request.priority)
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from playsound3.backends import PlaysoundException, read_wav_format
+
+
+class AudioInfo(NamedTuple):
+    """Format of a sound file, read from its headers."""
+
+    codec: str  # "pcm", "float", "alaw", "mulaw", "flac", "mp1", "mp2", "mp3", "vorbis" or "opus"
+    sample_rate: int
+    channels: int
+    duration: float | None  # None if the headers do not tell
+
+
+_WAV_CODECS = {1: "pcm", 3: "float", 6: "alaw", 7: "mulaw"}
+
+# Bitrates in kbps by (MPEG-1, layer) and (MPEG-2/2.5, layer)
+_MPEG_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Sample rates by the version bits of the frame header: MPEG-2.5, reserved, MPEG-2, MPEG-1
+_MPEG_SAMPLE_RATES = {0: (11025, 12000, 8000), 2: (22050, 24000, 16000), 3: (44100, 48000, 32000)}
+
+# MP3 frames are looked for in this many bytes after the ID3 tag
+_MPEG_SYNC_SEARCH = 64 * 1024
+
+# The last Ogg page, holding the total number of samples, is looked for in this many bytes at the end of the file
+_OGG_TAIL = 64 * 1024
+
+
+def _skip_id3(buffer: Any) -> int:
+    """Offset of the audio data after an ID3v2 tag, if the file starts with one."""
+    if buffer[:3] != b"ID3" or len(buffer) < 10:
+        return 0
+    size = 0
+    for byte in buffer[6:10]:
+        size = (size << 7) | (byte & 0x7F)
+    footer = 10 if buffer[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def _probe_wav(buffer: Any) -> AudioInfo:
+    wav = read_wav_format(buffer)
+    codec = _WAV_CODECS.get(wav.audio_format, f"wav-{wav.audio_format}")
+    duration = wav.data_size / (wav.sample_rate * wav.frame_size) if wav.sample_rate and wav.frame_size else None
+    return AudioInfo(codec, wav.sample_rate, wav.channels, duration)
+
+
+def _probe_flac(buffer: Any, offset: int) -> AudioInfo:
+    # STREAMINFO is always the first metadata block; the fields below are bit-packed after the block sizes
+    (packed,) = struct.unpack_from(">Q", buffer, offset + 4 + 4 + 10)
+    sample_rate = packed >> 44
+    channels = ((packed >> 41) & 0x7) + 1
+    total_samples = packed & 0xFFFFFFFFF
+    duration = total_samples / sample_rate if total_samples and sample_rate else None
+    return AudioInfo("flac", sample_rate, channels, duration)
+
+
+def _probe_ogg(buffer: Any) -> AudioInfo:
+    # The identification header is the first packet, after the page header and its segment table
+    packet = 27 + buffer[26]
+    if buffer[packet : packet + 7] == b"\x01vorbis":
+        channels = buffer[packet + 11]
+        (sample_rate,) = struct.unpack_from("<I", buffer, packet + 12)
+        codec, rate, pre_skip = "vorbis", sample_rate, 0
+    elif buffer[packet : packet + 8] == b"OpusHead":
+        channels = buffer[packet + 9]
+        (pre_skip, sample_rate) = struct.unpack_from("<HI", buffer, packet + 10)
+        codec, rate = "opus", 48000  # Opus granule positions always count 48 kHz samples
+    else:
+        raise PlaysoundException("unsupported Ogg codec")
+
+    duration = None
+    last_page = buffer.rfind(b"OggS", max(0, len(buffer) - _OGG_TAIL))
+    if last_page >= 0 and last_page + 14 <= len(buffer):
+        (granule,) = struct.unpack_from("<q", buffer, last_page + 6)
+        if granule > pre_skip:
+            duration = (granule - pre_skip) / rate
+    return AudioInfo(codec, sample_rate, channels, duration)
+
+
+def _probe_mpeg(buffer: Any, start: int) -> AudioInfo:
+    end = min(len(buffer) - 4, start + _MPEG_SYNC_SEARCH)
+    offset = buffer.find(b"\xff", start, end)
+    while True:
+        if offset < 0:
+            raise PlaysoundException("no MPEG audio frame found")
+        (header,) = struct.unpack_from(">I", buffer, offset)
+        version, layer_bits = (header >> 19) & 0x3, (header >> 17) & 0x3
+        bitrate_index, rate_index = (header >> 12) & 0xF, (header >> 10) & 0x3
+        if (header >> 21) == 0x7FF and version != 1 and layer_bits != 0 and bitrate_index != 15 and rate_index != 3:
+            break
+        offset = buffer.find(b"\xff", offset + 1, end)
+
+    mpeg1 = version == 3
+    layer = 4 - layer_bits
+    sample_rate = _MPEG_SAMPLE_RATES[version][rate_index]
+    channels = 1 if (header >> 6) & 0x3 == 3 else 2
+    samples_per_frame = 384 if layer == 1 else 1152 if layer == 2 or mpeg1 else 576
+    codec = f"mp{layer}"
+
+    # VBR files have the number of frames in a Xing/Info or VBRI header inside the first frame
+    side_info = (32 if channels == 2 else 17) if mpeg1 else (17 if channels == 2 else 9)
+    xing = offset + 4 + side_info
+    if buffer[xing : xing + 4] in (b"Xing", b"Info"):
+        (flags,) = struct.unpack_from(">I", buffer, xing + 4)
+        if flags & 0x1:
+            (frames,) = struct.unpack_from(">I", buffer, xing + 8)
+            return AudioInfo(codec, sample_rate, channels, frames * samples_per_frame / sample_rate)
+    vbri = offset + 4 + 32
+    if buffer[vbri : vbri + 4] == b"VBRI":
+        (frames,) = struct.unpack_from(">I", buffer, vbri + 14)
+        return AudioInfo(codec, sample_rate, channels, frames * samples_per_frame / sample_rate)
+
+    # Otherwise assume a constant bitrate
+    bitrate = _MPEG_BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    audio_size = len(buffer) - offset - (128 if buffer[-128:-125] == b"TAG" else 0)
+    duration = audio_size * 8 / bitrate if bitrate else None
+    return AudioInfo(codec, sample_rate, channels, duration)
+
+
+def probe_buffer(buffer: Any) -> AudioInfo:
+    """Read the format of a WAV, FLAC, MP3 or Ogg (Vorbis, Opus) file held in a bytes-like object, e.g. mmap.
+
+    Only the headers are read, and for some files the end of the data.
+    """
+    if buffer[:4] == b"RIFF":
+        return _probe_wav(buffer)
+    if buffer[:4] == b"OggS":
+        return _probe_ogg(buffer)
+
+    start = _skip_id3(buffer)
+    if buffer[start : start + 4] == b"fLaC":
+        return _probe_flac(buffer, start)
+    if start or buffer[:1] == b"\xff":
+        return _probe_mpeg(buffer, start)
+    raise PlaysoundException("unrecognized audio format")
+
+
+def sniff_suffix(head: Any) -> str:
+    """Guess the file suffix of a WAV, FLAC, MP3 or Ogg sound from its first bytes, e.g. for data held in memory."""
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return ".wav"
+    if head[:4] == b"OggS":
+        return ".ogg"
+    start = _skip_id3(head)
+    if head[start : start + 4] == b"fLaC":
+        return ".flac"
+    if start or head[:1] == b"\xff":
+        return ".mp3"
+    raise PlaysoundException("unrecognized audio format")
+
+
+# Probed files by path, modification time and size, from least to most recently used
+_INDEX: OrderedDict[tuple[str, int, int], AudioInfo] = OrderedDict()
+_INDEX_MAX_ENTRIES = 4096
+_INDEX_LOCK = threading.Lock()
+
+
+def probe(sound: str | Path) -> AudioInfo:
+    """Read the format and duration of a local sound file from its headers, without decoding it.
+
+    Results are kept in memory until the file changes.
+
+    Raises:
+        PlaysoundException: If the format is not recognized or the file is damaged.
+    """
+    path = os.path.abspath(sound)
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    with _INDEX_LOCK:
+        if key in _INDEX:
+            _INDEX.move_to_end(key)
+            return _INDEX[key]
+
+    if stat.st_size == 0:
+        raise PlaysoundException(f"empty file: {sound}")
+    # Mapping the file reads only the pages that are accessed
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        try:
+            info = probe_buffer(buffer)
+        except (struct.error, IndexError, KeyError, ZeroDivisionError) as e:
+            raise PlaysoundException(f"damaged or unsupported sound file: {sound}") from e
+        except PlaysoundException as e:
+            raise PlaysoundException(f"{e}: {sound}") from e
+
+    with _INDEX_LOCK:
+        _INDEX[key] = info
+        while len(_INDEX) > _INDEX_MAX_ENTRIES:
+            _INDEX.popitem(last=False)
+    return info
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import atexit
+import threading
+from pathlib import Path
+from typing import Callable, Iterable
+
+from playsound3 import cache
+
+# Weight of a new measurement in the moving average of a backend's latency
+ALPHA = 0.2
+
+
+class Router:
+    """Table of measured startup latencies of backends by sound format, used to pick the fastest backend.
+
+    Latency is the time from starting a sound to its player exiting, minus the duration of the sound.
+    The table is loaded from a JSON file on first use and saved when the process exits, if it changed.
+    The path of the file can be given as a function, like the directory of a `cache.DiskCache`.
+    """
+
+    def __init__(self, path: Path | Callable[[], Path]) -> None:
+        self._path = path
+        self._latencies: dict[str, dict[str, float]] | None = None
+        self._changed = False
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> Path:
+        return self._path() if callable(self._path) else self._path
+
+    def _table(self) -> dict[str, dict[str, float]]:
+        """Return the table, loading it on the first call. Must be called with the lock held."""
+        if self._latencies is None:
+            data = cache.load_json(self.path)
+            self._latencies = {}
+            if isinstance(data, dict):
+                for suffix, latencies in data.items():
+                    if isinstance(latencies, dict):
+                        self._latencies[suffix] = {
+                            name: float(value) for name, value in latencies.items() if isinstance(value, (int, float))
+                        }
+            atexit.register(self.save)
+        return self._latencies
+
+    def latencies(self) -> dict[str, dict[str, float]]:
+        """Copy of the table: latency in seconds by format suffix and backend name."""
+        with self._lock:
+            return {suffix: dict(latencies) for suffix, latencies in self._table().items()}
+
+    def measured(self, suffix: str) -> bool:
+        """Check if any latencies were measured for the format."""
+        with self._lock:
+            return bool(self._table().get(suffix.lower()))
+
+    def choose(self, suffix: str, candidates: Iterable[str], default: str | None) -> str | None:
+        """Return the candidate with the lowest latency for the format.
+
+        The default is kept if it is a candidate that was not measured, or if no candidate was measured.
+        """
+        with self._lock:
+            latencies = dict(self._table().get(suffix.lower(), {}))
+        candidates = list(candidates)
+        measured = [name for name in candidates if name in latencies]
+        if not measured or (default in candidates and default not in latencies):
+            return default
+        return min(measured, key=lambda name: (latencies[name], name != default))
+
+    def set(self, suffix: str, backend: str, latency: float) -> None:
+        """Replace the latency of a backend for a format, e.g. after calibration."""
+        with self._lock:
+            self._table().setdefault(suffix.lower(), {})[backend] = latency
+            self._changed = True
+
+    def discard(self, suffix: str, backend: str) -> None:
+        """Remove the latency of a backend for a format, e.g. if its player fails."""
+        with self._lock:
+            latencies = self._table().get(suffix.lower(), {})
+            if latencies.pop(backend, None) is not None:
+                self._changed = True
+
+    def observe(self, suffix: str, backend: str, latency: float) -> None:
+        """Update the moving average latency of a backend with a measurement from a real playback."""
+        with self._lock:
+            latencies = self._table().setdefault(suffix.lower(), {})
+            previous = latencies.get(backend)
+            latencies[backend] = latency if previous is None else (1 - ALPHA) * previous + ALPHA * latency
+            self._changed = True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._table().clear()
+            self._changed = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._changed or self._latencies is None:
+                return
+            cache.save_json(self.path, self._latencies)
+            self._changed = False
@@ -0,0 +1,191 @@
+"""Playback server shared by many processes, used by the `remote` backend.
+
+Started with `python -m playsound3 serve`, it listens on a Unix socket (`PLAYSOUND3_SERVER`, by default
+`server.sock` in the cache directory). Clients send commands and receive finished sounds, one JSON object per line:
+
+    {"cmd": "play", "id": 1, "sound": "/path/to/sound.mp3"}
+    {"cmd": "play", "id": 2, "sound": "https://url/to/sound.mp3", "start": 0.5, "end": 1.0}
+    {"cmd": "stop", "id": 1}
+    {"event": "done", "id": 1, "code": 0}
+    {"event": "done", "id": 2, "code": 1, "error": "file not found: ..."}
+
+Commands that arrive together are handled as a batch: their sounds are downloaded in parallel, then started
+one right after another. All clients share the server's backend, download and transcode caches, and decoded
+samples. Sounds keep playing when their client disconnects, as players spawned by the client would.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from playsound3.backends import PlaysoundException
+from playsound3.playsound3 import (
+    Sound,
+    SoundBackend,
+    _auto_select_backend,
+    _play_segment,
+    _playable_path,
+    _prepare_path,
+    _resolve_backend,
+    _server_address,
+    load,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class _Client:
+    """Connection to one client process and its playing sounds."""
+
+    def __init__(self, conn: socket.socket) -> None:
+        self.conn = conn
+        self.sounds: dict[int, Sound] = {}
+        self.lock = threading.Lock()
+
+    def report(self, sound_id: int, code: int, error: str | None = None) -> None:
+        event: dict[str, Any] = {"event": "done", "id": sound_id, "code": code}
+        if error is not None:
+            event["error"] = error
+        with self.lock:
+            self.sounds.pop(sound_id, None)
+            try:
+                self.conn.sendall(json.dumps(event).encode() + b"\n")
+            except OSError:
+                pass  # The client disconnected and is not waiting for its sounds
+
+
+class Server:
+    """Plays sounds sent by clients over a Unix socket with a single backend."""
+
+    def __init__(self, address: str, backend: str | SoundBackend | None = None, max_workers: int = 8) -> None:
+        self.address = address
+        self.backend = _resolve_backend(backend)
+        if self.backend.accepts_urls:
+            raise PlaysoundException(f"the server cannot use the {type(self.backend).__name__.lower()} backend")
+        # In-process backends play decoded samples straight from memory, so sounds are decoded once
+        self._plays_samples = type(self.backend).play_raw is not SoundBackend.play_raw
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._listener: socket.socket | None = None
+
+    def serve_forever(self) -> None:
+        """Accept clients until `close()` is called."""
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if os.path.exists(self.address):
+            # A socket left behind by a server that did not exit cleanly
+            os.unlink(self.address)
+        listener.bind(self.address)
+        listener.listen()
+        self._listener = listener
+        logger.info(f"playback server listening on {self.address}")
+        try:
+            while True:
+                try:
+                    conn, _ = listener.accept()
+                except OSError:
+                    break  # Closed
+                threading.Thread(target=self._handle, args=(_Client(conn),), daemon=True).start()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+            try:
+                os.unlink(self.address)
+            except FileNotFoundError:
+                pass
+        self._executor.shutdown(wait=False)
+
+    def _handle(self, client: _Client) -> None:
+        buffer = b""
+        try:
+            while True:
+                data = client.conn.recv(64 * 1024)
+                if not data:
+                    break
+                *lines, buffer = (buffer + data).split(b"\n")
+                commands = []
+                for line in lines:
+                    try:
+                        commands.append(json.loads(line))
+                    except ValueError:
+                        logger.warning(f"invalid command from a client: {line!r}")
+                self._run_batch(client, commands)
+        except OSError:
+            pass
+        finally:
+            client.conn.close()
+
+    def _run_batch(self, client: _Client, commands: list[dict[str, Any]]) -> None:
+        # Sounds of the batch are downloaded in parallel, and started in order
+        paths = {
+            command["id"]: self._executor.submit(_prepare_path, command["sound"])
+            for command in commands
+            if command.get("cmd") == "play"
+        }
+        for command in commands:
+            if command.get("cmd") == "play":
+                self._play(client, command, paths[command["id"]])
+            elif command.get("cmd") == "stop":
+                with client.lock:
+                    sound = client.sounds.get(command["id"])
+                if sound is not None:
+                    sound.stop()
+
+    def _play(self, client: _Client, command: dict[str, Any], path: Future[str]) -> None:
+        sound_id = command["id"]
+        try:
+            sound = self._start(path.result(), command.get("start"), command.get("end"))
+        except Exception as e:
+            logger.warning(f"could not play {command['sound']}: {e}")
+            client.report(sound_id, 1, str(e))
+            return
+
+        with client.lock:
+            client.sounds[sound_id] = sound
+        sound.on_finish(lambda sound: client.report(sound_id, _returncode(sound)))
+
+    def _start(self, path: str, start: float | None, end: float | None) -> Sound:
+        if start is not None or end is not None:
+            return _play_segment(path, start, end, False, self.backend)
+        if self._plays_samples:
+            try:
+                return load(path).play(block=False, backend=self.backend)
+            except PlaysoundException:
+                pass  # For example, ffmpeg is not installed; the file is played as usual
+        return Sound(_playable_path(path, self.backend), False, self.backend)
+
+
+def _returncode(sound: Sound) -> int:
+    code = sound.subprocess.poll()
+    return 0 if code is None else code
+
+
+def serve(address: str | None = None, backend: str | None = None) -> None:
+    """Run a playback server until it is interrupted or terminated.
+
+    Args:
+        address: Path of the Unix socket. Leave None to use `PLAYSOUND3_SERVER` or the cache directory.
+        backend: Backend playing the sounds. Leave None for automatic selection.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise PlaysoundException("the playback server requires Unix sockets")
+    if backend is None:
+        backend = _auto_select_backend()
+    server = Server(address or _server_address(), backend)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Iterator, Mapping
+
+from playsound3 import backends
+from playsound3.backends import PlaysoundException
+from playsound3.playsound3 import (
+    Sound,
+    SoundBackend,
+    _play_wav_slice,
+    _prepare_path,
+    _resolve_backend,
+    _transcode_to_wav,
+)
+
+
+class SpriteSheet:
+    """Many short sounds ("sprites") packed into one sound file and played by time ranges.
+
+    The file is opened, decoded to WAV if needed and memory-mapped once; playing a sprite hands
+    a slice of the mapped data to the backend, so no file is opened and nothing is decoded per sprite.
+
+    Attributes:
+        name: The path of the WAV file the sprites are played from.
+        sprites: Start and end, in seconds, of each sprite by its name.
+        format: The format and location of the PCM data of the whole file.
+    """
+
+    def __init__(self, sound: str | Path, sprites: Mapping[str, tuple[float, float]]) -> None:
+        path = _prepare_path(sound)
+        self.name = path if Path(path).suffix.lower() == ".wav" else _transcode_to_wav(path)
+        self.sprites = {name: (float(start), float(end)) for name, (start, end) in sprites.items()}
+        self._buffer = backends.map_file(self.name)
+        self.format = backends.read_wav_format(self._buffer)
+
+    @classmethod
+    def from_manifest(cls, manifest: str | Path) -> SpriteSheet:
+        """Load a sprite sheet described by a JSON manifest, in the format written by the `audiosprite` tool.
+
+        The manifest lists the packed files in "resources" (relative to the manifest) and the sprites
+        in "spritemap", e.g. `{"resources": ["ui.wav"], "spritemap": {"click": {"start": 0.0, "end": 0.1}}}`.
+        A WAV file is used if one is listed, otherwise the first file.
+        """
+        try:
+            with open(manifest, encoding="utf-8") as f:
+                data = json.load(f)
+            resources = [Path(manifest).parent / resource for resource in data["resources"]]
+            sprites = {name: (sprite["start"], sprite["end"]) for name, sprite in data["spritemap"].items()}
+        except (KeyError, TypeError, ValueError) as e:
+            raise PlaysoundException(f"invalid sprite manifest {manifest}: {e!r}") from e
+        if not resources:
+            raise PlaysoundException(f"invalid sprite manifest {manifest}: no resources")
+
+        wav_resources = [resource for resource in resources if resource.suffix.lower() == ".wav"]
+        return cls((wav_resources or resources)[0], sprites)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.sprites
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.sprites)
+
+    def __len__(self) -> int:
+        return len(self.sprites)
+
+    def play(self, name: str, block: bool = True, backend: str | SoundBackend | None = None) -> Sound:
+        """Play one sprite.
+
+        Args:
+            name: Name of the sprite.
+            block: Wait until the sprite finishes playing.
+            backend: Specific audio backend to use. Leave None for automatic selection.
+
+        Returns:
+            Sound object for controlling playback.
+        """
+        if name not in self.sprites:
+            raise PlaysoundException(f"no sprite named {name!r}")
+        start, end = self.sprites[name]
+        wav = backends.slice_wav(self.format, start, end)
+        return _play_wav_slice(self.name, self._buffer, wav, block, _resolve_backend(backend))
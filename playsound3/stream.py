@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, AsyncIterable, Iterable
+
+from playsound3 import backends
+from playsound3.backends import PlaysoundException
+from playsound3.playsound3 import Sound, SoundBackend, _resolve_backend
+
+if TYPE_CHECKING:
+    from playsound3.aio import AsyncSound
+
+logger = logging.getLogger(__name__)
+
+
+class PcmStream:
+    """Plays raw PCM chunks from an iterator or async iterator while they are being produced.
+
+    Chunks go through a ring buffer holding `buffer_seconds` of audio: playback starts with the first chunk,
+    the producer is paused while the buffer is full, and memory use does not grow with the length of the stream.
+    Chunks can be any bytes-like objects, e.g. bytes or NumPy arrays, with little-endian interleaved samples.
+
+    Attributes:
+        format: The format of the PCM data.
+        stats: Numbers of bytes played, of times the producer waited for the player ("stalls"),
+            and of times the player ran out of data before the end of the stream ("underruns").
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[Any] | AsyncIterable[Any],
+        sample_rate: int,
+        channels: int = 1,
+        sample_width: int = 2,
+        buffer_seconds: float = 0.5,
+    ) -> None:
+        if sample_width not in (1, 2, 3, 4):
+            raise PlaysoundException(f"unsupported sample width: {sample_width}")
+        self.chunks = chunks
+        self.format = backends.WavFormat(1, channels, sample_rate, sample_width * 8, 0, 0)
+        frames = max(1, int(buffer_seconds * sample_rate))
+        self._buffer = backends.RingBuffer(frames * self.format.frame_size)
+        self._started = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return self._buffer.stats
+
+    def play(self, block: bool = True, backend: str | SoundBackend | None = None) -> Sound:
+        """Start playing the stream; it can be played only once.
+
+        Sync iterators are read by a background thread. Async iterators are read by a task of the running
+        event loop, so they can only be played from asyncio code with `block=False`, or with `play_async()`.
+
+        Args:
+            block: Wait until the stream ends and finishes playing.
+            backend: Specific audio backend to use. Leave None for automatic selection.
+                The backend has to read from a pipe (e.g. gstreamer, ffplay, alsa) or play in-process (mixer).
+
+        Returns:
+            Sound object for controlling playback.
+        """
+        if block and hasattr(self.chunks, "__aiter__"):
+            raise PlaysoundException("async iterators cannot be played with block=True, use play_async()")
+        sound = self._start(_resolve_backend(backend))
+        if block:
+            sound.wait()
+        return sound
+
+    async def play_async(self, block: bool = True, backend: str | SoundBackend | None = None) -> AsyncSound:
+        """Play the stream from asyncio code, see `play()`.
+
+        Returns:
+            AsyncSound object for controlling playback.
+        """
+        from playsound3.aio import AsyncSound
+
+        backend_obj = _resolve_backend(backend)
+        async_sound = AsyncSound(backend_obj, self._start(backend_obj).subprocess)
+        if block:
+            await async_sound.wait()
+        return async_sound
+
+    def _start(self, backend: SoundBackend) -> Sound:
+        loop = None
+        if hasattr(self.chunks, "__aiter__"):
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise PlaysoundException("async iterators can only be played from a running event loop") from None
+        if self._started:
+            raise PlaysoundException("the stream was already played")
+        self._started = True
+
+        try:
+            process = backend.play_stream(self._buffer, self.format)
+        except NotImplementedError:
+            raise PlaysoundException(f"{type(backend).__name__} backend cannot play streams") from None
+
+        if loop is not None:
+            self._task = loop.create_task(self._produce_async())
+        else:
+            threading.Thread(target=self._produce, daemon=True).start()
+        sound = Sound("<pcm stream>", block=False, backend=backend, process=process)
+        # Stopping the player stops the producer
+        sound.on_finish(lambda _: self._buffer.close())
+        return sound
+
+    def _produce(self) -> None:
+        chunks = iter(self.chunks)  # type: ignore[arg-type]
+        try:
+            for chunk in chunks:
+                view = memoryview(chunk).cast("B")
+                if self._buffer.write(view) < len(view):
+                    break  # The player stopped
+        except Exception:
+            logger.exception("exception in a PCM stream")
+        finally:
+            self._buffer.end()
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+    async def _produce_async(self) -> None:
+        loop = asyncio.get_running_loop()
+        chunks = self.chunks.__aiter__()  # type: ignore[union-attr]
+        try:
+            async for chunk in chunks:
+                view = memoryview(chunk).cast("B")
+                written = self._buffer.write(view, block=False)
+                if written < len(view):
+                    # The buffer is full: wait for the player in a thread, so the event loop keeps running
+                    written += await loop.run_in_executor(None, self._buffer.write, view[written:])
+                if written < len(view):
+                    break  # The player stopped
+        except Exception:
+            logger.exception("exception in a PCM stream")
+        finally:
+            self._buffer.end()
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                await aclose()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import os
+import selectors
+import subprocess
+import threading
+from typing import TYPE_CHECKING, Any, Callable
+
+from playsound3.backends import WAIT_TIME
+
+if TYPE_CHECKING:
+    import logging
+
+
+def _logger() -> logging.Logger:
+    import logging
+
+    return logging.getLogger(__name__)
+
+
+class Watcher:
+    """Background thread reporting when players finish, shared by all sounds.
+
+    Popen-like objects with `add_done_callback` report their completion themselves.
+    Player processes are watched with pidfds on Linux, so the thread wakes up only when one of them exits.
+    Other players are polled together, every `WAIT_TIME` seconds, only while there are any.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._selector: selectors.BaseSelector | None = None
+        self._wakeup_read, self._wakeup_write = -1, -1
+        self._polled: list[tuple[Any, Callable[[], Any]]] = []
+        self._thread: threading.Thread | None = None
+
+    def watch(self, process: Any, callback: Callable[[], Any]) -> None:
+        """Call `callback` once the Popen-like object finishes."""
+        if hasattr(process, "add_done_callback"):
+            process.add_done_callback(callback)
+            return
+
+        # For example, a player reading from a pipe
+        process = getattr(process, "process", process)
+        if isinstance(process, subprocess.Popen) and self._watch_pidfd(process, callback):
+            return
+
+        with self._lock:
+            self._polled.append((process, callback))
+            self._start()
+        self._wakeup()
+
+    def _watch_pidfd(self, process: subprocess.Popen[bytes], callback: Callable[[], Any]) -> bool:
+        if not hasattr(os, "pidfd_open") or process.returncode is not None:
+            return False
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except OSError:
+            return False
+
+        # The process might have been reaped before its pidfd was opened
+        if process.poll() is not None:
+            os.close(pidfd)
+            return False
+
+        with self._lock:
+            self._start()
+            assert self._selector is not None
+            self._selector.register(pidfd, selectors.EVENT_READ, (process, callback))
+        self._wakeup()
+        return True
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_read, self._wakeup_write = os.pipe()
+        os.set_blocking(self._wakeup_read, False)
+        self._selector.register(self._wakeup_read, selectors.EVENT_READ)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _wakeup(self) -> None:
+        try:
+            os.write(self._wakeup_write, b"\0")
+        except BlockingIOError:
+            pass
+
+    def _run(self) -> None:
+        assert self._selector is not None
+        while True:
+            timeout = WAIT_TIME if self._polled else None
+            finished: list[Callable[[], Any]] = []
+
+            for key, _ in self._selector.select(timeout):
+                if key.fd == self._wakeup_read:
+                    try:
+                        os.read(self._wakeup_read, 4096)
+                    except BlockingIOError:
+                        pass
+                    continue
+                process, callback = key.data
+                with self._lock:
+                    self._selector.unregister(key.fd)
+                os.close(key.fd)
+                process.poll()  # Reap the process
+                finished.append(callback)
+
+            with self._lock:
+                still_playing = []
+                for process, callback in self._polled:
+                    if process.poll() is None:
+                        still_playing.append((process, callback))
+                    else:
+                        finished.append(callback)
+                self._polled = still_playing
+
+            for callback in finished:
+                try:
+                    callback()
+                except Exception:
+                    _logger().exception("exception in a callback of a finished sound")
+
+
+_WATCHER = Watcher()
+
+
+def watch(process: Any, callback: Callable[[], Any]) -> None:
+    """Call `callback` once the Popen-like object finishes, using the shared watcher."""
+    _WATCHER.watch(process, callback)
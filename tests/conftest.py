@@ -0,0 +1,123 @@
+import functools
+import http.server
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from playsound3 import playsound3
+from playsound3.cache import DiskCache
+from playsound3.playsound3 import SoundBackend
+
+SOUNDS_DIR = Path("tests/sounds").absolute()
+
+
+def pytest_configure(config):
+    # Keep the caches written by the tests, also by player subprocesses, out of the user's cache directory
+    config.playsound3_cache_dir = tempfile.mkdtemp(prefix="playsound3-tests-")
+    os.environ["PLAYSOUND3_CACHE_DIR"] = config.playsound3_cache_dir
+
+
+def pytest_unconfigure(config):
+    shutil.rmtree(config.playsound3_cache_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def server():
+    """HTTP server for files in tests/sounds that records connections and response codes."""
+    server = SimpleNamespace(address="", connections=0, responses=[])
+
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            server.connections += 1
+            super().setup()
+
+        def send_response(self, code, message=None):
+            server.responses.append(code)
+            super().send_response(code, message)
+
+        def log_message(self, format, *args):
+            pass
+
+    handler = functools.partial(Handler, directory=str(SOUNDS_DIR))
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    server.address = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield server
+    httpd.shutdown()
+
+
+@pytest.fixture
+def download_cache(tmp_path, monkeypatch):
+    download_cache = DiskCache(tmp_path, max_bytes=10**9)
+    monkeypatch.setattr(playsound3, "_DOWNLOAD_CACHE", download_cache)
+    monkeypatch.setattr(playsound3, "_REVALIDATED_URLS", set())
+    return download_cache
+
+
+class PipeBackend(SoundBackend):
+    """Backend that saves the data it receives through a pipe to a file, or appends it with `append=True`."""
+
+    def __init__(self, output, append=False):
+        self.output = output
+        self.mode = "ab" if append else "wb"
+        self.started = 0
+
+    def check(self):
+        return True
+
+    def play(self, sound):
+        raise AssertionError("the sound should be piped")
+
+    def play_pipe(self, suffix):
+        self.started += 1
+        code = f"import shutil, sys; shutil.copyfileobj(sys.stdin.buffer, open({str(self.output)!r}, {self.mode!r}))"
+        return subprocess.Popen([sys.executable, "-c", code], stdin=subprocess.PIPE)
+
+
+@pytest.fixture
+def pipe_backend(tmp_path):
+    return PipeBackend(tmp_path / "piped")
+
+
+class SleepBackend(SoundBackend):
+    """Backend with a player process that sleeps instead of playing; records what it played and when.
+
+    Files played with `play()` are added to `played`, and their start times to `start_times`.
+    With `raw=True` the backend also plays PCM data, and `play_raw()` adds `(buffer, format)` pairs to `played`.
+    """
+
+    def __init__(self, seconds=0.0, raw=False, formats=None, exit_code=0):
+        self.seconds = seconds
+        self.raw = raw
+        self.formats = formats
+        self.exit_code = exit_code
+        self.played = []
+        self.start_times = []
+
+    def check(self):
+        return True
+
+    def command(self, sound):
+        return [sys.executable, "-c", f"import sys, time; time.sleep({self.seconds}); sys.exit({self.exit_code})"]
+
+    def play(self, sound):
+        self.played.append(sound)
+        self.start_times.append(time.perf_counter())
+        return subprocess.Popen(self.command(sound))
+
+    def play_raw(self, buffer, wav):
+        if not self.raw:
+            return super().play_raw(buffer, wav)
+        self.played.append((buffer, wav))
+        return subprocess.Popen(self.command(""))
@@ -0,0 +1,30 @@
+import mmap
+
+import pytest
+
+from playsound3 import playsound
+from playsound3.backends import load_libasound, read_wav_format
+
+wav = "tests/sounds/звук 音 聲音.wav"
+
+
+def test_read_wav_format():
+    with open(wav, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        wav_format = read_wav_format(buffer)
+
+    assert (wav_format.channels, wav_format.sample_rate, wav_format.bits_per_sample) == (2, 48000, 16)
+    assert wav_format.data_size == 95744 * wav_format.frame_size
+
+
+@pytest.mark.skipif(load_libasound() is None, reason="libasound is not installed")
+def test_null_device(monkeypatch):
+    # ALSA's null device works without a sound card
+    monkeypatch.setenv("PLAYSOUND3_ALSA_DEVICE", "null")
+
+    sound = playsound(wav, block=True, backend="alsapcm")
+    assert not sound.is_alive()
+
+    sound = playsound(wav, block=False, backend="alsapcm")
+    sound.stop()
+    sound.wait()
+    assert not sound.is_alive()
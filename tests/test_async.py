@@ -0,0 +1,65 @@
+import asyncio
+import time
+
+from conftest import SleepBackend
+
+from playsound3 import playsound_async
+from playsound3.backends import CallbackPopen
+from playsound3.playsound3 import SoundBackend
+
+wav = "tests/sounds/звук 音 聲音.wav"
+
+
+class TimerPopen(CallbackPopen):
+    def __init__(self, loop):
+        super().__init__()
+        self.returncode = None
+        loop.call_later(0.3, self.terminate)
+
+    def terminate(self):
+        self.returncode = 0
+        self._notify_done()
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self):
+        raise AssertionError("waiting should not block a thread")
+
+
+class InProcessBackend(SoundBackend):
+    def check(self):
+        return True
+
+    def play(self, sound):
+        return TimerPopen(asyncio.get_running_loop())
+
+
+def test_subprocess_sounds():
+    async def main():
+        backend = SleepBackend(0.5)
+        sounds = [await playsound_async(wav, block=False, backend=backend) for _ in range(10)]
+        assert backend.played == []  # The players are started by asyncio
+        assert all(sound.is_alive() for sound in sounds)
+
+        sounds[0].stop()
+        await sounds[0].wait()
+        assert not sounds[0].is_alive()
+
+        await asyncio.gather(*(sound.wait() for sound in sounds))
+        assert not any(sound.is_alive() for sound in sounds)
+
+    asyncio.run(main())
+
+
+def test_in_process_sounds():
+    async def main():
+        t0 = time.perf_counter()
+        sounds = [await playsound_async(wav, block=False, backend=InProcessBackend()) for _ in range(100)]
+        assert all(sound.is_alive() for sound in sounds)
+
+        await asyncio.gather(*(sound.wait() for sound in sounds))
+        assert not any(sound.is_alive() for sound in sounds)
+        assert time.perf_counter() - t0 >= 0.3
+
+    asyncio.run(main())
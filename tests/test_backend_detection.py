@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+from playsound3 import playsound3
+
+
+def test_detection_is_lazy():
+    code = "import playsound3; print('AVAILABLE_BACKENDS' in vars(playsound3.playsound3))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "False"
+
+
+def test_detection_is_cached(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLAYSOUND3_CACHE_DIR", str(tmp_path))
+    calls = []
+
+    for name, backend in playsound3._BACKEND_MAP.items():
+        monkeypatch.setattr(backend, "check", lambda name=name: calls.append(name) or name == "ffplay")
+
+    assert playsound3._detect_backends() == ["ffplay"]
+    assert sorted(calls) == sorted(playsound3._BACKEND_MAP)
+    assert (tmp_path / "backends.json").exists()
+
+    calls.clear()
+    assert playsound3._detect_backends() == ["ffplay"]
+    assert all(not playsound3._BACKEND_MAP[name].cache_check for name in calls)
+
+    # Changing PATH invalidates the cached results
+    calls.clear()
+    monkeypatch.setenv("PATH", str(tmp_path))
+    assert playsound3._detect_backends() == ["ffplay"]
+    assert sorted(calls) == sorted(playsound3._BACKEND_MAP)
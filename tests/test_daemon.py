@@ -0,0 +1,50 @@
+import sys
+import time
+
+from playsound3.backends import DaemonClient
+
+# Stand-in for playsound3/daemon.py that "plays" every sound for 0.2 seconds
+FAKE_DAEMON = """
+import json, os, sys, threading
+
+def done(sound_id, code):
+    sys.stdout.write(json.dumps({"event": "done", "id": sound_id, "code": code}) + "\\n")
+    sys.stdout.flush()
+
+for line in sys.stdin:
+    command = json.loads(line)
+    if command["cmd"] == "play":
+        threading.Timer(0.2, done, args=(command["id"], 0)).start()
+    elif command["cmd"] == "crash":
+        os._exit(1)
+"""
+
+
+def test_daemon_client():
+    client = DaemonClient([sys.executable, "-c", FAKE_DAEMON])
+    sounds = [client.play(f"file:///sound{i}.wav") for i in range(3)]
+    process = client._process
+
+    for sound in sounds:
+        assert sound.poll() is None
+
+    sounds[1].terminate()
+    assert sounds[1].poll() == -15
+    assert sounds[0].wait() == 0
+    assert sounds[2].wait() == 0
+
+    # The same process is reused for the following sounds
+    assert client.play("file:///sound.wav").wait() == 0
+    assert client._process is process
+
+
+def test_daemon_client_restarts():
+    client = DaemonClient([sys.executable, "-c", FAKE_DAEMON])
+    sound = client.play("file:///sound.wav")
+    client.send({"cmd": "crash"})
+
+    t0 = time.perf_counter()
+    assert sound.wait() == 1
+    assert time.perf_counter() - t0 < 0.2
+
+    assert client.play("file:///sound.wav").wait() == 0
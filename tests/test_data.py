@@ -0,0 +1,93 @@
+import io
+from pathlib import Path
+
+import pytest
+from conftest import SleepBackend
+
+from playsound3 import backends, playsound, playsound3
+from playsound3.cache import DiskCache
+from playsound3.playsound3 import PlaysoundException
+from playsound3.probe import probe, sniff_suffix
+
+wav = Path("tests/sounds/звук 音 聲音.wav")
+mp3 = Path("tests/sounds/sample3s.mp3")
+
+
+@pytest.fixture
+def pcm_cache(tmp_path, monkeypatch):
+    pcm_cache = DiskCache(tmp_path / "pcm", max_bytes=10**9)
+    monkeypatch.setattr(playsound3, "_PCM_CACHE", pcm_cache)
+    return pcm_cache
+
+
+def test_sniff_suffix():
+    assert sniff_suffix(wav.read_bytes()[:64]) == ".wav"
+    assert sniff_suffix(mp3.read_bytes()[:64]) == ".mp3"
+    assert sniff_suffix(Path("tests/sounds/sample3s.flac").read_bytes()[:64]) == ".flac"
+    with pytest.raises(PlaysoundException, match="unrecognized"):
+        sniff_suffix(b"not a sound")
+
+
+@pytest.mark.parametrize("kind", [bytes, bytearray, memoryview])
+def test_wav_data_is_not_copied(kind, pcm_cache):
+    raw = wav.read_bytes()
+    data = kind(raw)
+    backend = SleepBackend(raw=True)
+    sound = playsound(data, backend=backend, start=0.5, end=1.0)
+    buffer, wav_format = backend.played[0]
+    assert buffer is data or buffer.obj is raw
+    assert wav_format.data_size == 48000 * 4 // 2
+    assert sound.duration == pytest.approx(0.5)
+    assert not pcm_cache.directory.exists()
+
+
+def test_data_is_piped(pipe_backend, pcm_cache):
+    data = mp3.read_bytes()
+    sound = playsound(data, backend=pipe_backend)
+    assert pipe_backend.output.read_bytes() == data
+    assert sound.duration == probe(mp3).duration
+
+    # WAV data is piped with a new header, by the default `play_raw`
+    data = wav.read_bytes()
+    playsound(data, backend=pipe_backend)
+    piped = pipe_backend.output.read_bytes()
+    original_format, piped_format = backends.read_wav_format(data), backends.read_wav_format(piped)
+    assert piped[piped_format.data_offset :] == data[original_format.data_offset :]
+    assert not pcm_cache.directory.exists()
+
+
+def test_file_object_is_piped(pipe_backend):
+    data = mp3.read_bytes()
+    sound = playsound(io.BytesIO(data), backend=pipe_backend)
+    assert sound.name == "<stream>"
+    assert pipe_backend.output.read_bytes() == data
+
+    with mp3.open("rb") as f:
+        sound = playsound(f, backend=pipe_backend)
+    assert sound.name == str(mp3)
+
+
+def test_file_backend_plays_cached_copy(pcm_cache):
+    backend = SleepBackend()
+    playsound(mp3.read_bytes(), backend=backend)
+    playsound(io.BytesIO(mp3.read_bytes()), backend=backend)
+    # Both are written once, under the content hash
+    assert backend.played[0] == backend.played[1]
+    assert backend.played[0].endswith(".mp3")
+    assert Path(backend.played[0]).read_bytes() == mp3.read_bytes()
+
+
+def test_file_object_part(pcm_cache):
+    backend = SleepBackend(raw=True)
+    with wav.open("rb") as f:
+        playsound(f, backend=backend, end=0.25)
+    buffer, wav_format = backend.played[0]
+    assert wav_format == backends.slice_wav(backends.read_wav_format(wav.read_bytes()), None, 0.25)
+    assert bytes(buffer) == wav.read_bytes()
+
+
+def test_invalid_data():
+    with pytest.raises(PlaysoundException, match="cannot play int objects"):
+        playsound(42, backend=SleepBackend())  # type: ignore[arg-type]
+    with pytest.raises(PlaysoundException, match="unrecognized"):
+        playsound(b"not a sound", backend=SleepBackend())
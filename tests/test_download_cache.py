@@ -0,0 +1,68 @@
+import os
+import time
+from pathlib import Path
+
+from playsound3 import backends, playsound, playsound3, prefetch
+from playsound3.cache import DiskCache
+
+SOUNDS_DIR = Path("tests/sounds").absolute()
+
+
+def test_download_is_cached(server, download_cache):
+    url = f"{server.address}/sample3s.mp3"
+
+    path = playsound3._prepare_path(url)
+    assert Path(path).read_bytes() == (SOUNDS_DIR / "sample3s.mp3").read_bytes()
+    assert server.responses == [200]
+
+    # The same process does not revalidate the cached file
+    assert playsound3._prepare_path(url) == path
+    assert server.responses == [200]
+
+    # A new process revalidates it with If-Modified-Since
+    playsound3._REVALIDATED_URLS.clear()
+    assert playsound3._prepare_path(url) == path
+    assert server.responses == [200, 304]
+
+
+def test_prefetch_downloads_once(server, download_cache):
+    urls = [f"{server.address}/sample3s.mp3", f"{server.address}/sample3s.flac"] * 4
+    paths = prefetch(urls, max_workers=8)
+    assert len(set(paths)) == 2
+    assert server.responses == [200, 200]
+
+    # Connections are kept alive and reused
+    playsound3._REVALIDATED_URLS.clear()
+    prefetch(urls, max_workers=1)
+    assert server.responses == [200, 200, 304, 304]
+    assert server.connections <= 2
+
+
+def test_least_recently_used_are_evicted(tmp_path):
+    disk_cache = DiskCache(tmp_path, max_bytes=250)
+    for age, key in [(20, "a"), (10, "b"), (0, "c")]:
+        with disk_cache.open_write(key) as f:
+            f.write(b"x" * 100)
+        mtime = time.time() - age
+        os.utime(disk_cache.path(key), (mtime, mtime))
+
+    assert disk_cache.get("a") is None
+    assert disk_cache.get("b") is not None
+    assert disk_cache.get("c") is not None
+
+
+def test_streaming_saves_to_cache(server, download_cache, pipe_backend):
+    url = f"{server.address}/sample3s.mp3"
+
+    sound = playsound(url, backend=pipe_backend, stream=True)
+    assert isinstance(sound.subprocess, backends.PipedPopen)
+    sound.subprocess.thread.join()
+    assert pipe_backend.output.read_bytes() == (SOUNDS_DIR / "sample3s.mp3").read_bytes()
+    assert download_cache.get(url, ".mp3").read_bytes() == pipe_backend.output.read_bytes()
+
+
+def test_cache_directory_follows_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLAYSOUND3_CACHE_DIR", str(tmp_path))
+    assert playsound3._DOWNLOAD_CACHE.directory == tmp_path / "downloads"
+    assert playsound3._PCM_CACHE.directory == tmp_path / "pcm"
+    assert playsound3._ROUTER.path == tmp_path / "routing.json"
@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Cumulative time of `import playsound3` reported by `python -X importtime`, with bytecode already compiled.
+# Importing the network modules eagerly alone used to cost more than this.
+IMPORT_BUDGET_US = 100_000
+
+# Modules that must be imported only when they are used, e.g. when a URL is played
+LAZY_MODULES = [
+    "concurrent.futures",
+    "hashlib",
+    "http.client",
+    "logging",
+    "playsound3.connections",
+    "playsound3.probe",
+    "socket",
+    "ssl",
+    "tempfile",
+    "urllib.request",
+    "uuid",
+    "wave",
+]
+
+CHECK_CODE = """
+import json, sys
+before = set(sys.modules)
+import playsound3
+state = vars(playsound3.playsound3)
+print(json.dumps({
+    "imported": sorted(set(sys.modules) - before),
+    "computed": [name for name in ("AVAILABLE_BACKENDS", "DEFAULT_BACKEND", "_BACKEND_MAP") if name in state],
+}))
+"""
+
+
+def run_python(*args):
+    # Bytecode is written on the first run, so the following runs do not measure compilation
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return subprocess.run([sys.executable, *args], env=env, cwd=ROOT, capture_output=True, text=True, check=True)
+
+
+def test_import_is_lazy():
+    result = json.loads(run_python("-c", CHECK_CODE).stdout)
+    assert [name for name in LAZY_MODULES if name in result["imported"]] == []
+    assert result["computed"] == []
+
+
+def test_import_time_budget():
+    run_python("-c", "import playsound3")
+    timings = []
+    for _ in range(5):
+        lines = run_python("-X", "importtime", "-c", "import playsound3").stderr.splitlines()
+        # import time: self [us] | cumulative | imported package
+        cumulative = [int(line.split("|")[1]) for line in lines if line.split("|")[-1].strip() == "playsound3"]
+        timings.append(cumulative[-1])
+    assert min(timings) < IMPORT_BUDGET_US
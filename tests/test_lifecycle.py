@@ -0,0 +1,131 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from playsound3 import live_sounds, playsound, playsound3, stop_all
+from playsound3.playsound3 import SoundBackend
+
+wav = "tests/sounds/звук 音 聲音.wav"
+
+# The player starts a helper process that writes its PID to a file and sleeps
+PLAYER_CODE = """
+import subprocess, sys, time
+helper = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+open(sys.argv[1], "w").write(str(helper.pid))
+time.sleep(float(sys.argv[2]))
+"""
+
+
+class TreeBackend(SoundBackend):
+    """Backend whose player process starts a helper process, like a player starting a decoder."""
+
+    def __init__(self, pid_file, seconds=30):
+        self.pid_file = pid_file
+        self.seconds = seconds
+
+    def check(self):
+        return True
+
+    def play(self, sound):
+        return playsound3._spawn([sys.executable, "-c", PLAYER_CODE, str(self.pid_file), str(self.seconds)])
+
+
+def is_running(pid):
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except FileNotFoundError:
+        return False
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def read_pid(pid_file):
+    wait_for(pid_file.exists)
+    wait_for(lambda: pid_file.read_text() != "")
+    return int(pid_file.read_text())
+
+
+def test_background_sounds_are_reaped(tmp_path):
+    sound = playsound(wav, block=False, backend=TreeBackend(tmp_path / "pid", seconds=0))
+    assert sound in live_sounds()
+    process = sound.subprocess
+    assert isinstance(process, subprocess.Popen)
+    # Nobody polls the player, but it is reaped anyway
+    wait_for(lambda: process.returncode is not None)
+    wait_for(lambda: sound not in live_sounds())
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads process states from /proc")
+def test_stop_kills_process_group(tmp_path):
+    sound = playsound(wav, block=False, backend=TreeBackend(tmp_path / "pid"))
+    helper_pid = read_pid(tmp_path / "pid")
+    sound.stop()
+    assert sound.wait(timeout=5)
+    wait_for(lambda: not is_running(helper_pid))
+
+
+def test_stop_all(tmp_path):
+    sounds = [playsound(wav, block=False, backend=TreeBackend(tmp_path / f"pid{i}")) for i in range(3)]
+    assert set(sounds) <= set(live_sounds())
+    stop_all()
+    for sound in sounds:
+        assert sound.wait(timeout=5)
+    wait_for(lambda: not set(sounds) & set(live_sounds()))
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads process states from /proc")
+@pytest.mark.parametrize("stop_at_exit", ["1", "0"])
+def test_stop_at_exit(tmp_path, stop_at_exit):
+    pid_file = tmp_path / "pid"
+    code = f"""
+import sys
+sys.path.insert(0, {os.getcwd()!r})
+sys.path.insert(0, {os.path.dirname(__file__)!r})
+from playsound3 import playsound
+from pathlib import Path
+from test_lifecycle import TreeBackend, read_pid
+playsound({wav!r}, block=False, backend=TreeBackend({str(pid_file)!r}))
+read_pid(Path({str(pid_file)!r}))
+"""
+    env = dict(os.environ, PLAYSOUND3_STOP_AT_EXIT=stop_at_exit)
+    subprocess.run([sys.executable, "-c", code], env=env, check=True, timeout=30)
+    helper_pid = read_pid(pid_file)
+    if stop_at_exit == "1":
+        wait_for(lambda: not is_running(helper_pid))
+    else:
+        assert is_running(helper_pid)
+        os.killpg(os.getpgid(helper_pid), 9)
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads process states from /proc")
+def test_interrupted_blocking_sound_is_stopped(tmp_path):
+    # The player does not get the SIGINT of the terminal, like a Ctrl+C while `playsound()` blocks
+    pid_file = tmp_path / "pid"
+    code = f"""
+import os, signal, sys, threading
+from pathlib import Path
+sys.path[:0] = [{os.getcwd()!r}, {os.path.dirname(__file__)!r}]
+from playsound3 import playsound
+from test_lifecycle import TreeBackend, read_pid
+
+def interrupt(pid_file):
+    read_pid(pid_file)
+    os.kill(os.getpid(), signal.SIGINT)
+
+backend = TreeBackend(Path({str(pid_file)!r}))
+threading.Thread(target=interrupt, args=(backend.pid_file,), daemon=True).start()
+playsound({wav!r}, backend=backend)
+"""
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, timeout=30)
+    assert b"KeyboardInterrupt" in result.stderr
+    helper_pid = read_pid(pid_file)
+    wait_for(lambda: not is_running(helper_pid))
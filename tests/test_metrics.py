@@ -0,0 +1,61 @@
+import time
+
+import pytest
+from conftest import SleepBackend
+
+from playsound3 import metrics, playsound
+
+sound_name = "sample3s.mp3"
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    monkeypatch.setattr(metrics, "ENABLED", False)
+    monkeypatch.setattr(metrics, "_OBSERVERS", [])
+    stats = metrics.Stats()
+    metrics.add_observer(stats)
+    return stats
+
+
+def test_disabled_by_default(monkeypatch):
+    monkeypatch.setattr(metrics, "ENABLED", False)
+    sound = playsound(f"tests/sounds/{sound_name}", backend=SleepBackend(0.1))
+    assert sound.timings == {}
+
+
+def test_timings(server, download_cache, stats):
+    url = f"{server.address}/{sound_name}"
+    sound = playsound(url, backend=SleepBackend(0.1))
+    assert sound.wait(timeout=5)
+
+    assert sound.timings["cache_result"] == "miss"
+    assert sound.timings["download_bytes"] == (download_cache.path(url, ".mp3")).stat().st_size
+    assert sound.timings["prepare_path"] >= sound.timings["download"] > 0
+    assert sound.timings["spawn"] > 0
+
+    # Exit is recorded by a callback, which might run a moment after wait() returns
+    deadline = time.monotonic() + 5
+    while "exit" not in sound.timings and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sound.timings["exit"] >= 0.1
+
+    sound = playsound(url, backend=SleepBackend(0.1))
+    assert sound.timings["cache_result"] == "hit"
+    assert "download" not in sound.timings
+
+    snapshot = stats.snapshot()
+    assert snapshot["counters"]["cache.miss"] == 1
+    assert snapshot["counters"]["cache.hit"] == 1
+    assert snapshot["counters"]["spawn"] == 2
+    assert snapshot["histograms"]["prepare_path"]["count"] == 2
+    assert snapshot["histograms"]["download"]["count"] == 1
+
+
+def test_failing_observer(stats, caplog):
+    def observer(event, data):
+        raise RuntimeError("observer failed")
+
+    metrics.add_observer(observer)
+    playsound(f"tests/sounds/{sound_name}", backend=SleepBackend(0.1))
+    assert stats.counters["spawn"] == 1
+    assert "observer failed" in caplog.text
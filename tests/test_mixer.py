@@ -0,0 +1,53 @@
+import time
+
+import pytest
+
+from playsound3 import playsound
+
+np = pytest.importorskip("numpy")
+
+wav = "tests/sounds/звук 音 聲音.wav"
+
+
+@pytest.fixture(autouse=True)
+def null_sink(monkeypatch):
+    monkeypatch.setenv("PLAYSOUND3_MIXER_SINK", "null")
+
+
+def test_decode():
+    from playsound3 import mixer
+
+    samples = mixer.decode(wav)
+    assert samples.dtype == np.int16
+    assert samples.shape == (95744, 2)
+
+
+def test_voices_share_one_stream():
+    from playsound3 import mixer
+
+    t0 = time.perf_counter()
+    sounds = [playsound(wav, block=False, backend="mixer") for _ in range(5)]
+    assert mixer.get_mixer()._thread is not None
+
+    for sound in sounds:
+        assert sound.is_alive()
+    sounds[0].stop()
+    assert not sounds[0].is_alive()
+
+    for sound in sounds[1:]:
+        sound.wait()
+        assert not sound.is_alive()
+    assert time.perf_counter() - t0 >= 95744 / 48000 - 0.05
+
+
+def test_mixing_with_gain():
+    from playsound3 import mixer
+
+    block = np.zeros((4, 2), dtype=np.float32)
+    samples = np.full((4, 2), 30000, dtype=np.int16)
+    voices = [mixer.Voice(samples, gain=0.5), mixer.Voice(samples)]
+    for voice in voices:
+        voice.mix_into(block)
+
+    assert np.all(block == 45000)
+    assert all(voice.poll() == 0 for voice in voices)
@@ -0,0 +1,41 @@
+from pathlib import Path
+
+import pytest
+from conftest import SleepBackend
+
+from playsound3 import play_many
+from playsound3.playsound3 import PlaysoundException
+
+wav = "tests/sounds/звук 音 聲音.wav"
+
+
+def test_play_many(server, download_cache):
+    backend = SleepBackend(0.2)
+    urls = [f"{server.address}/sample3s.mp3", f"{server.address}/sample3s.flac"]
+    group = play_many([wav, *urls, urls[0]], block=False, backend=backend)
+
+    assert len(group) == 4
+    assert group.is_alive()
+    mp3_path, flac_path = download_cache.path(urls[0], ".mp3"), download_cache.path(urls[1], ".flac")
+    expected = [Path(wav).absolute(), mp3_path, flac_path, mp3_path]
+    assert backend.played == [path.as_posix() for path in expected]
+    assert server.responses.count(200) == 2
+
+    assert group.wait(timeout=5)
+    assert not group.is_alive()
+
+
+def test_stagger_and_stop():
+    backend = SleepBackend(seconds=5)
+    group = play_many([wav] * 3, block=False, backend=backend, stagger=0.05)
+    assert backend.start_times[2] - backend.start_times[0] >= 0.1
+
+    group.stop()
+    assert group.wait(timeout=5)
+
+
+def test_nothing_plays_if_any_sound_is_missing():
+    backend = SleepBackend(0.2)
+    with pytest.raises(PlaysoundException):
+        play_many([wav, "missing.wav"], backend=backend)
+    assert backend.played == []
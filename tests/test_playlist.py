@@ -0,0 +1,34 @@
+from conftest import PipeBackend, SleepBackend
+
+from playsound3.playlist import Playlist
+
+wav = "tests/sounds/звук 音 聲音.wav"
+mp3 = "tests/sounds/sample3s.mp3"
+
+
+def test_piped_playlist(tmp_path):
+    backend = PipeBackend(tmp_path / "output", append=True)
+    playlist = Playlist([wav, mp3, wav], backend=backend).play(block=True)
+
+    assert not playlist.is_alive()
+    assert backend.started == 3
+    expected = b"".join(open(path, "rb").read() for path in [wav, mp3, wav])
+    assert (tmp_path / "output").read_bytes() == expected
+
+
+def test_in_process_playlist():
+    backend = SleepBackend(0.1, raw=True)
+    playlist = Playlist([wav, wav], backend=backend)
+    playlist.add(wav)
+    assert playlist.play(block=False).is_alive()
+    assert playlist.wait(timeout=5)
+    # The sounds are decoded ahead
+    assert [type(played) for played in backend.played] == [tuple] * 3
+
+
+def test_stop(tmp_path):
+    backend = SleepBackend(0.1, raw=True)
+    playlist = Playlist([wav] * 10, backend=backend).play(block=False)
+    playlist.stop()
+    assert playlist.wait(timeout=5)
+    assert len(backend.played) < 10
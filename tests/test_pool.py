@@ -0,0 +1,59 @@
+import time
+
+import pytest
+from conftest import SleepBackend
+
+from playsound3 import SoundPool, wait_all
+from playsound3.backends import PlaysoundException
+
+wav = "tests/sounds/звук 音 聲音.wav"
+
+
+def test_steal_oldest():
+    pool = SoundPool(max_voices=2, backend=SleepBackend(5))
+    first = pool.play(wav)
+    second = pool.play(wav)
+    third = pool.play(wav)
+
+    assert first.wait(timeout=5)
+    assert pool.active == [second, third]
+    assert pool.stats["stolen"] == 1
+
+    # Sounds with lower priority cannot steal voices
+    assert pool.play(wav, priority=-1) is None
+    assert pool.stats["dropped"] == 1
+    pool.stop_all()
+
+
+def test_drop_lowest():
+    pool = SoundPool(max_voices=2, policy="drop-lowest", backend=SleepBackend(5))
+    low = pool.play(wav, priority=0)
+    high = pool.play(wav, priority=5)
+
+    assert pool.play(wav, priority=0) is None
+    important = pool.play(wav, priority=1)
+    assert low.wait(timeout=5)
+    assert pool.active == [high, important]
+    pool.stop_all()
+
+
+def test_queue():
+    pool = SoundPool(max_voices=1, policy="reject", max_queue=2, backend=SleepBackend(0.2))
+    first = pool.play(wav)
+    assert pool.play(wav, priority=0) is None
+    assert pool.play(wav, priority=1) is None
+    assert pool.play(wav, priority=2) is None  # The queue is full, so the lowest priority sound is dropped
+    assert pool.stats == {"played": 1, "stolen": 0, "queued": 3, "dropped": 1}
+
+    # Queued sounds start one by one, in order of priority
+    assert first.wait(timeout=5)
+    deadline = time.monotonic() + 5
+    while (pool.active or pool.stats["played"] < 3) and time.monotonic() < deadline:
+        assert wait_all(pool.active, timeout=5)
+        time.sleep(0.01)
+    assert pool.stats["played"] == 3
+
+
+def test_invalid_policy():
+    with pytest.raises(PlaysoundException):
+        SoundPool(policy="random")
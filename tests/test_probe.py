@@ -0,0 +1,81 @@
+import struct
+
+import pytest
+from conftest import SleepBackend
+
+from playsound3 import playsound, probe
+from playsound3.playsound3 import PlaysoundException
+
+wav = "tests/sounds/звук 音 聲音.wav"
+
+
+def ogg_page(granule, packet):
+    header = b"OggS" + struct.pack("<BBqIIIB", 0, 0, granule, 1, 0, 0, 1) + bytes([len(packet)])
+    return header + packet
+
+
+def test_probe_files():
+    assert probe.probe(wav) == probe.AudioInfo("pcm", 48000, 2, 95744 / 48000)
+
+    info = probe.probe("tests/sounds/sample3s.flac")
+    assert (info.codec, info.sample_rate, info.channels) == ("flac", 44100, 2)
+    assert info.duration == pytest.approx(3.2, abs=0.1)
+
+    info = probe.probe("tests/sounds/sample3s.mp3")
+    assert (info.codec, info.sample_rate, info.channels) == ("mp3", 44100, 2)
+    assert info.duration == pytest.approx(3.2, abs=0.1)
+
+
+def test_probe_ogg(tmp_path):
+    vorbis = b"\x01vorbis" + struct.pack("<IBI", 0, 1, 22050) + bytes(16)
+    path = tmp_path / "sound.ogg"
+    path.write_bytes(ogg_page(0, vorbis) + ogg_page(44100, b"audio"))
+    assert probe.probe(path) == probe.AudioInfo("vorbis", 22050, 1, 2.0)
+
+    opus = b"OpusHead" + struct.pack("<BBHIhB", 1, 2, 312, 44100, 0, 0)
+    path = tmp_path / "sound.opus"
+    path.write_bytes(ogg_page(0, opus) + ogg_page(312 + 48000, b"audio"))
+    assert probe.probe(path) == probe.AudioInfo("opus", 44100, 2, 1.0)
+
+
+def test_probe_vbr_mp3(tmp_path):
+    # MPEG-1 layer III, 128 kbps, 44.1 kHz, mono frame with a Xing header saying there are 100 frames
+    frame = b"\xff\xfb\x90\xc0" + bytes(17) + b"Xing" + struct.pack(">II", 1, 100)
+    path = tmp_path / "sound.mp3"
+    path.write_bytes(b"ID3\x04\x00\x00\x00\x00\x00\x05" + bytes(5) + frame + bytes(400))
+    assert probe.probe(path) == probe.AudioInfo("mp3", 44100, 1, 100 * 1152 / 44100)
+
+
+def test_index(tmp_path):
+    path = tmp_path / "sound.wav"
+    path.write_bytes(open(wav, "rb").read())
+    info = probe.probe(path)
+    assert probe.probe(path) is info
+
+    # A changed file is probed again
+    path.write_bytes(b"not a sound")
+    with pytest.raises(PlaysoundException, match="unrecognized"):
+        probe.probe(path)
+
+
+def test_sound_duration():
+    sound = playsound(wav, block=False, backend=SleepBackend(0.5))
+    duration, progress, remaining = sound.duration, sound.progress, sound.remaining
+    assert duration is not None and duration == pytest.approx(1.99, abs=0.01)
+    assert progress is not None and 0 <= progress < 1
+    assert remaining is not None and 0 < remaining <= duration
+
+    sound.stop()
+    sound.wait()
+    assert sound.progress == 1.0
+    assert sound.remaining == 0.0
+
+
+def test_unknown_duration(tmp_path):
+    path = tmp_path / "sound.wav"
+    path.write_bytes(b"not a sound")
+    sound = playsound(path, block=False, backend=SleepBackend(0.5))
+    assert sound.duration is None
+    assert sound.progress is None
+    assert sound.remaining is None
+    sound.stop()
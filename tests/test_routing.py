@@ -0,0 +1,108 @@
+import time
+
+import pytest
+from conftest import SleepBackend
+
+from playsound3 import calibrate, playsound, playsound3, routing
+
+wav = "tests/sounds/звук 音 聲音.wav"
+
+
+@pytest.fixture
+def router(tmp_path, monkeypatch):
+    router = routing.Router(tmp_path / "routing.json")
+    monkeypatch.setattr(playsound3, "_ROUTER", router)
+    monkeypatch.setattr(playsound3, "_ROUTING", True)
+    monkeypatch.delenv("PLAYSOUND3_BACKEND", raising=False)
+    return router
+
+
+@pytest.fixture
+def fake_backends(monkeypatch, tmp_path):
+    fake_backends = {
+        "slow": SleepBackend(0.3),
+        "fast": SleepBackend(0.0),
+        "mp3only": SleepBackend(0.0, formats=(".mp3",)),
+        "broken": SleepBackend(0.0, exit_code=1),
+    }
+    monkeypatch.setattr(playsound3, "_BACKEND_MAP", fake_backends)
+    monkeypatch.setattr(playsound3, "AVAILABLE_BACKENDS", list(fake_backends), raising=False)
+    monkeypatch.setattr(playsound3, "DEFAULT_BACKEND", "slow", raising=False)
+    monkeypatch.setenv("PLAYSOUND3_CACHE_DIR", str(tmp_path / "cache"))
+    return fake_backends
+
+
+def test_router(tmp_path):
+    router = routing.Router(tmp_path / "routing.json")
+    assert router.choose(".wav", ["a", "b"], "a") == "a"
+
+    router.set(".WAV", "b", 0.1)
+    assert router.choose(".wav", ["a", "b"], "a") == "a"
+    assert router.choose(".wav", ["a", "b"], None) == "b"
+    router.observe(".wav", "a", 0.05)
+    assert router.choose(".wav", ["a", "b"], "a") == "a"
+    router.observe(".wav", "a", 0.55)
+    assert router.latencies() == {".wav": {"a": pytest.approx(0.15), "b": 0.1}}
+    assert router.choose(".wav", ["a"], "b") == "a"
+
+    router.save()
+    assert routing.Router(tmp_path / "routing.json").latencies() == router.latencies()
+
+
+def test_calibrate(router, fake_backends):
+    latencies = calibrate(repeat=1)
+    assert set(latencies[".wav"]) == {"slow", "fast"}
+    assert latencies[".wav"]["slow"] > latencies[".wav"]["fast"]
+
+    playsound(wav)
+    assert fake_backends["fast"].played[-1].endswith(".wav")
+    assert fake_backends["slow"].played == [playsound3._calibration_sound()]
+
+    # An explicit choice of the backend is respected
+    playsound(wav, backend="slow")
+    assert len(fake_backends["slow"].played) == 2
+
+
+def test_online_updates(router, fake_backends):
+    router.set(".wav", "fast", 10.0)
+    router.set(".wav", "slow", 20.0)
+    sound = playsound(wav, block=False)
+    assert fake_backends["fast"].played
+
+    # Latency is updated by a callback, which might run a moment after wait() returns
+    sound.wait()
+    deadline = time.monotonic() + 5
+    while router.latencies()[".wav"]["fast"] == 10.0:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert router.latencies()[".wav"]["fast"] == pytest.approx(0.8 * 10.0, abs=0.1)
+
+    # Stopped sounds are not measured
+    playsound(wav, block=False).stop()
+    time.sleep(0.2)
+    assert router.latencies()[".wav"]["fast"] == pytest.approx(0.8 * 10.0, abs=0.1)
+
+
+def test_failing_players_are_not_measured(router, fake_backends):
+    router.set(".wav", "broken", 0.0)
+    assert set(calibrate(repeat=1)[".wav"]) == {"slow", "fast"}
+
+    router.set(".wav", "broken", 5.0)
+    router.set(".wav", "fast", 10.0)
+    playsound(wav)
+    assert fake_backends["broken"].played
+    time.sleep(0.2)
+    assert router.latencies()[".wav"]["broken"] == 5.0
+
+
+def test_uncalibrated_formats_are_not_measured(router, fake_backends):
+    playsound(wav)
+    time.sleep(0.2)
+    assert router.latencies() == {}
+
+
+def test_routing_disabled(router, fake_backends, monkeypatch):
+    router.set(".wav", "fast", 0.0)
+    monkeypatch.setattr(playsound3, "_ROUTING", False)
+    playsound(wav)
+    assert fake_backends["fast"].played == []
@@ -0,0 +1,34 @@
+import shutil
+import wave
+
+from playsound3 import load, playsound3
+
+wav = "tests/sounds/звук 音 聲音.wav"
+
+
+def test_load_is_cached():
+    sample = load(wav)
+    assert abs(sample.duration - 95744 / 48000) < 1e-6
+    assert load(wav) is sample
+
+
+def test_sample_is_piped(pipe_backend):
+    sample = load(wav)
+    sound = sample.play(backend=pipe_backend)
+    assert not sound.is_alive()
+
+    with wave.open(str(pipe_backend.output), "rb") as piped, wave.open(wav, "rb") as original:
+        assert piped.getparams()[:3] == original.getparams()[:3]
+        assert piped.readframes(piped.getnframes()) == original.readframes(original.getnframes())
+
+
+def test_samples_are_evicted(monkeypatch, tmp_path):
+    monkeypatch.setattr(playsound3, "_SAMPLE_CACHE_MAX_BYTES", 1)
+    monkeypatch.setattr(playsound3, "_SAMPLE_CACHE", playsound3.OrderedDict())
+
+    for name in ["a.wav", "b.wav"]:
+        shutil.copy(wav, tmp_path / name)
+        load(tmp_path / name)
+
+    # The most recently loaded sample is always kept
+    assert [key[0] for key in playsound3._SAMPLE_CACHE] == [(tmp_path / "b.wav").as_posix()]
@@ -0,0 +1,93 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.parse
+
+import pytest
+
+from playsound3 import play_many, playsound, playsound3
+
+pytest.importorskip("numpy")
+pytestmark = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="the server uses Unix sockets")
+
+wav = "tests/sounds/звук 音 聲音.wav"
+
+
+@pytest.fixture
+def playback_server(tmp_path, monkeypatch):
+    """Playback server with the mixer backend writing to a null sink."""
+    address = str(tmp_path / "server.sock")
+    env = dict(os.environ, PLAYSOUND3_MIXER_SINK="null", PLAYSOUND3_CACHE_DIR=str(tmp_path / "cache"))
+    command = [sys.executable, "-m", "playsound3", "serve", "--socket", address, "--backend", "mixer"]
+    process = subprocess.Popen(command, env=env)
+    monkeypatch.setenv("PLAYSOUND3_SERVER", address)
+    deadline = time.monotonic() + 10
+    while not playsound3.Remote().check():
+        assert process.poll() is None and time.monotonic() < deadline, "server did not start"
+        time.sleep(0.01)
+
+    monkeypatch.setattr(playsound3.Remote, "clients", {})
+    yield address
+    process.terminate()
+    assert process.wait(timeout=5) == 0
+    assert not os.path.exists(address)
+
+
+def test_remote_backend(playback_server):
+    sound = playsound(wav, backend="remote", start=0.0, end=0.1)
+    assert sound.subprocess.poll() == 0
+    assert sound.duration == pytest.approx(0.1)
+
+    sound = playsound(wav, block=False, backend="remote")
+    assert sound.is_alive()
+    sound.stop()
+    assert sound.wait(timeout=5)
+
+
+def test_server_downloads_urls(playback_server, server):
+    url = f"{server.address}/{urllib.parse.quote(os.path.basename(wav))}"
+    sound = playsound(url, backend="remote", start=0.0, end=0.1)
+    assert sound.subprocess.poll() == 0
+    assert server.responses == [200]
+
+    sound = playsound(f"{server.address}/missing.mp3", backend="remote")
+    assert sound.subprocess.poll() == 1
+
+
+def test_batch(playback_server):
+    path = os.path.abspath(wav)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(playback_server)
+        commands = [
+            {"cmd": "play", "id": 1, "sound": path, "start": 0.0, "end": 0.05},
+            {"cmd": "play", "id": 2, "sound": path},
+            {"cmd": "stop", "id": 2},
+            {"cmd": "play", "id": 3, "sound": "missing.wav"},
+        ]
+        start_time = time.monotonic()
+        sock.sendall(b"".join(json.dumps(command).encode() + b"\n" for command in commands))
+        with sock.makefile("rb") as lines:
+            events = [json.loads(next(lines)) for _ in commands[:3]]
+
+    # The second sound lasts 2 seconds, unless it is stopped
+    assert time.monotonic() - start_time < 1.5
+    events.sort(key=lambda event: event["id"])
+    assert [event["id"] for event in events] == [1, 2, 3]
+    assert (events[0]["code"], events[2]["code"]) == (0, 1)
+    assert "file not found" in events[2]["error"]
+
+
+def test_no_server(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLAYSOUND3_SERVER", str(tmp_path / "missing.sock"))
+    assert not playsound3.Remote().check()
+    with pytest.raises(playsound3.PlaysoundException, match="playback server"):
+        playsound(wav, backend="remote")
+
+
+def test_many_sounds(playback_server):
+    group = play_many([wav] * 20, block=False, backend="remote")
+    group.stop()
+    assert group.wait(timeout=5)
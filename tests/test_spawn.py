@@ -0,0 +1,51 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from playsound3 import playsound3
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="fast spawning is only used on POSIX systems")
+
+
+@pytest.fixture
+def fake_player(tmp_path, monkeypatch):
+    """Executable on PATH that writes its arguments to stdout."""
+    player = tmp_path / "fake-player"
+    player.write_text(f"#!{sys.executable}\nimport sys\nprint(' '.join(sys.argv[1:]))\n")
+    player.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tmp_path) + os.pathsep + os.environ["PATH"])
+    monkeypatch.setattr(playsound3, "_FAST_SPAWN", True)
+    monkeypatch.setattr(playsound3, "_EXECUTABLES", {})
+    return player
+
+
+def test_fast_spawn(fake_player):
+    process = playsound3._spawn(["fake-player", "sound.wav"], stdout=subprocess.PIPE)
+    assert isinstance(process, subprocess.Popen)
+    assert process.communicate()[0] == b"sound.wav\n"
+    assert list(playsound3._EXECUTABLES.values()) == [str(fake_player)]
+
+    # Output to DEVNULL goes to a shared, pre-opened descriptor
+    assert playsound3._spawn(["fake-player"], stdout=subprocess.DEVNULL).wait() == 0
+    assert playsound3._spawn(["fake-player"], stdout=subprocess.DEVNULL).wait() == 0
+    assert playsound3._DEVNULL_FD is not None
+
+
+def test_moved_executable(fake_player, tmp_path, monkeypatch):
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    monkeypatch.setenv("PATH", os.environ["PATH"] + os.pathsep + str(other_dir))
+    assert playsound3._spawn(["fake-player"], stdout=subprocess.DEVNULL).wait() == 0
+
+    # The resolved path is stale, so the executable is searched for again
+    fake_player.rename(other_dir / "fake-player")
+    process = playsound3._spawn(["fake-player", "moved"], stdout=subprocess.PIPE)
+    assert process.communicate()[0] == b"moved\n"
+    assert playsound3._EXECUTABLES == {}
+
+
+def test_missing_executable(fake_player):
+    with pytest.raises(FileNotFoundError):
+        playsound3._spawn(["missing-player"])
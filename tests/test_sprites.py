@@ -0,0 +1,101 @@
+import json
+import subprocess
+import wave
+from pathlib import Path
+
+import pytest
+from conftest import SleepBackend
+
+from playsound3 import SpriteSheet, backends, playsound, playsound3
+from playsound3.cache import DiskCache
+from playsound3.playsound3 import PlaysoundException
+
+# 95744 frames of 16-bit stereo at 48 kHz
+wav = "tests/sounds/звук 音 聲音.wav"
+
+
+class SeekingBackend(SleepBackend):
+    def play_segment(self, sound, start, end):
+        self.played.append((sound, start, end))
+        return subprocess.Popen(self.command(sound))
+
+
+@pytest.fixture
+def pcm_cache(tmp_path, monkeypatch):
+    pcm_cache = DiskCache(tmp_path / "pcm", max_bytes=10**9)
+    monkeypatch.setattr(playsound3, "_PCM_CACHE", pcm_cache)
+    return pcm_cache
+
+
+def test_slice_wav():
+    wav_format = backends.WavFormat(1, 2, 48000, 16, 44, 48000 * 4)
+    assert backends.slice_wav(wav_format, 0.5, 0.75) == wav_format._replace(data_offset=44 + 96000, data_size=48000)
+    assert backends.slice_wav(wav_format, None, 0.5) == wav_format._replace(data_size=96000)
+    assert backends.slice_wav(wav_format, 2.0, None).data_size == 0
+
+
+def test_play_wav_part():
+    backend = SleepBackend(raw=True)
+    sound = playsound(wav, backend=backend, start=0.5, end=1.0)
+    (buffer, wav_format), *_ = backend.played
+    assert wav_format.data_offset == 136 + 24000 * 4
+    assert wav_format.data_size == 24000 * 4
+    assert len(buffer) == Path(wav).stat().st_size
+    assert sound.duration == 0.5
+
+
+def test_part_copied_for_file_backends(pcm_cache):
+    backend = SleepBackend()
+    sound = playsound(wav, backend=backend, start=1.0)
+    playsound(wav, backend=backend, start=1.0)
+    assert backend.played[0] == backend.played[1]
+    assert Path(backend.played[0]).parent == pcm_cache.directory
+    with wave.open(backend.played[0], "rb") as wav_file:
+        assert wav_file.getnframes() == 95744 - 48000
+    assert sound.duration == pytest.approx((95744 - 48000) / 48000)
+
+
+def test_seek_in_compressed_files():
+    backend = SeekingBackend()
+    mp3 = Path("tests/sounds/sample3s.mp3")
+    sound = playsound(mp3, backend=backend, start=1.0, end=2.0)
+    assert backend.played == [(mp3.absolute().as_posix(), 1.0, 2.0)]
+    assert sound.duration == 1.0
+
+    with pytest.raises(PlaysoundException, match="before"):
+        playsound(wav, backend=backend, start=1.0, end=0.5)
+
+
+def test_ffplay_seek_arguments(monkeypatch):
+    commands = []
+    monkeypatch.setattr(playsound3, "_spawn", lambda command, **kwargs: commands.append(command))
+    playsound3.Ffplay().play_segment("sound.mp3", 1.5, 2.0)
+    assert commands[0][-5:] == ["-t", "0.5", "-ss", "1.5", "sound.mp3"]
+
+
+def test_sprite_sheet(tmp_path):
+    manifest = tmp_path / "sprites.json"
+    spritemap = {"first": {"start": 0.0, "end": 0.5}, "second": {"start": 1.0, "end": 1.25, "loop": False}}
+    resources = ["sounds.mp3", str(Path(wav).absolute())]
+    manifest.write_text(json.dumps({"resources": resources, "spritemap": spritemap}))
+
+    sheet = SpriteSheet.from_manifest(manifest)
+    assert list(sheet) == ["first", "second"]
+    assert "second" in sheet
+
+    backend = SleepBackend(raw=True)
+    sound = sheet.play("second", backend=backend)
+    _, wav_format = backend.played[0]
+    assert wav_format.data_offset == 136 + 48000 * 4
+    assert wav_format.data_size == 12000 * 4
+    assert sound.duration == 0.25
+
+    with pytest.raises(PlaysoundException, match="no sprite"):
+        sheet.play("third", backend=backend)
+
+
+def test_invalid_manifest(tmp_path):
+    manifest = tmp_path / "sprites.json"
+    manifest.write_text(json.dumps({"resources": ["sounds.wav"]}))
+    with pytest.raises(PlaysoundException, match="invalid sprite manifest"):
+        SpriteSheet.from_manifest(manifest)
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from playsound3 import PcmStream, backends
+from playsound3.backends import PlaysoundException, RingBuffer
+
+
+def test_ring_buffer_wraps_around():
+    ring = RingBuffer(8)
+    assert ring.write(b"abcdef") == 6
+    assert ring.read(4) == b"abcd"
+    assert ring.write(b"ghijkl", block=False) == 6
+    assert ring.write(b"mn", block=False) == 0
+    assert ring.read(100) == b"efghijkl"
+    ring.end()
+    assert ring.read(1) == b""
+    assert ring.finished
+
+
+def test_ring_buffer_backpressure():
+    ring = RingBuffer(4)
+    written = []
+    producer = threading.Thread(target=lambda: written.append(ring.write(b"0123456789")))
+    producer.start()
+    time.sleep(0.1)
+    # The producer waits for space instead of growing the buffer
+    assert producer.is_alive() and len(ring) == 4
+    data = b""
+    while len(data) < 10:
+        data += ring.read(3)
+    producer.join(timeout=5)
+    assert data == b"0123456789" and written == [10]
+    assert ring.stats["stalls"] >= 2
+
+
+def test_ring_buffer_counts_underruns():
+    ring = RingBuffer(16)
+    assert ring.read(4, block=False) == b""
+    assert ring.stats["underruns"] == 0  # Nothing was written yet
+    ring.write(b"ab")
+    assert ring.read(4, block=False) == b"ab"
+    assert ring.read(4, block=False) == b""
+    assert ring.stats["underruns"] == 2
+    ring.end()
+    assert ring.read(4, block=False) == b""
+    assert ring.stats["underruns"] == 2
+
+
+def test_ring_buffer_close_stops_writers():
+    ring = RingBuffer(4)
+    written = []
+    producer = threading.Thread(target=lambda: written.append(ring.write(b"0123456789")))
+    producer.start()
+    time.sleep(0.05)
+    ring.close()
+    producer.join(timeout=5)
+    assert written == [4]
+    assert ring.read(4) == b""
+
+
+def tone_chunks(count, frames=480):
+    for i in range(count):
+        yield bytes([i % 256, 0]) * frames
+
+
+def test_stream_is_piped(pipe_backend):
+    stream = PcmStream(tone_chunks(100), sample_rate=48000, buffer_seconds=0.05)
+    stream.play(backend=pipe_backend)
+
+    piped = pipe_backend.output.read_bytes()
+    wav_format = backends.read_wav_format(piped)
+    assert (wav_format.channels, wav_format.sample_rate, wav_format.bits_per_sample) == (1, 48000, 16)
+    assert piped[wav_format.data_offset :] == b"".join(tone_chunks(100))
+    # 100 chunks of 10 ms went through a buffer of 50 ms
+    assert stream.stats["bytes"] == 100 * 960
+    assert stream._buffer.capacity == 2400 * 2
+
+
+def test_stopping_stops_the_producer(pipe_backend):
+    produced = []
+
+    def endless():
+        while True:
+            produced.append(1)
+            yield bytes(960)
+
+    stream = PcmStream(endless(), sample_rate=48000, buffer_seconds=0.01)
+    sound = stream.play(block=False, backend=pipe_backend)
+    time.sleep(0.1)
+    sound.stop()
+    assert sound.wait(timeout=5)
+    deadline = time.monotonic() + 5
+    while not stream._buffer.finished:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    count = len(produced)
+    time.sleep(0.1)
+    assert len(produced) == count
+
+
+def test_async_stream(pipe_backend):
+    async def chunks():
+        for chunk in tone_chunks(20):
+            await asyncio.sleep(0)
+            yield chunk
+
+    async def main():
+        stream = PcmStream(chunks(), sample_rate=48000, buffer_seconds=0.01)
+        with pytest.raises(PlaysoundException, match="block=True"):
+            stream.play(backend=pipe_backend)
+        await stream.play_async(backend=pipe_backend)
+        return stream
+
+    stream = asyncio.run(main())
+    assert stream.stats["bytes"] == 20 * 960
+    piped = pipe_backend.output.read_bytes()
+    assert piped[backends.read_wav_format(piped).data_offset :] == b"".join(tone_chunks(20))
+
+
+def test_async_stream_needs_event_loop():
+    async def chunks():
+        yield b""
+
+    with pytest.raises(PlaysoundException, match="event loop"):
+        PcmStream(chunks(), sample_rate=48000).play(block=False, backend="ffplay")
+
+
+def test_mixer_counts_underruns(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setenv("PLAYSOUND3_MIXER_SINK", "null")
+
+    def slow_chunks():
+        for chunk in tone_chunks(5, frames=240):
+            yield chunk
+            time.sleep(0.05)  # 5 ms of audio every 50 ms
+
+    stream = PcmStream(slow_chunks(), sample_rate=48000)
+    sound = stream.play(block=False, backend="mixer")
+    assert sound.wait(timeout=5)
+    assert stream.stats["bytes"] == 5 * 480
+    assert stream.stats["underruns"] > 0
@@ -0,0 +1,80 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from playsound3 import playsound, playsound3
+from playsound3.cache import DiskCache
+from playsound3.playsound3 import PlaysoundException, SoundBackend
+
+wav = "tests/sounds/звук 音 聲音.wav"
+flac = "tests/sounds/sample3s.flac"
+
+
+class WavOnlyBackend(SoundBackend):
+    """Backend that only plays .wav files and records the files it played."""
+
+    formats = (".wav",)
+
+    def __init__(self):
+        self.played = []
+
+    def check(self):
+        return True
+
+    def play(self, sound):
+        self.played.append(sound)
+        return subprocess.Popen([sys.executable, "-c", "pass"])
+
+
+@pytest.fixture
+def pcm_cache(tmp_path, monkeypatch):
+    pcm_cache = DiskCache(tmp_path / "pcm", max_bytes=10**9)
+    monkeypatch.setattr(playsound3, "_PCM_CACHE", pcm_cache)
+    monkeypatch.setattr(playsound3, "_CONTENT_HASHES", {})
+    return pcm_cache
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path, monkeypatch):
+    """Fake ffmpeg that outputs a WAV file and counts how many times it was called."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    calls = tmp_path / "ffmpeg-calls"
+    code = f"import shutil, sys; open({str(calls)!r}, 'a').write('x'); "
+    code += f"shutil.copyfileobj(open({os.path.abspath(wav)!r}, 'rb'), sys.stdout.buffer)"
+    (bin_dir / "ffmpeg").write_text(f"#!{sys.executable}\n{code}\n")
+    (bin_dir / "ffmpeg").chmod(0o755)
+    monkeypatch.setenv("PATH", str(bin_dir) + os.pathsep + os.environ["PATH"])
+    return lambda: len(calls.read_text()) if calls.exists() else 0
+
+
+@pytest.mark.skipif(os.name != "posix", reason="fake ffmpeg is a script")
+def test_transcode_once(pcm_cache, fake_ffmpeg, tmp_path):
+    backend = WavOnlyBackend()
+    playsound(flac, backend=backend)
+    playsound(flac, backend=backend)
+    assert fake_ffmpeg() == 1
+    assert backend.played[0] == backend.played[1]
+    assert backend.played[0].endswith(".wav")
+    assert os.path.dirname(backend.played[0]) == str(pcm_cache.directory)
+
+    # Files with the same content share the transcoded copy
+    shutil.copy(flac, tmp_path / "copy.flac")
+    playsound(tmp_path / "copy.flac", backend=backend)
+    assert fake_ffmpeg() == 1
+    assert backend.played[2] == backend.played[0]
+
+
+def test_native_formats_are_not_transcoded(pcm_cache):
+    backend = WavOnlyBackend()
+    playsound(wav, backend=backend)
+    assert backend.played == [os.path.abspath(wav).replace(os.sep, "/")]
+
+
+def test_missing_ffmpeg(pcm_cache, monkeypatch):
+    monkeypatch.setattr(playsound3.shutil, "which", lambda name: None)
+    with pytest.raises(PlaysoundException, match="ffmpeg"):
+        playsound(flac, backend=WavOnlyBackend())
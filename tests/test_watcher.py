@@ -0,0 +1,71 @@
+import subprocess
+import sys
+import threading
+import time
+
+from playsound3 import playsound, wait_all, wait_any
+from playsound3.playsound3 import SoundBackend
+from playsound3.watcher import Watcher
+
+wav = "tests/sounds/звук 音 聲音.wav"
+
+
+class SleepBackend(SoundBackend):
+    """Backend with a player process that sleeps instead of playing."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    def check(self):
+        return True
+
+    def play(self, sound):
+        return subprocess.Popen([sys.executable, "-c", f"import time; time.sleep({self.seconds})"])
+
+
+class PolledPopen:
+    """Popen-like object without callbacks, finishing after some time."""
+
+    def __init__(self, seconds):
+        self.end = time.monotonic() + seconds
+
+    def poll(self):
+        return 0 if time.monotonic() >= self.end else None
+
+
+def test_wait_timeout():
+    sound = playsound(wav, block=False, backend=SleepBackend(0.5))
+    assert not sound.wait(timeout=0.05)
+    assert sound.is_alive()
+    assert sound.wait(timeout=5)
+    assert not sound.is_alive()
+
+
+def test_on_finish():
+    finished = []
+    sound = playsound(wav, block=False, backend=SleepBackend(0.2))
+    sound.on_finish(finished.append)
+    sound.wait()
+    assert sound.wait(timeout=5)
+    assert finished == [sound]
+
+    # Callbacks added after the sound finished are called immediately
+    sound.on_finish(finished.append)
+    assert finished == [sound, sound]
+
+
+def test_wait_any_and_all():
+    slow = playsound(wav, block=False, backend=SleepBackend(1.0))
+    fast = playsound(wav, block=False, backend=SleepBackend(0.1))
+
+    assert wait_any([slow, fast], timeout=5) is fast
+    assert not wait_all([slow, fast], timeout=0.05)
+    assert wait_all([slow, fast], timeout=5)
+    assert wait_all([])
+
+
+def test_polled_processes():
+    watcher = Watcher()
+    finished = threading.Event()
+    watcher.watch(PolledPopen(0.1), finished.set)
+    assert finished.wait(timeout=5)